@@ -0,0 +1,115 @@
+"""
+Run the benchmark suite.
+
+    python -m benchmarks                       run everything, print results
+    python -m benchmarks -k parse_all          run benchmarks whose name matches
+    python -m benchmarks -o results.json       also save results as JSON
+    python -m benchmarks --compare base.json   compare against saved results,
+                                               exiting with 1 on a regression
+    python -m benchmarks --list                list benchmark names
+
+A typical regression check saves a baseline on the old version,
+then runs the new version against it:
+
+    git checkout main && python -m benchmarks -o baseline.json
+    git checkout my-branch && python -m benchmarks --compare baseline.json
+"""
+import argparse
+import sys
+
+# importing the benchmark modules registers their benchmarks
+from . import (  # noqa: F401
+    bench_cli,
+    bench_datemath,
+    bench_documents,
+    bench_files,
+    bench_memory,
+    bench_overlaps,
+    bench_parse,
+    bench_scanner,
+    bench_startup,
+)
+from .harness import (
+    compare,
+    load_results,
+    print_comparisons,
+    results_to_json,
+    run_all,
+    save_results,
+    select,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    arg_parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        help="only run benchmarks whose name contains this (repeatable)",
+    )
+    arg_parser.add_argument("-o", "--output", help="save results as JSON to this file")
+    arg_parser.add_argument("--compare", help="compare against results saved earlier")
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown counted as a regression (default: 0.1)",
+    )
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="minimum seconds per timed repeat (default: 0.2)",
+    )
+    arg_parser.add_argument(
+        "--quick", action="store_true", help="fewer and shorter repeats"
+    )
+    arg_parser.add_argument("--list", action="store_true", help="list benchmarks")
+    args = arg_parser.parse_args(argv)
+
+    benchmarks = select(args.patterns)
+
+    if args.list:
+        for bench in benchmarks:
+            print(f"{bench.name:<45} {bench.description}")
+        return 0
+
+    if not benchmarks:
+        print("No benchmarks match", file=sys.stderr)
+        return 2
+
+    repeat, min_time = args.repeat, args.min_time
+    if args.quick:
+        repeat, min_time = 3, 0.05
+
+    results = run_all(benchmarks, repeat=repeat, min_time=min_time)
+
+    if args.output:
+        save_results(results, args.output)
+
+    if args.compare is None:
+        return 0
+
+    baseline = load_results(args.compare)
+    current = results_to_json(results)
+
+    # benchmarks left out by -k are not compared
+    selected = {bench.name for bench in benchmarks}
+    baseline["benchmarks"] = {
+        name: timings
+        for name, timings in baseline["benchmarks"].items()
+        if name in selected
+    }
+
+    print(f"\nCompared with {args.compare}:")
+    comparisons = compare(baseline, current, threshold=args.threshold)
+    print_comparisons(comparisons)
+
+    regressions = [comp for comp in comparisons if comp.status == "regression"]
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
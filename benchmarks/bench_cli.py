@@ -0,0 +1,43 @@
+"""
+Benchmarks for the dateparse command, run in this process.
+
+The input is the batch of parse_many/1000x60, one text per line,
+so the difference from that benchmark is mostly the cost of reading and writing.
+"""
+import atexit
+import os
+import tempfile
+
+from dateparse.cli import main
+
+from .corpus import make_texts
+from .harness import benchmark
+
+
+def _input_file() -> str:
+    file_descriptor, path = tempfile.mkstemp(suffix=".log")
+    atexit.register(os.remove, path)
+
+    lines = [text.replace("\n", " ") for text in make_texts(1000)]
+    with os.fdopen(file_descriptor, "w") as input_file:
+        input_file.write("\n".join(lines))
+
+    return path
+
+
+def _run_cli(output_format: str):
+    path = _input_file()
+    argv = [path, "--base-date", "2023-01-17", "--format", output_format]
+    return lambda: main([*argv, "-o", os.devnull])
+
+
+@benchmark("cli/jsonl/1000x60")
+def bench_cli_jsonl():
+    """A thousand short lines, written as JSON lines"""
+    return _run_cli("jsonl")
+
+
+@benchmark("cli/csv/1000x60")
+def bench_cli_csv():
+    """A thousand short lines, written as CSV"""
+    return _run_cli("csv")
@@ -0,0 +1,93 @@
+"""
+Benchmarks for month and year offsets, and the calendar tables.
+
+Compares the closed-form helpers in dateparse.datemath against
+the previous approach of materializing every month up to datetime.MAXYEAR,
+and the table lookups against the arithmetic they replaced.
+"""
+import datetime
+from calendar import monthrange
+
+from dateparse import datemath
+from dateparse.parsefunctions import _month_delta, _year_delta
+
+from .harness import benchmark
+
+BASE_DATE = datetime.date(2022, 12, 17)
+
+
+def _legacy_months_iter(start_date: datetime.date, backward: bool = False):
+    step = -1 if backward else 1
+    month_range_start = 12 if backward else 1
+    month_range_end = 0 if backward else 13
+
+    for month in range(start_date.month, month_range_end, step):
+        yield monthrange(start_date.year, month)[1]
+
+    year = start_date.year + step
+    while datetime.MINYEAR < year < datetime.MAXYEAR:
+        for month in range(month_range_start, month_range_end, step):
+            yield monthrange(year, month)[1]
+        year += step
+
+
+def _legacy_month_delta(
+    input_date: datetime.date, months_count: int, backward: bool = False
+):
+    total_days = sum(list(_legacy_months_iter(input_date, backward))[:months_count])
+    return datetime.timedelta(days=-total_days if backward else total_days)
+
+
+@benchmark("datemath/month_delta/+3")
+def bench_month_delta_forward():
+    return lambda: _month_delta(BASE_DATE, 3)
+
+
+@benchmark("datemath/month_delta/-3")
+def bench_month_delta_backward():
+    return lambda: _month_delta(BASE_DATE, 3, True)
+
+
+@benchmark("datemath/month_delta/+1200")
+def bench_month_delta_far():
+    return lambda: _month_delta(BASE_DATE, 1200)
+
+
+@benchmark("datemath/year_delta/+10")
+def bench_year_delta():
+    return lambda: _year_delta(BASE_DATE, 10)
+
+
+@benchmark("datemath/legacy_month_delta/+3")
+def bench_legacy_month_delta():
+    """The month iteration _month_delta used to do, for reference"""
+    return lambda: _legacy_month_delta(BASE_DATE, 3)
+
+
+def _legacy_month_start_ordinal(year: int, month: int) -> int:
+    year, month = datemath.shift_month(year, month, 0)
+    return datemath.days_before_year(year) + datemath.days_before_month(year, month) + 1
+
+
+@benchmark("datemath/month_start_ordinal")
+def bench_month_start_ordinal():
+    """The first day of every month of a year, from the calendar tables"""
+    return lambda: [datemath.month_start_ordinal(2023, month) for month in range(1, 13)]
+
+
+@benchmark("datemath/legacy_month_start_ordinal")
+def bench_legacy_month_start_ordinal():
+    """The same, computed as before the calendar tables, for reference"""
+    return lambda: [_legacy_month_start_ordinal(2023, month) for month in range(1, 13)]
+
+
+@benchmark("datemath/nth_weekday")
+def bench_nth_weekday():
+    """The third Monday of every month of a year"""
+    return lambda: [datemath.nth_weekday(2023, month, 1, 3) for month in range(1, 13)]
+
+
+@benchmark("datemath/calendar_tables/build")
+def bench_build_calendar_tables():
+    """Making the calendar tables, as importing datemath does"""
+    return datemath._build_calendar_tables
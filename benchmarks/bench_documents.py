@@ -0,0 +1,51 @@
+"""
+Benchmarks for editing a DateDocument, against parsing the edited text again.
+
+Each edit types an expression into the middle of the text and deletes it,
+so the time is for two edits, and should not grow with the text.
+"""
+import datetime
+
+from dateparse import LRUCache
+from dateparse.documents import DateDocument
+from dateparse.parseutil import parse_all
+
+from .corpus import PLAIN_WORDS, make_text
+from .harness import benchmark
+
+BASE_DATE = datetime.date(2023, 1, 17)
+
+TEXT_SIZES = {"64k": 64_000, "1m": 1_000_000}
+DENSITY = 0.05
+
+TYPED = "next friday "
+
+
+def _register(size_name: str, size: int):
+    @benchmark(
+        f"document/edit/{size_name}",
+        f"Typing and deleting an expression in {size} characters of notes",
+    )
+    def bench_document_edit():
+        text = make_text(size, DENSITY, seed=size, filler=PLAIN_WORDS)
+        document = DateDocument(BASE_DATE, text)
+        cursor = text.index(" ", size // 2)
+
+        def edit_twice():
+            document.edit(cursor, 0, TYPED)
+            return document.edit(cursor, len(TYPED))
+
+        return edit_twice
+
+    @benchmark(
+        f"document/reparse/{size_name}",
+        "All dates in the same text, parsed again by parse_all",
+    )
+    def bench_document_reparse():
+        text = make_text(size, DENSITY, seed=size, filler=PLAIN_WORDS)
+        no_cache = {"cache": LRUCache(maxsize=0), "group_cache": LRUCache(maxsize=0)}
+        return lambda: parse_all(BASE_DATE, text, **no_cache)
+
+
+for _size_name, _size in TEXT_SIZES.items():
+    _register(_size_name, _size)
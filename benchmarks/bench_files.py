@@ -0,0 +1,59 @@
+"""
+Benchmarks for parse_file, against iter_dates reading the same file.
+
+In the sparse file, a few lines in a thousand hold a date, and parse_file
+decodes little else. In the dense file, most lines hold one, so both
+decode and scan all of it.
+"""
+import atexit
+import datetime
+import os
+import tempfile
+
+from dateparse.files import parse_file
+from dateparse.streaming import iter_dates
+
+from .corpus import PLAIN_WORDS, make_text
+from .harness import benchmark
+
+BASE_DATE = datetime.date(2023, 1, 17)
+
+FILE_SIZE = 1_000_000
+DENSITIES = {"sparse": 0.0005, "dense": 0.3}
+
+
+def _text_file(density: float) -> str:
+    file_descriptor, path = tempfile.mkstemp(suffix=".log")
+    atexit.register(os.remove, path)
+
+    with os.fdopen(file_descriptor, "w", encoding="utf-8") as text_file:
+        text_file.write(make_text(FILE_SIZE, density, seed=7, filler=PLAIN_WORDS))
+
+    return path
+
+
+def _iter_file_dates(path: str) -> list:
+    with open(path, encoding="utf-8") as text_file:
+        return list(iter_dates(BASE_DATE, text_file))
+
+
+def _register(density_name: str, density: float):
+    @benchmark(
+        f"parse_file/1m/{density_name}",
+        f"All dates in a {FILE_SIZE} byte file at density {density}",
+    )
+    def bench_parse_file():
+        path = _text_file(density)
+        return lambda: list(parse_file(BASE_DATE, path))
+
+    @benchmark(
+        f"iter_dates/file/1m/{density_name}",
+        "All dates in the same file, streamed by iter_dates",
+    )
+    def bench_iter_dates_file():
+        path = _text_file(density)
+        return lambda: _iter_file_dates(path)
+
+
+for _density_name, _density in DENSITIES.items():
+    _register(_density_name, _density)
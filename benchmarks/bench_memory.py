@@ -0,0 +1,78 @@
+"""
+Memory benchmarks: the bytes held per parse result and per match record.
+
+Match records are what the expression cache holds for every cached text,
+so their size bounds how many texts a cache of a given size can hold.
+"""
+import datetime
+
+from dateparse import LRUCache
+from dateparse.parseutil import _get_default_engine, parse_all, parse_many
+
+from .corpus import make_text, make_texts
+from .harness import memory_benchmark
+
+BASE_DATE = datetime.date(2023, 1, 17)
+
+
+@memory_benchmark("memory/parse_all/results")
+def bench_result_memory():
+    """Bytes per DateResult from parse_all, with its date and content"""
+    text = make_text(64_000, 0.3, seed=5)
+    no_cache = {"cache": LRUCache(maxsize=0), "group_cache": LRUCache(maxsize=0)}
+    return lambda: parse_all(BASE_DATE, text, **no_cache)
+
+
+@memory_benchmark("memory/parse_many/results")
+def bench_batch_result_memory():
+    """Bytes per DateResult from parse_many over a thousand short texts"""
+    texts = make_texts(1000, seed=5)
+
+    def parse_batch():
+        results = parse_many(BASE_DATE, texts)
+        # the per-text lists are measured along with the results in them
+        result_count = sum(len(text_results or ()) for text_results in results)
+        return _Measured(results, result_count)
+
+    return parse_batch
+
+
+@memory_benchmark("memory/parse_many/columns")
+def bench_column_memory():
+    """Bytes per row of DateColumns from parse_many over a thousand short texts"""
+    texts = make_texts(1000, seed=5)
+
+    def parse_batch():
+        columns = parse_many(BASE_DATE, texts, output="columns")
+        return _Measured(columns, len(columns.date))
+
+    return parse_batch
+
+
+@memory_benchmark("memory/expressions/records")
+def bench_match_record_memory():
+    """Bytes per match record in the expressions held by the expression cache"""
+    text = make_text(64_000, 0.3, seed=5)
+
+    def preprocess():
+        expressions = tuple(_get_default_engine().preprocess(text))
+        records = [
+            record
+            for expression in expressions
+            for record in (expression.anchor, *expression.deltas)
+        ]
+        # the expressions are measured, but items are the records in them
+        return _Measured(expressions, len(records))
+
+    return preprocess
+
+
+class _Measured:
+    """Holds a measured object, with the number of items it counts as"""
+
+    def __init__(self, value: object, items: int):
+        self.value = value
+        self.items = items
+
+    def __len__(self) -> int:
+        return self.items
@@ -0,0 +1,86 @@
+"""
+Benchmarks for resolving overlapping matches.
+
+Times sorting and containment removal alone, on synthetic matches,
+at sizes a factor of ten apart, so the scaling with match count can be
+read off directly: per-match times should stay flat as counts grow.
+"""
+import datetime
+import random
+
+from dateparse import LRUCache
+from dateparse.parsefunctions import DateTuple
+from dateparse.parseutil import _ordered_matches, _remove_subgroups, parse_all
+
+from .corpus import make_text
+from .harness import benchmark
+
+MATCH_COUNTS = (1_000, 10_000, 100_000)
+LEGACY_MATCH_COUNTS = (1_000, 10_000)
+
+
+def make_matches(count: int, seed: int = 0) -> list[DateTuple]:
+    """
+    Generate matches shaped like a dense schedule: one expression every
+    few characters, many of them nested in or overlapping another.
+    Matches are in order of start, as the scanner produces them,
+    but with the order of those sharing a start shuffled.
+    """
+    rng = random.Random(seed)
+    matches = []
+    position = 0
+
+    for _ in range(count):
+        position += rng.randint(1, 12)
+        length = rng.randint(4, 30)
+        matches.append(DateTuple(None, {}, "", position, position + length))
+
+    rng.shuffle(matches)
+    matches.sort(key=lambda match: match.start)
+    return matches
+
+
+def _legacy_resolve(dates: list[DateTuple]) -> list[DateTuple]:
+    # the previous double sort, and removal by neighbour comparison
+    dates = sorted(sorted(dates, key=lambda d: d.start), key=lambda d: d.end)
+
+    iter_by_three = zip(dates[:-1], dates[1:-1], dates[2:])
+    for first, second, third in iter_by_three:
+        within_prior = second.start >= first.start and second.end <= first.end
+        within_next = second.start >= third.start and second.end <= third.end
+
+        if within_prior or within_next:
+            dates.remove(second)
+
+    return dates
+
+
+def _register_resolution(count: int):
+    @benchmark(f"overlaps/resolve/{count}", f"Sorting and resolving {count} matches")
+    def bench_resolve():
+        matches = make_matches(count)
+        return lambda: _remove_subgroups(_ordered_matches(matches))
+
+    # the previous resolution is quadratic, so it is only timed on fewer matches
+    if count not in LEGACY_MATCH_COUNTS:
+        return
+
+    @benchmark(
+        f"overlaps/legacy_resolve/{count}",
+        f"The previous resolution, on {count} matches",
+    )
+    def bench_legacy_resolve():
+        matches = make_matches(count)
+        return lambda: _legacy_resolve(matches)
+
+
+for _count in MATCH_COUNTS:
+    _register_resolution(_count)
+
+
+@benchmark("overlaps/parse_all/calendar")
+def bench_calendar():
+    """A schedule of 16k characters, mostly dates"""
+    text = make_text(16_000, density=0.8, seed=7)
+    no_cache = {"cache": LRUCache(maxsize=0), "group_cache": LRUCache(maxsize=0)}
+    return lambda: parse_all(datetime.date(2023, 1, 17), text, **no_cache)
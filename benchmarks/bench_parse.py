@@ -0,0 +1,213 @@
+"""
+Benchmarks for the parse functions and DateParser.
+
+The result caches are disabled for every benchmark,
+so repeated calls measure parsing and not cache lookups.
+"""
+import datetime
+
+from dateparse import DateParser, LRUCache, NamedDayMatcher, ParseStats
+from dateparse.bulk import resolve_many
+from dateparse.parseutil import basic_parse, parse_all, parse_many, sub_named_days
+from dateparse.plans import ParsePlan
+
+from .corpus import NAMED_DAY_EXPRESSIONS, PLAIN_WORDS, make_text, make_texts
+from .harness import benchmark
+
+BASE_DATE = datetime.date(2023, 1, 17)
+
+TEXT_SIZES = {"1k": 1_000, "64k": 64_000}
+DENSITIES = {"sparse": 0.02, "dense": 0.3}
+
+
+def _no_cache() -> dict:
+    return {"cache": LRUCache(maxsize=0), "group_cache": LRUCache(maxsize=0)}
+
+
+def _uncached_parser(**kwargs) -> DateParser:
+    return DateParser(base_date=BASE_DATE, **kwargs, **_no_cache())
+
+
+@benchmark("basic_parse/short")
+def bench_basic_parse_short():
+    """The first date in a short sentence"""
+    text = "four days before march 11, and a week from thursday"
+    no_cache = _no_cache()
+    return lambda: basic_parse(BASE_DATE, text, **no_cache)
+
+
+@benchmark("basic_parse/from_right")
+def bench_basic_parse_from_right():
+    """The last date in a short sentence"""
+    text = "four days before march 11, and a week from thursday"
+    no_cache = _no_cache()
+    return lambda: basic_parse(BASE_DATE, text, from_right=True, **no_cache)
+
+
+def _register_parse_all(size_name: str, size: int, density_name: str, density: float):
+    text = make_text(size, density, seed=size)
+
+    @benchmark(
+        f"parse_all/{size_name}/{density_name}",
+        f"All dates in {size} characters at density {density}",
+    )
+    def bench_parse_all():
+        no_cache = _no_cache()
+        return lambda: parse_all(BASE_DATE, text, **no_cache)
+
+
+for _size_name, _size in TEXT_SIZES.items():
+    for _density_name, _density in DENSITIES.items():
+        _register_parse_all(_size_name, _size, _density_name, _density)
+
+
+@benchmark("parse_all/64k/no_dates")
+def bench_parse_all_no_dates():
+    """Long text with no dates, where every near miss must be rejected"""
+    text = make_text(64_000, density=0)
+    no_cache = _no_cache()
+    return lambda: parse_all(BASE_DATE, text, **no_cache)
+
+
+@benchmark("parse_all/cached")
+def bench_parse_all_cached():
+    """A repeated parse answered by the result cache"""
+    text = make_text(1_000, 0.3)
+    cache = LRUCache()
+    return lambda: parse_all(BASE_DATE, text, cache=cache)
+
+
+@benchmark("parse_all/1k/dense/profiled")
+def bench_parse_all_profiled():
+    """parse_all/1k/dense, with its stages timed by a ParseStats"""
+    text = make_text(1_000, 0.3, seed=1_000)
+    no_cache = _no_cache()
+    stats = ParseStats()
+
+    def parse_profiled():
+        with stats:
+            parse_all(BASE_DATE, text, **no_cache)
+
+    return parse_profiled
+
+
+@benchmark("parse_many/1000x60")
+def bench_parse_many():
+    """A batch of a thousand short texts"""
+    texts = make_texts(1000)
+    return lambda: parse_many(BASE_DATE, texts)
+
+
+@benchmark("parse_many/1000x60/columns")
+def bench_parse_many_columns():
+    """The same batch, as DateColumns"""
+    texts = make_texts(1000)
+    return lambda: parse_many(BASE_DATE, texts, output="columns")
+
+
+@benchmark("parse_many/1000x60/mostly_no_dates")
+def bench_parse_many_mostly_no_dates():
+    """A batch of a thousand chat-like texts, about one in ten with a date"""
+    texts = make_texts(1000, density=0.01, filler=PLAIN_WORDS)
+    return lambda: parse_many(BASE_DATE, texts)
+
+
+@benchmark("plan/get_first")
+def bench_plan_get_first():
+    """The first date in a short sentence, from a plan compiled beforehand"""
+    plan = ParsePlan.from_text("four days before march 11, and a week from thursday")
+    return lambda: plan.get_first(BASE_DATE)
+
+
+@benchmark("plan/compile")
+def bench_plan_compile():
+    """Compiling the plan for a short sentence"""
+    text = "four days before march 11, and a week from thursday"
+    return lambda: ParsePlan.from_text(text)
+
+
+# a local date for each of ten thousand users, over about three years
+MANY_BASE_DATES = [BASE_DATE + datetime.timedelta(days=i % 1000) for i in range(10_000)]
+
+
+@benchmark("resolve_many/10000/a_month_after_next_friday")
+def bench_resolve_many():
+    """One expression against ten thousand base dates"""
+    return lambda: resolve_many(MANY_BASE_DATES, "a month after next friday")
+
+
+@benchmark("resolve_many/10000/third_monday_in_may")
+def bench_resolve_many_per_date():
+    """An expression resolved one base date at a time, against ten thousand"""
+    return lambda: resolve_many(MANY_BASE_DATES, "the third monday in may")
+
+
+@benchmark("basic_parse/10000_base_dates")
+def bench_basic_parse_many_base_dates():
+    """The same, a call for each base date, with the text only scanned once"""
+    text = "a month after next friday"
+    no_result_cache = LRUCache(maxsize=0)
+    return lambda: [
+        basic_parse(base_date, text, cache=no_result_cache)
+        for base_date in MANY_BASE_DATES
+    ]
+
+
+@benchmark("parse_all/64k/plain")
+def bench_parse_all_plain():
+    """Long text with no dates and no near misses, which the prefilter rejects"""
+    text = make_text(64_000, density=0, filler=PLAIN_WORDS)
+    no_cache = _no_cache()
+    return lambda: parse_all(BASE_DATE, text, **no_cache)
+
+
+@benchmark("DateParser/get_first")
+def bench_parser_get_first():
+    """The first date in a short sentence, through a DateParser"""
+    parser = _uncached_parser()
+    text = "lunch two months after friday, then dinner on monday"
+    return lambda: parser.get_first(text)
+
+
+@benchmark("DateParser/get_last_date")
+def bench_parser_get_last_date():
+    """The last date in a short sentence, through a DateParser"""
+    parser = _uncached_parser()
+    text = "lunch two months after friday, then dinner on monday"
+    return lambda: parser.get_last_date(text)
+
+
+@benchmark("DateParser/get_all/1k")
+def bench_parser_get_all():
+    """All dates in 1k characters of default named days"""
+    parser = _uncached_parser()
+    text = make_text(1_000, 0.3, expressions=NAMED_DAY_EXPRESSIONS)
+    return lambda: parser.get_all(text)
+
+
+@benchmark("DateParser/get_all_dates/1k")
+def bench_parser_get_all_dates():
+    """All dates in 1k characters, as bare dates"""
+    parser = _uncached_parser()
+    text = make_text(1_000, 0.3)
+    return lambda: parser.get_all_dates(text)
+
+
+def _many_named_days(count: int) -> dict[str, str]:
+    return {f"launch {index}": f"march {index % 28 + 1}" for index in range(count)}
+
+
+@benchmark("named_days/sub/5000")
+def bench_sub_named_days():
+    """Substituting 5000 named days into 64k characters"""
+    matcher = NamedDayMatcher(_many_named_days(5000))
+    text = make_text(64_000, 0.1, expressions=("launch 42", "launch 4999"))
+    return lambda: sub_named_days(matcher, text)
+
+
+@benchmark("named_days/get_all/5000")
+def bench_named_days_get_all():
+    """Parsing 1k characters with 5000 named days"""
+    parser = _uncached_parser(named_days=_many_named_days(5000))
+    text = make_text(1_000, 0.1, expressions=("launch 42", "a week after launch 7"))
+    return lambda: parser.get_all(text)
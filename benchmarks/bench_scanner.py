@@ -0,0 +1,51 @@
+"""
+Benchmarks for finding the matches of every date pattern in a text.
+
+Times PatternScanner.finditer over the default grammar's patterns alone,
+without grouping or resolving, against each pattern's own re.finditer
+over the text as given, which yields the same matches.
+"""
+import itertools as it
+
+from dateparse.parseutil import _get_engine, _get_scanner
+
+from .corpus import make_text
+from .harness import benchmark
+
+TEXT_SIZE = 64_000
+DENSITIES = {"dense": 0.3, "sparse": 0.02, "no_dates": 0}
+
+
+def _default_patterns() -> tuple:
+    engine = _get_engine(None)
+    return tuple(it.chain(engine.absolute_index.keys(), engine.relative_index.keys()))
+
+
+def _each_pattern_finditer(patterns: tuple, text: str) -> list:
+    # every match of one pattern, then the next, ordered as the scanner orders them
+    matches = it.chain.from_iterable(pattern.finditer(text) for pattern in patterns)
+    return sorted(matches, key=lambda match: match.start())
+
+
+def _register(density_name: str, density: float):
+    text = make_text(TEXT_SIZE, density, seed=TEXT_SIZE)
+
+    @benchmark(
+        f"scanner/64k/{density_name}",
+        f"The matches of every pattern in {TEXT_SIZE} characters at density {density}",
+    )
+    def bench_scanner():
+        scanner = _get_scanner(_default_patterns())
+        return lambda: list(scanner.finditer(text))
+
+    @benchmark(
+        f"scanner/each_pattern/64k/{density_name}",
+        "The same matches, from each pattern's re.finditer, for reference",
+    )
+    def bench_each_pattern():
+        patterns = _default_patterns()
+        return lambda: _each_pattern_finditer(patterns, text)
+
+
+for _density_name, _density in DENSITIES.items():
+    _register(_density_name, _density)
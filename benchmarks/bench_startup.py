@@ -0,0 +1,51 @@
+"""
+Startup benchmarks: the time for a new interpreter to import dateparse,
+and to parse a first date, for command line tools and serverless handlers.
+
+Each call starts a Python process, so these times include starting
+the interpreter, which startup/python measures on its own.
+"""
+import os
+import subprocess
+import sys
+
+from .harness import benchmark
+
+# the directory containing the dateparse package being benchmarked
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_PARSE = (
+    "import datetime, dateparse;"
+    " dateparse.basic_parse(datetime.date(2023, 1, 17), 'a week from friday')"
+)
+
+
+def _run_python(code: str):
+    def run():
+        subprocess.run([sys.executable, "-c", code], cwd=_PACKAGE_ROOT, check=True)
+
+    return run
+
+
+@benchmark("startup/python")
+def bench_python_startup():
+    """Starting the interpreter, for reference"""
+    return _run_python("pass")
+
+
+@benchmark("startup/import")
+def bench_import():
+    """Starting the interpreter and importing dateparse"""
+    return _run_python("import dateparse")
+
+
+@benchmark("startup/import_parse_all")
+def bench_import_function():
+    """Starting the interpreter and importing parse_all"""
+    return _run_python("from dateparse import parse_all")
+
+
+@benchmark("startup/first_parse")
+def bench_first_parse():
+    """Starting the interpreter, importing dateparse and parsing one date"""
+    return _run_python(FIRST_PARSE)
@@ -0,0 +1,145 @@
+"""
+Deterministic text corpora for benchmarks.
+
+Every corpus is generated from a fixed seed, so the same arguments
+always produce the same text, on any machine and Python version.
+"""
+import random
+
+# expressions the parser recognizes, in the forms users write them
+DATE_EXPRESSIONS = (
+    "today",
+    "tomorrow",
+    "yesterday",
+    "next friday",
+    "on monday",
+    "a week from thursday",
+    "two months after friday",
+    "four days before march 11",
+    "in ten days",
+    "a week before friday",
+    "january 1",
+    "december 25, 2024",
+    "10-20-2023",
+    "4/5/2023",
+    "a month from today",
+    "the day after tomorrow",
+)
+
+NAMED_DAY_EXPRESSIONS = (
+    "christmas",
+    "halloween",
+    "a week after christmas",
+    "four days before halloween 2024",
+    "christmas, 2024",
+)
+
+# words chosen to share prefixes with the parser's vocabulary
+FILLER_WORDS = (
+    "the",
+    "quick",
+    "brown",
+    "fox",
+    "jumps",
+    "over",
+    "lazy",
+    "dog",
+    "and",
+    "then",
+    "meeting",
+    "daily",
+    "weekly",
+    "monthly",
+    "notes",
+    "dayton",
+    "mondays",
+    "yearbook",
+    "fridge",
+    "sunny",
+    "report",
+    "from",
+    "after",
+    "before",
+)
+
+# words sharing nothing with the parser's vocabulary, as in most chat messages
+PLAIN_WORDS = (
+    "hey",
+    "can",
+    "you",
+    "look",
+    "at",
+    "this",
+    "ticket",
+    "please",
+    "thanks",
+    "i",
+    "think",
+    "the",
+    "build",
+    "is",
+    "broken",
+    "again",
+    "sure",
+    "will",
+    "check",
+    "ok",
+)
+
+
+def make_text(
+    size: int,
+    density: float = 0.1,
+    seed: int = 0,
+    expressions: tuple[str, ...] = DATE_EXPRESSIONS,
+    line_length: int = 80,
+    filler: tuple[str, ...] = FILLER_WORDS,
+) -> str:
+    """
+    Generate about size characters of text, split into lines.
+
+    density is the fraction of phrases that are date expressions,
+    the rest being filler words. A density of 0 produces text with no dates.
+    """
+    rng = random.Random(seed)
+
+    lines = []
+    line: list[str] = []
+    line_chars = 0
+    total_chars = 0
+
+    while total_chars < size:
+        if density > 0 and rng.random() < density:
+            phrase = rng.choice(expressions)
+        else:
+            phrase = rng.choice(filler)
+
+        line.append(phrase)
+        line_chars += len(phrase) + 1
+        total_chars += len(phrase) + 1
+
+        if line_chars >= line_length:
+            lines.append(" ".join(line))
+            line = []
+            line_chars = 0
+
+    if line:
+        lines.append(" ".join(line))
+
+    return "\n".join(lines)[:size]
+
+
+def make_texts(
+    count: int,
+    length: int = 60,
+    density: float = 0.2,
+    seed: int = 0,
+    expressions: tuple[str, ...] = DATE_EXPRESSIONS,
+    filler: tuple[str, ...] = FILLER_WORDS,
+) -> list[str]:
+    """Generate count short texts, each of about length characters"""
+    rng = random.Random(seed)
+    return [
+        make_text(length, density, rng.randrange(2**32), expressions, length, filler)
+        for _ in range(count)
+    ]
@@ -0,0 +1,355 @@
+"""
+A small benchmark runner with machine-readable results.
+
+Benchmarks are registered with the benchmark decorator. Each one is a setup
+function that prepares its inputs and returns the callable to time,
+so that setup is never part of the measurement.
+
+Memory benchmarks, registered with memory_benchmark, instead measure
+the memory held by the items their callable returns, such as parse results.
+
+Results are saved as JSON, and can be compared against a saved baseline.
+"""
+import datetime
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Callable, NamedTuple, Sized
+
+RESULTS_FORMAT_VERSION = 1
+
+
+TIME = "time"
+MEMORY = "memory"
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    description: str
+    kind: str = TIME
+
+
+class BenchmarkResult(NamedTuple):
+    """Timings for one benchmark, in seconds per call"""
+
+    name: str
+    number: int
+    repeat: int
+    best: float
+    median: float
+    mean: float
+    stdev: float
+
+
+class MemoryResult(NamedTuple):
+    """Memory held by the items returned by one call of a memory benchmark"""
+
+    name: str
+    items: int
+    total_bytes: int
+    bytes_per_item: float
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+    status: str
+    unit: str = "s"
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, description: str | None = None, kind: str = TIME):
+    """
+    Register the decorated setup function as a benchmark.
+    The description defaults to the setup function's docstring.
+    """
+
+    def register(setup: Callable[[], Callable[[], object]]):
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark name '{name}'")
+
+        BENCHMARKS[name] = Benchmark(
+            name, setup, description or (setup.__doc__ or "").strip(), kind
+        )
+        return setup
+
+    return register
+
+
+def memory_benchmark(name: str, description: str | None = None):
+    """
+    Register the decorated setup function as a memory benchmark.
+    The function it returns must return a sized collection of items,
+    such as a list of parse results, whose memory is measured per item.
+    """
+    return benchmark(name, description, kind=MEMORY)
+
+
+def select(patterns: list[str] | None = None) -> list[Benchmark]:
+    """Get the registered benchmarks whose name contains any of the patterns"""
+    if not patterns:
+        return list(BENCHMARKS.values())
+
+    return [
+        bench
+        for name, bench in BENCHMARKS.items()
+        if any(pattern in name for pattern in patterns)
+    ]
+
+
+def run_benchmark(
+    bench: Benchmark, repeat: int = 5, min_time: float = 0.2
+) -> BenchmarkResult:
+    """
+    Time a benchmark. The number of calls per repeat is calibrated
+    so that each repeat takes at least min_time seconds.
+    """
+    func = bench.setup()
+    timer = timeit.Timer(func)
+
+    # warm up caches and lazily compiled patterns before timing
+    func()
+
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    timings = [elapsed / number]
+    timings.extend(seconds / number for seconds in timer.repeat(repeat - 1, number))
+
+    return BenchmarkResult(
+        name=bench.name,
+        number=number,
+        repeat=repeat,
+        best=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.fmean(timings),
+        stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    )
+
+
+def run_memory_benchmark(bench: Benchmark, repeat: int = 3) -> MemoryResult:
+    """
+    Measure the memory allocated by a call of a memory benchmark
+    and still held once it returns, which is the memory of the returned items.
+    The smallest of repeat measurements is kept.
+    """
+    func: Callable[[], Sized] = bench.setup()
+
+    # warm up caches and lazily compiled patterns, so they are not counted
+    func()
+
+    measurements = []
+    for _ in range(repeat):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            items = func()
+            gc.collect()
+            held = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+        measurements.append((held, len(items)))
+        del items
+
+    total_bytes, count = min(measurements)
+    return MemoryResult(
+        name=bench.name,
+        items=count,
+        total_bytes=total_bytes,
+        bytes_per_item=total_bytes / count if count else 0.0,
+    )
+
+
+def _git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return completed.stdout.strip()
+
+
+def metadata() -> dict:
+    """Describe the environment the benchmarks ran in"""
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "git_revision": _git_revision(),
+    }
+
+
+def results_to_json(results: list[BenchmarkResult | MemoryResult]) -> dict:
+    return {
+        "metadata": metadata(),
+        "benchmarks": {
+            result.name: {
+                field: value
+                for field, value in result._asdict().items()
+                if field != "name"
+            }
+            for result in results
+        },
+    }
+
+
+def load_results(path: str) -> dict:
+    with open(path, encoding="utf-8") as results_file:
+        results = json.load(results_file)
+
+    version = results.get("metadata", {}).get("format_version")
+    if version != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported results format version {version} in {path}")
+
+    return results
+
+
+def save_results(results: list[BenchmarkResult | MemoryResult], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump(results_to_json(results), results_file, indent=2)
+        results_file.write("\n")
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = 0.1, field: str = "median"
+) -> list[Comparison]:
+    """
+    Compare two sets of JSON results, benchmark by benchmark.
+    A benchmark whose time grew by more than threshold (a fraction)
+    is a regression, and one whose time shrank by as much is an improvement.
+    Memory benchmarks are compared by bytes per item in the same way.
+    Benchmarks missing from either side are reported but never fail.
+    """
+    baseline_benchmarks = baseline["benchmarks"]
+    current_benchmarks = current["benchmarks"]
+
+    def measured(entry: dict) -> tuple[float, str]:
+        if "bytes_per_item" in entry:
+            return entry["bytes_per_item"], "B"
+        return entry[field], "s"
+
+    comparisons = []
+    for name in sorted(baseline_benchmarks.keys() | current_benchmarks.keys()):
+        if name not in current_benchmarks:
+            base_time, unit = measured(baseline_benchmarks[name])
+            comparisons.append(Comparison(name, base_time, 0.0, 0.0, "removed", unit))
+            continue
+
+        if name not in baseline_benchmarks:
+            current_time, unit = measured(current_benchmarks[name])
+            comparisons.append(Comparison(name, 0.0, current_time, 0.0, "new", unit))
+            continue
+
+        base_time, unit = measured(baseline_benchmarks[name])
+        current_time, _ = measured(current_benchmarks[name])
+        ratio = current_time / base_time if base_time else float("inf")
+
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "unchanged"
+
+        comparisons.append(
+            Comparison(name, base_time, current_time, ratio, status, unit)
+        )
+
+    return comparisons
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def format_bytes(size: float) -> str:
+    for unit, scale in (("MiB", 2**20), ("KiB", 2**10)):
+        if size >= scale:
+            return f"{size / scale:.2f} {unit}"
+    return f"{size:.0f} B"
+
+
+def _format_measure(value: float, unit: str) -> str:
+    return format_bytes(value) if unit == "B" else format_seconds(value)
+
+
+def print_result(result: BenchmarkResult | MemoryResult, file=sys.stdout) -> None:
+    if isinstance(result, MemoryResult):
+        print(
+            f"{result.name:<45} {format_bytes(result.bytes_per_item):>12}"
+            f"  per item ({result.items} items, {format_bytes(result.total_bytes)})",
+            file=file,
+        )
+        return
+
+    print(
+        f"{result.name:<45} {format_seconds(result.median):>12}"
+        f"  (best {format_seconds(result.best)}, stdev {format_seconds(result.stdev)})",
+        file=file,
+    )
+
+
+def print_comparisons(comparisons: list[Comparison], file=sys.stdout) -> None:
+    for comp in comparisons:
+        if comp.status in ("new", "removed"):
+            print(f"{comp.name:<45} {comp.status:>12}", file=file)
+            continue
+
+        print(
+            f"{comp.name:<45} {_format_measure(comp.baseline, comp.unit):>12}"
+            f" -> {_format_measure(comp.current, comp.unit):>12}"
+            f"  x{comp.ratio:.2f}  {comp.status}",
+            file=file,
+        )
+
+
+def run_all(
+    benchmarks: list[Benchmark],
+    repeat: int = 5,
+    min_time: float = 0.2,
+    progress: bool = True,
+) -> list[BenchmarkResult | MemoryResult]:
+    results: list[BenchmarkResult | MemoryResult] = []
+    started = time.perf_counter()
+
+    for bench in benchmarks:
+        if bench.kind == MEMORY:
+            result: BenchmarkResult | MemoryResult = run_memory_benchmark(bench)
+        else:
+            result = run_benchmark(bench, repeat=repeat, min_time=min_time)
+        results.append(result)
+        if progress:
+            print_result(result)
+
+    if progress:
+        print(f"\n{len(results)} benchmarks in {time.perf_counter() - started:.1f} s")
+
+    return results
@@ -7,6 +7,46 @@ Classes:
         Defines a class for parsing multiple dates,
         while maintaining persistent user-defined configuration.
 
+    AsyncDateParser:
+        DateParser with awaitable methods for asyncio code,
+        which parse long texts in an executor rather than on the event loop.
+
+    ParserConfig:
+        The base date, named days and escape chars of a DateParser,
+        as one immutable value that parsers in many threads can share
+
+    NamedDayMatcher:
+        Substitutes many named days (e.g. holidays) in a single pass.
+
+    LRUCache:
+        A bounded cache for parse results, with optional expiry.
+        The module-wide instances used by default are dateparse.result_cache,
+        for finished results, and dateparse.expression_cache,
+        for the base-date-independent expressions found in a text
+
+    DateColumns:
+        The dates found in many texts as parallel arrays,
+        as returned by parse_many(..., output="columns").
+        NumPy arrays if NumPy is installed, array.array otherwise
+
+    DateDocument:
+        A text and the dates in it, kept up to date as the text is edited,
+        rescanning only the lines around each edit
+
+    ParsePlan:
+        The date expressions found in a text, as returned by DateParser.compile,
+        to be resolved against any base date. Plans can be pickled,
+        or saved as JSON with to_dict
+
+    ParseStats:
+        Opt-in timings of each stage of parsing, and counts of matches
+        per rule, cache hits and misses and text scanned, as a dict
+
+    PrefilterCounters:
+        Counts how many texts are checked for date vocabulary before scanning,
+        and how many are ruled out. The module-wide instance is
+        dateparse.prefilter_counters
+
 Functions:
     basic_parse
         Get a single date from a string, with its data in a NamedTuple
@@ -20,7 +60,108 @@ Functions:
     parse_all_dates
         Get all dates from a string as a list of datetime.date objects
 
+    parse_many
+        Get all dates from each of many strings, as a list of parse_all results
+
+    resolve_many
+        Resolve the date in a string against many base dates at once
+
+    iter_dates
+        Lazily get all dates from a string, file or stream of string chunks
+
+    parse_file
+        Lazily get all dates from a UTF-8 file, with their byte offsets,
+        decoding only the parts of it that may hold dates
+
 """
 
-from .dateparser import DateParser
-from .parseutil import basic_date_parse, basic_parse, parse_all, parse_all_dates
+import importlib
+
+# typing.TYPE_CHECKING, without the cost of importing typing
+TYPE_CHECKING = False
+
+# the submodule defining each public name. Submodules are imported when one of
+# their names is first used, so importing the package itself compiles nothing
+_EXPORTS = {
+    "AsyncDateParser": "async_parser",
+    "BulkResult": "bulk",
+    "resolve_many": "bulk",
+    "LRUCache": "cache",
+    "DateColumns": "columns",
+    "epoch_days_to_date": "columns",
+    "ParserConfig": "config",
+    "DateParser": "dateparser",
+    "DateChanges": "documents",
+    "DateDocument": "documents",
+    "FileDateResult": "files",
+    "parse_file": "files",
+    "NamedDayMatcher": "named_days",
+    "basic_date_parse": "parseutil",
+    "basic_parse": "parseutil",
+    "expression_cache": "parseutil",
+    "parse_all": "parseutil",
+    "parse_all_dates": "parseutil",
+    "parse_many": "parseutil",
+    "result_cache": "parseutil",
+    "ParsePlan": "plans",
+    "ParseStats": "profiling",
+    "PrefilterCounters": "prefilter",
+    "PrefilterStats": "prefilter",
+    "prefilter_counters": "prefilter",
+    "iter_dates": "streaming",
+}
+
+_SUBMODULES = frozenset(
+    {
+        *_EXPORTS.values(),
+        "datemath",
+        "grammar",
+        "parsefunctions",
+        "regex_utils",
+        "scanner",
+    }
+)
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+if TYPE_CHECKING:
+    from .async_parser import AsyncDateParser
+    from .bulk import BulkResult, resolve_many
+    from .cache import LRUCache
+    from .columns import DateColumns, epoch_days_to_date
+    from .config import ParserConfig
+    from .dateparser import DateParser
+    from .documents import DateChanges, DateDocument
+    from .files import FileDateResult, parse_file
+    from .named_days import NamedDayMatcher
+    from .parseutil import (
+        basic_date_parse,
+        basic_parse,
+        expression_cache,
+        parse_all,
+        parse_all_dates,
+        parse_many,
+        result_cache,
+    )
+    from .plans import ParsePlan
+    from .profiling import ParseStats
+    from .prefilter import PrefilterCounters, PrefilterStats, prefilter_counters
+    from .streaming import iter_dates
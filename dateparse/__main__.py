@@ -0,0 +1,6 @@
+"""Runs the dateparse command, as python -m dateparse."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,248 @@
+"""
+Defines AsyncDateParser, which parses from asyncio code without blocking
+the event loop on long texts, by running them in an executor.
+"""
+import asyncio
+import contextvars
+import datetime
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Final
+
+from .cache import LRUCache
+from .config import ParserConfig
+from .dateparser import DateParser
+from .named_days import NamedDayMatcher
+from .parsefunctions import DateResult
+from .parseutil import _MISSING, _basic_parse, _parse_all, _result_key
+from .profiling import _active_stats
+
+# texts up to this many characters are parsed on the event loop,
+# which takes about two milliseconds per thousand characters
+DEFAULT_INLINE_THRESHOLD: Final = 1024
+
+# parsed in the executor by warm_up, to compile the patterns before they are needed
+_WARM_UP_TEXT: Final = "a week after friday, four days before march 11"
+
+_UNCACHED_PARSERS: Final = {"basic_parse": _basic_parse, "parse_all": _parse_all}
+
+
+def _parse_uncached(
+    kind: str,
+    base_date: datetime.date,
+    text: str,
+    from_right: bool,
+    allow_past: bool,
+    escape: str,
+    named_days: NamedDayMatcher | None,
+    group_cache: LRUCache | None,
+) -> Any:
+    # what basic_parse or parse_all would compute on a cache miss,
+    # with arguments that can be sent to another process
+    return _UNCACHED_PARSERS[kind](
+        base_date, text, from_right, allow_past, escape, named_days, group_cache
+    )
+
+
+class AsyncDateParser:
+    """
+    A DateParser for asyncio code, whose parse methods are awaitable.
+
+    Texts up to inline_threshold characters are parsed on the event loop,
+    which is quicker than handing them to a thread.
+    Longer texts are parsed in the executor, so the loop keeps running.
+
+
+    __init__(
+        base_date = None,
+        named_days = None,
+        escape = "\\",
+        cache = None,
+        group_cache = None,
+        executor = None,
+        inline_threshold = DEFAULT_INLINE_THRESHOLD,
+        max_concurrency = None,
+        config = None,
+    ) -> None:
+        base_date, named_days, escape, cache, group_cache, config:
+            As for DateParser. Results are looked up in and stored to cache,
+            the module-wide result_cache by default, wherever they are parsed.
+
+        executor: the concurrent.futures.Executor long texts are parsed in.
+        If None, the event loop's default executor is used.
+        A ThreadPoolExecutor keeps the loop responsive, but since parsing holds
+        the GIL, a ProcessPoolExecutor is needed to parse on several cores.
+        Processes use their own expression caches rather than group_cache.
+
+        inline_threshold: the length of the longest text parsed on the loop.
+
+        max_concurrency: the most texts parsed in the executor at once
+        by this parser, or None for no limit besides the executor's own.
+        Calls over the limit wait their turn without blocking the loop.
+
+    parser: DateParser
+        The parser whose settings and caches are used.
+
+    await get_first(text: str, allow_past: bool = False) -> DateResult | None
+    await get_last(text: str, allow_past: bool = False) -> DateResult | None
+    await get_first_date(text: str, allow_past: bool = False) -> datetime.date | None
+    await get_last_date(text: str, allow_past: bool = False) -> datetime.date | None
+    await get_all(text: str, from_right=False, allow_past=False) -> list | None
+    await get_all_dates(text: str, from_right=False, allow_past=False) -> list | None
+        As the DateParser methods of the same names.
+
+        A call can be cancelled like any other coroutine. A text still waiting
+        for the executor is then never parsed; one already being parsed
+        finishes in the executor, and its result is discarded.
+
+    await warm_up() -> None
+        Compile the patterns in the executor (and for a process pool,
+        in a thread as well), so that the first parse on the loop is not slowed
+        by compiling them. Call it once at startup.
+    """
+
+    def __init__(
+        self,
+        base_date: datetime.date | None = None,
+        named_days: dict[str, str] | None = None,
+        escape: str = "\\",
+        cache: LRUCache | None = None,
+        group_cache: LRUCache | None = None,
+        executor: Executor | None = None,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        max_concurrency: int | None = None,
+        config: ParserConfig | None = None,
+    ):
+        self.parser = DateParser(
+            base_date=base_date,
+            named_days=named_days,
+            escape=escape,
+            cache=cache,
+            group_cache=group_cache,
+            config=config,
+        )
+        self.executor = executor
+        self.inline_threshold = inline_threshold
+
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        )
+
+    async def _offload(self, func: Any, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+
+        if not isinstance(self.executor, ProcessPoolExecutor):
+            # as asyncio.to_thread does, so that an active ParseStats sees the parse
+            func = functools.partial(contextvars.copy_context().run, func)
+
+        if self._semaphore is None:
+            return await loop.run_in_executor(self.executor, func, *args)
+
+        async with self._semaphore:
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    async def _parse(
+        self, kind: str, text: str, from_right: bool, allow_past: bool
+    ) -> Any:
+        parser = self.parser
+        config = parser.config
+
+        key = _result_key(
+            kind,
+            config.base_date,
+            text,
+            from_right,
+            allow_past,
+            config.escape,
+            config.named_days,
+        )
+        result = parser.cache.get(key, _MISSING)
+
+        stats = _active_stats.get()
+        if stats is not None:
+            stats.record_cache("result", result is not _MISSING)
+
+        if result is not _MISSING:
+            return result
+
+        inline = len(text) <= self.inline_threshold
+
+        group_cache = parser.group_cache
+        if not inline and isinstance(self.executor, ProcessPoolExecutor):
+            # other processes cannot share this process's caches
+            group_cache = None
+
+        args = (
+            kind,
+            config.base_date,
+            text,
+            from_right,
+            allow_past,
+            config.escape,
+            config.named_days,
+            group_cache,
+        )
+
+        if inline:
+            result = _parse_uncached(*args)
+        else:
+            result = await self._offload(_parse_uncached, *args)
+
+        parser.cache.put(key, result)
+        return result
+
+    async def get_first(self, text: str, allow_past: bool = False) -> DateResult | None:
+        """Returns a DateResult tuple for the leftmost date expression in the input"""
+        return await self._parse("basic_parse", text, False, allow_past)
+
+    async def get_first_date(
+        self, text: str, allow_past: bool = False
+    ) -> datetime.date | None:
+        """Returns a datetime.date for the leftmost date expression in the input"""
+        result = await self._parse("basic_parse", text, False, allow_past)
+        return None if result is None else result.date
+
+    async def get_last(self, text: str, allow_past: bool = False) -> DateResult | None:
+        """Returns a DateResult tuple for the rightmost date expression in the input"""
+        return await self._parse("basic_parse", text, True, allow_past)
+
+    async def get_last_date(
+        self, text: str, allow_past: bool = False
+    ) -> datetime.date | None:
+        """Returns a datetime.date for the rightmost date expression in the input"""
+        result = await self._parse("basic_parse", text, True, allow_past)
+        return None if result is None else result.date
+
+    async def get_all(
+        self, text: str, from_right: bool = False, allow_past: bool = False
+    ) -> list[DateResult] | None:
+        """Returns a list of all found date expressions as DateResult tuples"""
+        return await self._parse("parse_all", text, from_right, allow_past)
+
+    async def get_all_dates(
+        self, text: str, from_right: bool = False, allow_past: bool = False
+    ) -> list[datetime.date] | None:
+        """Returns a list of all found date expressions as datetime.date objects"""
+        results = await self._parse("parse_all", text, from_right, allow_past)
+        return None if results is None else [result.date for result in results]
+
+    async def warm_up(self) -> None:
+        config = self.parser.config
+        warm_up = functools.partial(
+            _parse_uncached,
+            "parse_all",
+            config.base_date,
+            _WARM_UP_TEXT,
+            False,
+            False,
+            config.escape,
+            config.named_days,
+            None,
+        )
+
+        await self._offload(warm_up)
+
+        if isinstance(self.executor, ProcessPoolExecutor):
+            await asyncio.get_running_loop().run_in_executor(None, warm_up)
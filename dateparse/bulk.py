@@ -0,0 +1,158 @@
+"""
+Defines resolve_many, which resolves the date expression in one text
+against many base dates at once, e.g. a reminder for every user's local date.
+"""
+import datetime
+from array import array
+from typing import Any, Iterable, Mapping, NamedTuple
+
+from .columns import _TYPECODE, EPOCH_ORDINAL, _get_numpy
+from .datemath import _select, add_years_to_ordinal
+from .named_days import NamedDayMatcher
+from .parsefunctions import ExpressionGrouping
+from .parseutil import (
+    _as_named_day_matcher,
+    _get_engine,
+    _get_expression_content,
+    _get_expression_span,
+    _get_expressions,
+    _ParseEngine,
+)
+
+
+class BulkResult(NamedTuple):
+    """
+    One date expression resolved against many base dates.
+
+    dates: the date for each base date, in order: a datetime64[D] array
+    with NumPy, or otherwise an array.array of the number of days
+    since 1970-01-01, as in DateColumns
+    start, end, content: as in DateResult, for the expression in the text
+    """
+
+    dates: Any
+    start: int
+    end: int
+    content: str
+
+
+def resolve_many(
+    base_dates: Iterable[datetime.date] | Any,
+    text: str,
+    from_right: bool = False,
+    allow_past: bool = False,
+    escape: str = "\\",
+    named_days: Mapping[str, str] | NamedDayMatcher | None = None,
+) -> BulkResult | None:
+    """
+    Resolve the first (or last, if from_right) date expression in text
+    against each of many base dates.
+
+    Parameters:
+
+        base_dates: Iterable[datetime.date] | numpy.ndarray
+            The base dates, as datetime.date objects,
+            or as a NumPy datetime64 array.
+
+        text: str
+            The text to find the expression in, which is scanned once.
+
+        from_right, allow_past, escape, named_days:
+            As for basic_parse.
+
+    Returns a BulkResult whose dates are those basic_parse would return
+    for each base date, or None if the text has no date expression.
+
+    The date arithmetic of weekdays, days, weeks, months and years is done
+    on day ordinals, with NumPy arrays if NumPy is installed, for all base dates
+    at once. Other expressions, such as "the third monday in may"
+    or named days, are resolved one base date at a time.
+    """
+    matcher = _as_named_day_matcher(named_days)
+    engine = _get_engine(matcher)
+
+    expressions = _get_expressions(text, escape, matcher, None)
+    if not expressions:
+        return None
+
+    expr = expressions[-1] if from_right else expressions[0]
+
+    start, end = _get_expression_span(expr)
+
+    numpy = _get_numpy()
+    if numpy is not None:
+        base_ordinals = _as_ordinal_array(numpy, base_dates)
+        ordinals = _resolve_ordinals(base_ordinals, expr, allow_past, engine)
+        dates = (ordinals - EPOCH_ORDINAL).view("datetime64[D]")
+    else:
+        dates = array(
+            _TYPECODE,
+            (
+                _resolve_ordinals(base_date.toordinal(), expr, allow_past, engine)
+                - EPOCH_ORDINAL
+                for base_date in base_dates
+            ),
+        )
+
+    return BulkResult(dates, start, end, _get_expression_content(expr))
+
+
+def _as_ordinal_array(numpy, base_dates: Any):
+    if isinstance(base_dates, numpy.ndarray) and base_dates.dtype.kind == "M":
+        epoch_days = base_dates.astype("datetime64[D]").astype(numpy.int64)
+        return epoch_days + EPOCH_ORDINAL
+
+    return numpy.fromiter(
+        (base_date.toordinal() for base_date in base_dates), dtype=numpy.int64
+    )
+
+
+def _resolve_ordinals(
+    base_ordinals: Any,
+    expr: ExpressionGrouping,
+    allow_past: bool,
+    engine: _ParseEngine,
+) -> Any:
+    # the ordinals _resolve_date would give for each base ordinal
+    anchor = expr.anchor
+    ordinals = _parse_ordinals(
+        engine.bulk_index.get(anchor.pattern),
+        engine.absolute_index[anchor.pattern],
+        anchor,
+        base_ordinals,
+    )
+
+    for delta in expr.deltas:
+        ordinals = ordinals + _parse_ordinals(
+            engine.bulk_index.get(delta.pattern),
+            engine.relative_index[delta.pattern],
+            delta,
+            base_ordinals,
+        )
+
+    if not allow_past:
+        ordinals = _select(
+            ordinals < base_ordinals, add_years_to_ordinal(ordinals, 1), ordinals
+        )
+
+    return ordinals
+
+
+def _parse_ordinals(bulk_parse, parse, date_tuple, base_ordinals: Any) -> Any:
+    if bulk_parse is not None:
+        return bulk_parse(date_tuple, base_ordinals)
+
+    def parse_one(base_ordinal: int) -> int:
+        parsed = parse(date_tuple, datetime.date.fromordinal(base_ordinal))
+        if isinstance(parsed, datetime.timedelta):
+            return parsed.days
+        return parsed.toordinal()
+
+    if isinstance(base_ordinals, int):
+        return parse_one(base_ordinals)
+
+    return _get_numpy().fromiter(
+        (parse_one(base_ordinal) for base_ordinal in base_ordinals.tolist()),
+        dtype=base_ordinals.dtype,
+        count=len(base_ordinals),
+    )
@@ -0,0 +1,201 @@
+"""
+Defines LRUCache, a bounded cache for parse results,
+with optional expiry and hit/miss/eviction counters.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple
+
+_MISSING: Any = object()
+
+
+class CacheStats(NamedTuple):
+    """Snapshot of the counters and current size of an LRUCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    approximate_bytes: int
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    size: int
+    expires_at: float | None
+
+
+def approximate_size(obj: Any) -> int:
+    """
+    Estimate the memory held by obj in bytes.
+    Tuples and lists (and so NamedTuples such as DateResult) are measured
+    along with their items; anything else is measured with sys.getsizeof.
+    """
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, (tuple, list)):
+        size += sum(approximate_size(item) for item in obj)
+
+    return size
+
+
+class LRUCache:
+    """
+    A thread-safe least-recently-used cache.
+
+    __init__(
+        maxsize: int | None = 1024,
+        maxbytes: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[[Any], int] = approximate_size,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        maxsize: the maximum number of entries held, or None for no limit.
+        A maxsize of 0 disables caching entirely.
+
+        maxbytes: the maximum approximate size of all keys and values held,
+        as measured by sizeof, or None for no limit.
+
+        ttl: the number of seconds after insertion an entry expires,
+        or None if entries never expire.
+
+        When either bound is exceeded, the least recently used entries
+        are evicted until the cache fits again.
+
+    get(key, default=None)
+        Get the value for key, or default if it is missing or expired.
+
+    put(key, value)
+        Store a value, evicting old entries as needed.
+
+    clear()
+        Remove all entries. Counters are kept.
+
+    resize(maxsize=..., maxbytes=...)
+        Change either bound, evicting entries immediately if needed.
+
+    stats() -> CacheStats
+        Get the hit, miss, eviction and expiration counters
+        and the current size of the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = 1024,
+        maxbytes: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[[Any], int] = approximate_size,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+
+        self._sizeof = sizeof
+        self._timer = timer
+
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = threading.RLock()
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the value for key, or default if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            if entry.expires_at is not None and entry.expires_at <= self._timer():
+                self._discard(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entries if needed."""
+        if self.maxsize == 0:
+            return
+
+        size = self._sizeof(key) + self._sizeof(value)
+        if self.maxbytes is not None and size > self.maxbytes:
+            # too large to store, but an older value must not outlive it
+            with self._lock:
+                self._discard(key)
+            return
+
+        expires_at = None
+        if self.ttl is not None:
+            expires_at = self._timer() + self.ttl
+
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = _CacheEntry(value, size, expires_at)
+            self._total_bytes += size
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries from the cache. Counters are not reset."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def resize(self, maxsize: Any = _MISSING, maxbytes: Any = _MISSING) -> None:
+        """
+        Change the entry and/or byte bound of the cache.
+        Arguments that are not given keep their current value;
+        None removes the bound.
+        """
+        with self._lock:
+            if maxsize is not _MISSING:
+                self.maxsize = maxsize
+            if maxbytes is not _MISSING:
+                self.maxbytes = maxbytes
+            self._evict()
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters and size."""
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                expirations=self.expirations,
+                entries=len(self._entries),
+                approximate_bytes=self._total_bytes,
+            )
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    def _over_bounds(self) -> bool:
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            return True
+        return self.maxbytes is not None and self._total_bytes > self.maxbytes
+
+    def _evict(self) -> None:
+        while self._entries and self._over_bounds():
+            _, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.size
+            self.evictions += 1
@@ -0,0 +1,266 @@
+"""
+The dateparse command, which finds the dates in every line of text files
+or standard input and writes them out as JSON lines or CSV.
+
+    dateparse app.log                        one JSON object per date found
+    dateparse --format csv -o dates.csv a.log.gz b.log
+    zcat big.log.gz | dateparse --jobs 8 --base-date 2023-01-17
+
+Each date found is written as its file, line number (from 1),
+ISO date, start and end offsets in the line, and content.
+Files may be gzip-compressed, and "-" (the default) reads standard input.
+Lines are parsed in batches, and each batch's output is written at once.
+"""
+import argparse
+import contextlib
+import csv
+import datetime
+import gzip
+import io
+import itertools as it
+import json
+import os
+import sys
+from typing import IO, Iterable, Iterator, TextIO
+
+from .dateparser import DateParser
+from .parallel import ParallelDateParser
+from .parsefunctions import DateResult
+from .parseutil import _check_named_days
+
+DEFAULT_BATCH_SIZE = 1024
+
+# the first bytes of every gzip file
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_FIELDS = ("file", "line", "date", "start", "end", "content")
+
+
+def _read_lines(file_name: str) -> Iterator[str]:
+    with contextlib.ExitStack() as stack:
+        if file_name == "-":
+            binary = sys.stdin.buffer
+        else:
+            binary = stack.enter_context(open(file_name, "rb"))
+
+        # gzip is recognized by its contents, so compressed standard input works too
+        if binary.peek(len(_GZIP_MAGIC))[: len(_GZIP_MAGIC)] == _GZIP_MAGIC:
+            binary = stack.enter_context(gzip.GzipFile(fileobj=binary))
+
+        text = io.TextIOWrapper(
+            binary, encoding="utf-8", errors="replace", newline="\n"
+        )
+        # detached rather than closed, so that standard input stays open
+        stack.callback(text.detach)
+
+        for line in text:
+            yield line.rstrip("\r\n")
+
+
+def _load_named_days(path: str) -> dict[str, str]:
+    with open(path, encoding="utf-8") as named_days_file:
+        named_days = json.load(named_days_file)
+
+    if not isinstance(named_days, dict) or not all(
+        isinstance(key, str) and isinstance(value, str)
+        for key, value in named_days.items()
+    ):
+        raise ValueError(f"{path} must hold a JSON object of strings to strings")
+
+    _check_named_days(named_days)
+    return named_days
+
+
+def _jsonl_rows(file_name: str, line_number: int, results: list[DateResult]):
+    file_json = json.dumps(file_name)
+    return [
+        f'{{"file": {file_json}, "line": {line_number}, '
+        f'"date": "{result.date.isoformat()}", '
+        f'"start": {result.start}, "end": {result.end}, '
+        f'"content": {json.dumps(result.content)}}}\n'
+        for result in results
+    ]
+
+
+def _csv_rows(file_name: str, line_number: int, results: list[DateResult]):
+    return [
+        (
+            file_name,
+            line_number,
+            result.date.isoformat(),
+            result.start,
+            result.end,
+            result.content,
+        )
+        for result in results
+    ]
+
+
+class _Writer:
+    """Writes the rows of many lines' results in one call per batch."""
+
+    def __init__(self, out: TextIO, output_format: str):
+        if output_format == "csv":
+            csv_writer = csv.writer(out, lineterminator="\n")
+            csv_writer.writerow(_FIELDS)
+            self._format_rows = _csv_rows
+            self._write_rows = csv_writer.writerows
+        else:
+            self._format_rows = _jsonl_rows
+            self._write_rows = lambda rows: out.write("".join(rows))
+
+    def write_batch(
+        self,
+        file_name: str,
+        first_line_number: int,
+        batch_results: Iterable[list[DateResult] | ValueError | OverflowError | None],
+    ) -> None:
+        rows = []
+        for line_number, results in enumerate(batch_results, first_line_number):
+            if isinstance(results, (ValueError, OverflowError)):
+                # e.g. "february 29" in a common year; the other lines go on
+                error = f"dateparse: {file_name}:{line_number}: {results}"
+                print(error, file=sys.stderr)
+            elif results:
+                rows.extend(self._format_rows(file_name, line_number, results))
+
+        if rows:
+            self._write_rows(rows)
+
+
+def _process(
+    lines: Iterator[str],
+    file_name: str,
+    parser: DateParser,
+    parallel_parser: ParallelDateParser | None,
+    writer: _Writer,
+    args: argparse.Namespace,
+) -> None:
+    if parallel_parser is not None:
+        # the workers parse batches ahead while these are written
+        all_results = parallel_parser.imap(
+            lines,
+            from_right=args.from_right,
+            allow_past=args.allow_past,
+            return_exceptions=True,
+        )
+    else:
+        all_results = it.chain.from_iterable(
+            parser.get_all_many(
+                batch,
+                from_right=args.from_right,
+                allow_past=args.allow_past,
+                return_exceptions=True,
+            )
+            for batch in iter(lambda: list(it.islice(lines, args.batch_size)), [])
+        )
+
+    line_number = 1
+    while batch_results := list(it.islice(all_results, args.batch_size)):
+        writer.write_batch(file_name, line_number, batch_results)
+        line_number += len(batch_results)
+
+
+def _make_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        prog="dateparse",
+        description="Find the dates in each line of text, as JSON lines or CSV.",
+    )
+    arg_parser.add_argument(
+        "files",
+        nargs="*",
+        default=["-"],
+        help="text files to read, optionally gzipped; - reads standard input",
+    )
+    arg_parser.add_argument(
+        "--base-date",
+        type=datetime.date.fromisoformat,
+        help="the date to resolve dates against, as YYYY-MM-DD (default: today)",
+    )
+    arg_parser.add_argument(
+        "--named-days",
+        metavar="FILE",
+        help='a JSON file of named days, e.g. {"payday": "march 31"}',
+    )
+    arg_parser.add_argument(
+        "--from-right", action="store_true", help="list each line's dates last first"
+    )
+    arg_parser.add_argument(
+        "--allow-past",
+        action="store_true",
+        help="allow dates before the base date, rather than the next occurrence",
+    )
+    arg_parser.add_argument(
+        "--format", choices=("jsonl", "csv"), default="jsonl", dest="output_format"
+    )
+    arg_parser.add_argument(
+        "-o", "--output", help="write to this file rather than standard output"
+    )
+    arg_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes to parse with; 0 for one per CPU (default: 1)",
+    )
+    arg_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"lines parsed and written at a time (default: {DEFAULT_BATCH_SIZE})",
+    )
+    return arg_parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = _make_arg_parser()
+    args = arg_parser.parse_args(argv)
+
+    if args.jobs < 0 or args.batch_size < 1:
+        arg_parser.error("--jobs must be at least 0, and --batch-size at least 1")
+
+    try:
+        named_days = _load_named_days(args.named_days) if args.named_days else None
+        out: IO[str] = sys.stdout
+        if args.output is not None:
+            out = open(
+                args.output, "w", encoding="utf-8", newline="", buffering=1 << 20
+            )
+    except (OSError, ValueError) as error:
+        arg_parser.error(str(error))
+
+    parser = DateParser(base_date=args.base_date, named_days=named_days)
+
+    parallel_parser = None
+    if args.jobs != 1:
+        parallel_parser = ParallelDateParser(
+            base_date=parser.base_date,
+            named_days=named_days,
+            processes=args.jobs or os.cpu_count(),
+            chunksize=args.batch_size,
+        )
+
+    try:
+        writer = _Writer(out, args.output_format)
+        for file_name in args.files:
+            lines = _read_lines(file_name)
+            _process(lines, file_name, parser, parallel_parser, writer, args)
+
+        out.flush()
+
+    except BrokenPipeError:
+        # the reader went away, as in `dateparse big.log | head`: stop quietly,
+        # and point stdout at devnull so that flushing it at exit cannot fail
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+    except OSError as error:
+        print(f"dateparse: {error}", file=sys.stderr)
+        return 1
+
+    finally:
+        if parallel_parser is not None:
+            parallel_parser.close()
+        if out is not sys.stdout:
+            out.close()
+
+    return 0
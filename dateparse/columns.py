@@ -0,0 +1,110 @@
+"""
+Defines DateColumns, the columnar form of the results of parsing many texts,
+with NumPy arrays if NumPy is installed, and array.array otherwise.
+"""
+import datetime
+from array import array
+from typing import Any, NamedTuple
+
+_NOT_IMPORTED: Any = object()
+
+# NumPy is an optional extra, imported by _get_numpy when it is first needed,
+# as importing it takes several times longer than importing dateparse
+numpy: Any = _NOT_IMPORTED
+
+# the ordinal of 1970-01-01, from which datetime64[D] counts days
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+_TYPECODE = "q"
+
+
+class DateColumns(NamedTuple):
+    """
+    Parallel columns with one row per date found, in the order
+    parse_many would return the dates as DateResults.
+
+    text_index: the index of the text the date was found in
+    start, end: the span of the date expression in that text
+    date: the date, as datetime64[D] with NumPy, or otherwise as the number
+    of days since 1970-01-01 (the integer form of datetime64[D],
+    and of the Arrow date32 type)
+
+    With NumPy every column is a numpy.ndarray; otherwise each is an
+    array.array of 64-bit integers. Either way, they convert to a table
+    without creating Python objects per row, e.g.
+    pandas.DataFrame(columns._asdict()).
+    """
+
+    text_index: Any
+    start: Any
+    end: Any
+    date: Any
+
+
+def _get_numpy():
+    """NumPy, imported on first use, or None if it is not installed"""
+    global numpy
+
+    if numpy is _NOT_IMPORTED:
+        try:
+            import numpy as numpy_module
+        except ImportError:
+            numpy_module = None
+        numpy = numpy_module
+
+    return numpy
+
+
+def epoch_days_to_date(days: int) -> datetime.date:
+    """Convert a value from a fallback date column to a datetime.date"""
+    return datetime.date.fromordinal(int(days) + EPOCH_ORDINAL)
+
+
+class _ColumnBuilder:
+    """Collects rows into arrays, and makes DateColumns from them"""
+
+    def __init__(self):
+        self.text_index = array(_TYPECODE)
+        self.start = array(_TYPECODE)
+        self.end = array(_TYPECODE)
+        self.date = array(_TYPECODE)
+
+    def add_rows(
+        self, text_index: int, rows: list[tuple[int, int, int]] | None
+    ) -> None:
+        # rows of (start, end, epoch day) for one text
+        if not rows:
+            return
+
+        self.text_index.extend([text_index] * len(rows))
+        for start, end, day in rows:
+            self.start.append(start)
+            self.end.append(end)
+            self.date.append(day)
+
+    def build(self, use_numpy: bool | None = None) -> DateColumns:
+        """
+        Make the columns, as NumPy arrays if use_numpy is True,
+        or if it is None and NumPy is installed.
+        """
+        numpy = _get_numpy()
+
+        if use_numpy is None:
+            use_numpy = numpy is not None
+
+        if not use_numpy:
+            return DateColumns(self.text_index, self.start, self.end, self.date)
+
+        if numpy is None:
+            raise ImportError("NumPy output was requested, but NumPy is not installed")
+
+        def to_ndarray(column: array):
+            # a view of the array's buffer, with no copy
+            return numpy.frombuffer(column, dtype=numpy.int64)
+
+        return DateColumns(
+            to_ndarray(self.text_index),
+            to_ndarray(self.start),
+            to_ndarray(self.end),
+            to_ndarray(self.date).view("datetime64[D]"),
+        )
@@ -0,0 +1,69 @@
+"""
+Defines ParserConfig, the settings of a DateParser as one immutable value,
+which any number of parsers and threads can share without locking.
+"""
+import datetime
+import types
+from typing import Mapping, NamedTuple
+
+from .named_days import NamedDayMatcher
+from .parseutil import _check_named_days
+
+# the named days every DateParser recognizes unless told otherwise
+DEFAULT_NAMED_DAYS: Mapping[str, str] = types.MappingProxyType(
+    {"christmas": "december 25", "halloween": "october 31"}
+)
+
+
+class ParserConfig(NamedTuple):
+    """
+    The base date, named days and escape chars a DateParser parses with.
+
+    A config is never changed once made, and hashes by value,
+    so it can be built once and handed to parsers in any number of threads.
+    Changing a setting makes a new config; parsers using the old one
+    go on using it.
+
+    from_settings(
+        base_date = None,
+        named_days = None,
+        escape = "\\",
+        default_named_days = DEFAULT_NAMED_DAYS,
+    ) -> ParserConfig
+        Make a config as DateParser(base_date, named_days, escape) would:
+        today's date if base_date is None, and named_days
+        in addition to (or in place of) default_named_days.
+        Raises ValueError if a named day does not stand for a date expression.
+
+    with_named_days(named_days: Mapping[str, str]) -> ParserConfig
+        A copy of the config with named_days added to its own,
+        checked as by from_settings.
+    """
+
+    base_date: datetime.date
+    named_days: NamedDayMatcher
+    escape: str = "\\"
+
+    @classmethod
+    def from_settings(
+        cls,
+        base_date: datetime.date | None = None,
+        named_days: Mapping[str, str] | None = None,
+        escape: str = "\\",
+        default_named_days: Mapping[str, str] = DEFAULT_NAMED_DAYS,
+    ) -> "ParserConfig":
+        all_named_days = dict(default_named_days)
+        if named_days is not None:
+            _check_named_days(named_days)
+            all_named_days.update(named_days)
+
+        if base_date is None:
+            base_date = datetime.date.today()
+
+        return cls(base_date, NamedDayMatcher(all_named_days), escape)
+
+    def with_named_days(self, named_days: Mapping[str, str]) -> "ParserConfig":
+        _check_named_days(named_days)
+        return self._replace(
+            named_days=NamedDayMatcher({**self.named_days.named_days, **named_days})
+        )
@@ -0,0 +1,264 @@
+"""
+Closed-form calendar arithmetic on the proleptic Gregorian calendar.
+
+All offsets are computed in constant time from day ordinals
+(as returned by datetime.date.toordinal), so no intermediate
+months or years are ever iterated over. The length, first day and weekday
+of a month are looked up in tables of the 400 year Gregorian cycle.
+"""
+import datetime
+import itertools as it
+from array import array
+from typing import Final, NamedTuple
+
+# cumulative day counts before the first of each month, in a common year
+# one-indexed so that the month number is the index
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# the calendar repeats every 400 years, which are a whole number of weeks,
+# so tables of one cycle hold the facts of every month of every year
+_CYCLE_YEARS = 400
+_CYCLE_MONTHS = 12 * _CYCLE_YEARS
+_CYCLE_DAYS = 146097
+
+
+class CalendarTables(NamedTuple):
+    """
+    The months of a 400 year cycle, from January of year 1,
+    indexed by 12 * (year - 1) + (month - 1) modulo 4800.
+
+    month_lengths: the number of days in each month
+    month_offsets: the days from the start of the cycle to the first of each
+        month, and to the end of the cycle (at index 4800)
+    first_isoweekdays: the weekday of the first of each month,
+        1 for Monday as in isoweekday
+    """
+
+    month_lengths: bytes
+    month_offsets: array
+    first_isoweekdays: bytes
+
+
+def _build_calendar_tables() -> CalendarTables:
+    month_lengths = bytearray(bytes(_DAYS_IN_MONTH[1:]) * _CYCLE_YEARS)
+    for year in range(1, _CYCLE_YEARS + 1):
+        if is_leap(year):
+            month_lengths[12 * (year - 1) + 1] = 29
+
+    month_offsets = array("i", it.accumulate(month_lengths, initial=0))
+
+    # the cycle starts on a Monday, January 1st of year 1
+    first_isoweekdays = bytes(offset % 7 + 1 for offset in month_offsets[:-1])
+
+    return CalendarTables(bytes(month_lengths), month_offsets, first_isoweekdays)
+
+
+def is_leap(year: int) -> bool:
+    """True if year is a leap year."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+# about 30 KB, made in about a millisecond when the module is imported
+CALENDAR_TABLES: Final = _build_calendar_tables()
+_MONTH_LENGTHS, _MONTH_OFFSETS, _FIRST_ISOWEEKDAYS = CALENDAR_TABLES
+
+
+def days_in_month(year: int, month: int) -> int:
+    """Number of days in the given month of the given year."""
+    return _MONTH_LENGTHS[(12 * year + month - 13) % _CYCLE_MONTHS]
+
+
+def days_before_year(year: int) -> int:
+    """Number of days from 0001-01-01 to January 1st of year."""
+    prior = year - 1
+    return prior * 365 + prior // 4 - prior // 100 + prior // 400
+
+
+def days_before_month(year: int, month: int) -> int:
+    """Number of days in year preceding the first of month."""
+    leap_day = 1 if month > 2 and is_leap(year) else 0
+    return _DAYS_BEFORE_MONTH[month] + leap_day
+
+
+def month_start_ordinal(year: int, month: int) -> int:
+    """
+    Ordinal of the first day of a month, as datetime.date.toordinal would give.
+    Months outside 1-12 are carried into the year, and years outside
+    the range of datetime.date are supported.
+    """
+    cycle, index = divmod(12 * year + month - 13, _CYCLE_MONTHS)
+    return cycle * _CYCLE_DAYS + _MONTH_OFFSETS[index] + 1
+
+
+def month_start_isoweekday(year: int, month: int) -> int:
+    """Weekday of the first day of a month, 1 for Monday as in isoweekday."""
+    return _FIRST_ISOWEEKDAYS[(12 * year + month - 13) % _CYCLE_MONTHS]
+
+
+def shift_month(year: int, month: int, count: int) -> tuple[int, int]:
+    """Get the (year, month) pair count months after year and month."""
+    year_offset, month_index = divmod(month - 1 + count, 12)
+    return year + year_offset, month_index + 1
+
+
+def add_months(input_date: datetime.date, count: int) -> datetime.date:
+    """
+    Get the date count months after input_date (or before, if count is negative).
+    Days past the end of the target month are clamped to its last day,
+    so January 31st plus one month is the last day of February.
+    """
+    month_index = 12 * input_date.year + input_date.month - 13 + count
+    year_offset, month_offset = divmod(month_index, 12)
+    day = min(input_date.day, _MONTH_LENGTHS[month_index % _CYCLE_MONTHS])
+    return datetime.date(year_offset + 1, month_offset + 1, day)
+
+
+def add_years(input_date: datetime.date, count: int) -> datetime.date:
+    """
+    Get the date count years after input_date (or before, if count is negative).
+    February 29th is clamped to February 28th in common years.
+    """
+    if input_date.month == 2 and input_date.day == 29:
+        return add_months(input_date, count * 12)
+    return input_date.replace(year=input_date.year + count)
+
+
+def month_span_days(
+    input_date: datetime.date, months_count: int, backward: bool = False
+) -> int:
+    """
+    Total length in days of months_count consecutive months,
+    starting from the month of input_date and going forward,
+    or backward if backward is True.
+    """
+    if backward:
+        span_end = month_start_ordinal(input_date.year, input_date.month + 1)
+        span_start = month_start_ordinal(
+            input_date.year, input_date.month + 1 - months_count
+        )
+    else:
+        span_start = month_start_ordinal(input_date.year, input_date.month)
+        span_end = month_start_ordinal(
+            input_date.year, input_date.month + months_count
+        )
+
+    return span_end - span_start
+
+
+def nth_weekday(year: int, month: int, isoweekday: int, n: int) -> datetime.date:
+    """
+    Get the nth occurrence of a weekday (1 for Monday, as in isoweekday)
+    in a month, counting back from the end of the month if n is negative.
+    Raises ValueError if the month has no such day, e.g. a fifth Friday.
+    """
+    month_length = days_in_month(year, month)
+    first_weekday = month_start_isoweekday(year, month)
+
+    if n > 0:
+        day = 1 + (isoweekday - first_weekday) % 7 + 7 * (n - 1)
+    elif n < 0:
+        last_weekday = (first_weekday + month_length - 2) % 7 + 1
+        day = month_length - (last_weekday - isoweekday) % 7 + 7 * (n + 1)
+    else:
+        raise ValueError("n must not be zero")
+
+    if not 1 <= day <= month_length:
+        raise ValueError(f"No weekday {isoweekday} number {n} in {year}-{month:02}")
+
+    return datetime.date(year, month, day)
+
+
+# Ordinal arithmetic for many dates at once.
+# These functions take and return day ordinals, and use only integer operators,
+# so that each one works on plain ints and, elementwise, on NumPy integer arrays.
+# Conditions are applied arithmetically with _select rather than by branching.
+
+# ordinals counted from 0000-03-01, so that leap days end each 400 year era
+_MARCH_EPOCH_OFFSET = 306
+_DAYS_PER_ERA = 146097
+
+
+def _select(condition, if_true, if_false):
+    # elementwise "if_true if condition else if_false", for a boolean condition
+    return if_false + (if_true - if_false) * condition
+
+
+def ordinal_isoweekday(ordinal):
+    """The isoweekday (1 for Monday) of an ordinal"""
+    return (ordinal - 1) % 7 + 1
+
+
+def ordinal_to_ymd(ordinal):
+    """Split an ordinal into its year, month and day"""
+    days = ordinal + _MARCH_EPOCH_OFFSET - 1
+    era = days // _DAYS_PER_ERA
+    day_of_era = days - era * _DAYS_PER_ERA
+    year_of_era = (
+        day_of_era
+        - day_of_era // 1460
+        + day_of_era // 36524
+        - day_of_era // (_DAYS_PER_ERA - 1)
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    # months counted from March
+    march_month = (5 * day_of_year + 2) // 153
+
+    day = day_of_year - (153 * march_month + 2) // 5 + 1
+    month = (march_month + 2) % 12 + 1
+    year = year_of_era + era * 400 + (month <= 2)
+
+    return year, month, day
+
+
+def ymd_to_ordinal(year, month, day):
+    """
+    The ordinal of a year, month and day. Months outside 1-12 carry into the year,
+    and days past the end of the month into the months after it.
+    """
+    year = year + (month - 1) // 12
+    month = (month - 1) % 12 + 1
+
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = (
+        year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    )
+
+    return era * _DAYS_PER_ERA + day_of_era - _MARCH_EPOCH_OFFSET + 1
+
+
+def year_is_leap(year):
+    """As is_leap, elementwise"""
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def month_length(year, month):
+    """As days_in_month, elementwise"""
+    return _select(month == 2, 28 + year_is_leap(year), 30 + (month + month // 8) % 2)
+
+
+def add_years_to_ordinal(ordinal, count):
+    """As add_years, on ordinals"""
+    year, month, day = ordinal_to_ymd(ordinal)
+    year = year + count
+    last_day = month_length(year, month)
+    return ymd_to_ordinal(year, month, _select(day > last_day, last_day, day))
+
+
+def month_span_days_from_ordinal(ordinal, months_count, backward: bool = False):
+    """As month_span_days, for the month containing each ordinal"""
+    year, month, _ = ordinal_to_ymd(ordinal)
+
+    if backward:
+        span_end = ymd_to_ordinal(year, month + 1, 1)
+        span_start = ymd_to_ordinal(year, month + 1 - months_count, 1)
+    else:
+        span_start = ymd_to_ordinal(year, month, 1)
+        span_end = ymd_to_ordinal(year, month + months_count, 1)
+
+    return span_end - span_start
@@ -4,9 +4,28 @@ while remembering user-defined preferences
 """
 
 import datetime
-
+import os
+from typing import IO, Iterable, Iterator, Mapping, Sequence
+
+from .bulk import BulkResult, resolve_many
+from .cache import LRUCache
+from .columns import DateColumns
+from .config import DEFAULT_NAMED_DAYS, ParserConfig
+from .documents import DateDocument
+from .files import FileDateResult, parse_file
+from .named_days import NamedDayMatcher
 from .parsefunctions import DateResult
-from .parseutil import basic_parse, parse_all, parse_all_dates
+from .parseutil import (
+    _check_named_days,
+    basic_parse,
+    expression_cache,
+    parse_all,
+    parse_all_dates,
+    parse_many,
+    result_cache,
+)
+from .plans import ParsePlan
+from .streaming import DEFAULT_CHUNK_SIZE, iter_dates
 
 
 class DateParser:
@@ -23,16 +42,50 @@ class DateParser:
            named_days: a dictionary with string keys and values. For example:
             {"my birthday":"september 9"}
 
-            before parsing a string, all instances of each key will
-            be replaced with the corresponding value
+            each key is recognized (without case) as the date its value
+            stands for, so "a week after my birthday" is parsed as
+            "a week after september 9". Results keep the offsets and content
+            of the original text. Where keys overlap,
+            the leftmost and then the longest key is used.
+            Each value must be a single date expression, such as
+            "june 11" or "2 weeks after", or ValueError is raised;
+            a month and day may be followed by a year in the text
+            ("my birthday, 2025").
 
             A default pre-defined dictionary of named dates
             containing all (American) holidays with
             a fixed date representation is always enabled in addition.
 
+           escape: one or more chars that mark the following expression
+           as one the parser should ignore (default: a backslash)
+
+           cache: an LRUCache to store this parser's results in.
+           If unspecified or None, the module-wide parseutil.result_cache is used.
+           Pass a dedicated LRUCache to bound or inspect this parser's cache
+           separately, e.g. DateParser(cache=LRUCache(maxsize=256, ttl=3600))
+
+           group_cache: an LRUCache for the expressions found in each text,
+           independent of base date. If unspecified or None,
+           the module-wide parseutil.expression_cache is used.
+
+           config: a ParserConfig to use instead of base_date, named_days
+           and escape, which may be shared with other parsers and threads.
+
+       config: ParserConfig
+           The base date, named days and escape chars this parser uses,
+           as one immutable value. Each call reads it once,
+           so a call from another thread never sees half of a change.
+
+       base_date, escape: the settings in config.
+       Assigning one replaces config with an updated copy.
+
+       named_days: a read-only mapping of all named days in use,
+       including the defaults. Assign a new mapping to change it,
+       e.g. parser.named_days = {**parser.named_days, "payday": "march 31"}
+
        sub_named_days(text: str)
            Substitutes each occurrence of a key in self.named_days for its value.
-           Returns the modified string
+           Returns the modified string. Parsing does not need this step.
 
        get_first(text: str) -> DateResult | None
        get_last(text: str) -> DateResult | None
@@ -66,32 +119,112 @@ class DateParser:
        and get_all_dates returns a list of bare datetime.date objects;
        this is the only difference
 
+    get_all_many(
+        texts: Iterable[str],
+        from_right: bool = False,
+        allow_past: bool = False,
+        base_dates: Sequence[datetime.date] | None = None,
+        output: str = "results",
+        return_exceptions: bool = False,
+            ) -> list[list[DateResult] | None]
+
+       Batch variant of get_all (also available as parse_many).
+       Returns one get_all result per input text, in input order.
+       If base_dates is given, each text is parsed against the base date
+       at the same position instead of the parser's base date.
+       output and return_exceptions are as for parseutil.parse_many.
+
+    iter_dates(
+        source: str | IO[str] | Iterable[str],
+        allow_past: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+            ) -> Iterator[DateResult]
+
+       Lazily yields the results of get_all for text read in chunks,
+       as the module-level iter_dates does.
+
+    parse_file(
+        path: str | os.PathLike,
+        allow_past: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+            ) -> Iterator[FileDateResult]
+
+       Lazily yields the results of get_all for the text of a UTF-8 file,
+       with the byte offsets of each expression, by memory-mapping the file
+       as the module-level parse_file does.
+
+    document(text: str = "", allow_past: bool = False) -> DateDocument
+
+       Returns a DateDocument of text, which keeps the results of get_all
+       up to date as the text is edited.
+
     """
 
-    default_named_days = {"christmas": "december 25", "halloween": "october 31"}
+    default_named_days = DEFAULT_NAMED_DAYS
 
     def __init__(
         self,
         base_date: datetime.date | None = None,
         named_days: dict[str, str] | None = None,
         escape: str = "\\",
+        cache: LRUCache | None = None,
+        group_cache: LRUCache | None = None,
+        config: ParserConfig | None = None,
     ):
         """
         Constructor for DateParser
 
         """
 
-        self.named_days = self.default_named_days
-        self.escape = escape
-
-        self.cache: dict[str, DateResult] = {}
-
-        if named_days is not None:
-            self.named_days.update(named_days)
-
-        if base_date is None:
-            base_date = datetime.date.today()
-        self.base_date = base_date
+        if config is None:
+            config = ParserConfig.from_settings(
+                base_date,
+                named_days,
+                escape,
+                default_named_days=self.default_named_days,
+            )
+        elif base_date is not None or named_days is not None or escape != "\\":
+            raise ValueError("Pass either a config or its settings, not both")
+        self.config = config
+
+        if cache is None:
+            cache = result_cache
+        self.cache = cache
+
+        if group_cache is None:
+            group_cache = expression_cache
+        self.group_cache = group_cache
+
+    @property
+    def base_date(self) -> datetime.date:
+        return self.config.base_date
+
+    @base_date.setter
+    def base_date(self, base_date: datetime.date):
+        self.config = self.config._replace(base_date=base_date)
+
+    @property
+    def escape(self) -> str:
+        return self.config.escape
+
+    @escape.setter
+    def escape(self, escape: str):
+        self.config = self.config._replace(escape=escape)
+
+    @property
+    def named_days(self) -> Mapping[str, str]:
+        """A read-only view of the named days this parser substitutes."""
+        return self.config.named_days.named_days
+
+    @named_days.setter
+    def named_days(self, named_days: Mapping[str, str]):
+        # the matcher is only rebuilt when the named days are replaced
+        _check_named_days(named_days)
+        self.config = self.config._replace(named_days=NamedDayMatcher(named_days))
+
+    @property
+    def _named_day_matcher(self) -> NamedDayMatcher:
+        return self.config.named_days
 
     def sub_named_days(self, text: str):
         """
@@ -99,27 +232,34 @@ class DateParser:
         corresponding value in self.named_days.
         Returns the processed string.
         """
-        text = text.lower()
-
-        for day_name, repl_str in self.named_days.items():
-            if day_name in text:
-                text = text.replace(day_name, repl_str)
-        return text
+        return self.config.named_days.sub(text)
 
     def get_first(self, text: str, allow_past: bool = False) -> DateResult | None:
         """Returns a DateResult tuple for the leftmost date expression in the input"""
-        text = self.sub_named_days(text)
+        config = self.config
         return basic_parse(
-            self.base_date, text, allow_past=allow_past, escape=self.escape
+            config.base_date,
+            text,
+            allow_past=allow_past,
+            escape=config.escape,
+            named_days=config.named_days,
+            cache=self.cache,
+            group_cache=self.group_cache,
         )
 
     def get_first_date(
         self, text: str, allow_past: bool = False
     ) -> datetime.date | None:
         """Returns a datetime.date for the leftmost date expression in the input"""
-        text = self.sub_named_days(text)
+        config = self.config
         result = basic_parse(
-            self.base_date, text, allow_past=allow_past, escape=self.escape
+            config.base_date,
+            text,
+            allow_past=allow_past,
+            escape=config.escape,
+            named_days=config.named_days,
+            cache=self.cache,
+            group_cache=self.group_cache,
         )
 
         if result is not None:
@@ -128,24 +268,30 @@ class DateParser:
 
     def get_last(self, text: str, allow_past: bool = False):
         """Returns a DateResult tuple for the rightmost date expression in the input"""
-        text = self.sub_named_days(text)
+        config = self.config
         return basic_parse(
-            self.base_date,
+            config.base_date,
             text,
             from_right=True,
             allow_past=allow_past,
-            escape=self.escape,
+            escape=config.escape,
+            named_days=config.named_days,
+            cache=self.cache,
+            group_cache=self.group_cache,
         )
 
     def get_last_date(self, text: str, allow_past: bool = False):
         """Returns a datetime.date for the rightmost date expression in the input"""
-        text = self.sub_named_days(text)
+        config = self.config
         result = basic_parse(
-            self.base_date,
+            config.base_date,
             text,
             from_right=True,
             allow_past=allow_past,
-            escape=self.escape,
+            escape=config.escape,
+            named_days=config.named_days,
+            cache=self.cache,
+            group_cache=self.group_cache,
         )
 
         if result is not None:
@@ -156,20 +302,133 @@ class DateParser:
         self, text: str, from_right: bool = False, allow_past: bool = False
     ) -> list[DateResult] | None:
         """Returns a list of all found date expressions as DateResult tuples"""
-        text = self.sub_named_days(text)
+        config = self.config
         return parse_all(
-            self.base_date,
+            config.base_date,
             text,
             from_right=from_right,
             allow_past=allow_past,
-            escape=self.escape,
+            escape=config.escape,
+            named_days=config.named_days,
+            cache=self.cache,
+            group_cache=self.group_cache,
         )
 
     def get_all_dates(
         self, text: str, from_right: bool = False, allow_past: bool = False
     ) -> list[datetime.date] | None:
         """Returns a list of all found date expressions as datetime.date objects"""
-        text = self.sub_named_days(text)
+        config = self.config
         return parse_all_dates(
-            self.base_date, text, from_right=from_right, allow_past=allow_past
+            config.base_date,
+            text,
+            from_right=from_right,
+            allow_past=allow_past,
+            escape=config.escape,
+            named_days=config.named_days,
+            cache=self.cache,
+            group_cache=self.group_cache,
+        )
+
+    def get_all_many(
+        self,
+        texts: Iterable[str],
+        from_right: bool = False,
+        allow_past: bool = False,
+        base_dates: Sequence[datetime.date] | None = None,
+        output: str = "results",
+        return_exceptions: bool = False,
+    ) -> list[list[DateResult] | ValueError | OverflowError | None] | DateColumns:
+        """
+        Returns a list of get_all results for each input text, in input order,
+        or the same dates as DateColumns if output is "columns"
+        """
+        config = self.config
+        return parse_many(
+            config.base_date if base_dates is None else base_dates,
+            texts,
+            from_right=from_right,
+            allow_past=allow_past,
+            escape=config.escape,
+            named_days=config.named_days,
+            output=output,
+            return_exceptions=return_exceptions,
+        )
+
+    parse_many = get_all_many
+
+    def compile(self, text: str) -> ParsePlan:
+        """
+        Returns a ParsePlan of the date expressions in text,
+        which can be resolved against any base date without scanning text again
+        """
+        config = self.config
+        return ParsePlan.from_text(
+            text, escape=config.escape, named_days=config.named_days
+        )
+
+    def resolve_many(
+        self,
+        base_dates: Iterable[datetime.date],
+        text: str,
+        from_right: bool = False,
+        allow_past: bool = False,
+    ) -> BulkResult | None:
+        """
+        Returns the first (or last) date expression in text,
+        resolved against each of base_dates at once
+        """
+        config = self.config
+        return resolve_many(
+            base_dates,
+            text,
+            from_right=from_right,
+            allow_past=allow_past,
+            escape=config.escape,
+            named_days=config.named_days,
+        )
+
+    def iter_dates(
+        self,
+        source: str | IO[str] | Iterable[str],
+        allow_past: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[DateResult]:
+        """Lazily yields DateResult tuples for all date expressions in the source"""
+        config = self.config
+        return iter_dates(
+            config.base_date,
+            source,
+            allow_past=allow_past,
+            escape=config.escape,
+            chunk_size=chunk_size,
+            named_days=config.named_days,
+        )
+
+    def parse_file(
+        self,
+        path: str | os.PathLike,
+        allow_past: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[FileDateResult]:
+        """Lazily yields FileDateResult tuples for all date expressions in a file"""
+        config = self.config
+        return parse_file(
+            config.base_date,
+            path,
+            allow_past=allow_past,
+            escape=config.escape,
+            chunk_size=chunk_size,
+            named_days=config.named_days,
+        )
+
+    def document(self, text: str = "", allow_past: bool = False) -> DateDocument:
+        """Returns a DateDocument of text, parsed with this parser's settings"""
+        config = self.config
+        return DateDocument(
+            config.base_date,
+            text,
+            allow_past=allow_past,
+            escape=config.escape,
+            named_days=config.named_days,
         )
@@ -0,0 +1,465 @@
+"""
+Defines DateDocument, which keeps the dates in a text up to date as the text
+is edited, such as a note open in an editor, by rescanning only the lines
+around each edit.
+"""
+import bisect
+import datetime
+import itertools as it
+import re
+from typing import Mapping, NamedTuple
+
+from .named_days import NamedDayMatcher
+from .parsefunctions import DateResult, DateTuple, ExpressionGrouping
+from .parseutil import (
+    _as_named_day_matcher,
+    _get_engine,
+    _get_expression_content,
+    _get_scanner,
+    _is_escaped,
+    _iter_expression_groups,
+    _iter_without_subgroups,
+    _ordered_matches,
+    _resolve_date,
+)
+from .streaming import _INTERVAL_START_PATTERN, _WHITESPACE_RUN_PATTERN, _find_cut
+
+
+class DateChanges(NamedTuple):
+    """
+    The results an edit of a DateDocument changed: those it removed,
+    with offsets into the text before the edit, and those it added,
+    with offsets into the text after it.
+    """
+
+    removed: list[DateResult]
+    added: list[DateResult]
+
+
+class _Rescan(NamedTuple):
+    """The matches an edit replaced, and those that replace them."""
+
+    # the old matches replaced are matches[first:last],
+    # all that start in text[scan_from:stop] before the edit
+    # (stop is None if they run to the end of the text)
+    first: int
+    last: int
+    scan_from: int
+    stop: int | None
+    new_matches: list[DateTuple]
+    # the ids of the new matches that are escaped
+    escaped: set[int]
+
+
+def _offset(stored: int, length: int) -> int:
+    """
+    Get the offset into a text of length chars that a stored offset stands for.
+    Offsets are stored either as they are, or as ~(length - offset):
+    counted back from the end of the text, which edits before them don't change.
+    """
+    return stored if stored >= 0 else length - ~stored
+
+
+def _expression_span(expr: ExpressionGrouping, length: int) -> tuple[int, int]:
+    # as _get_expression_span, for stored offsets
+    end = _offset(expr.anchor.end, length)
+    if not expr.deltas:
+        return _offset(expr.anchor.start, length), end
+
+    return min(_offset(delta_tup.start, length) for delta_tup in expr.deltas), end
+
+
+def _group_key(expr: ExpressionGrouping) -> tuple[int, ...]:
+    # groups are the same if they are of the same matches, whatever their offsets
+    return (id(expr.anchor), *map(id, expr.deltas))
+
+
+def _find_next_cut(text: str, start: int) -> tuple[int, int] | None:
+    """
+    Find the first run of whitespace starting at or after start that contains
+    a line break, and that no expression can extend across (see _find_cut).
+    Returns the start and end of the run, or None if there is none.
+    """
+    search_from = start
+
+    while (newline := text.find("\n", search_from)) != -1:
+        run_start = newline
+        while run_start > start and text[run_start - 1].isspace():
+            run_start -= 1
+
+        run_end = _WHITESPACE_RUN_PATTERN.match(text, newline).end()
+
+        search_from = run_end
+
+        # a run that only seems to start at start begins before it
+        if run_start == start and start > 0 and text[start - 1].isspace():
+            continue
+
+        if _INTERVAL_START_PATTERN.match(text, run_end):
+            continue
+
+        return run_start, run_end
+
+    return None
+
+
+def _spanning_ends(
+    matches: list[DateTuple], position: int, longest: int, length: int
+) -> dict[re.Pattern, int]:
+    """
+    Get the end of each match that starts before position and ends after it,
+    by pattern. matches are ordered by start, with stored offsets
+    into a text of length chars, and none is longer than longest.
+    """
+    ends = {}
+
+    index = bisect.bisect_left(
+        matches, position, key=lambda match: _offset(match.start, length)
+    )
+    while index > 0 and _offset(matches[index - 1].start, length) + longest > position:
+        index -= 1
+        end = _offset(matches[index].end, length)
+        if end > position:
+            ends[matches[index].pattern] = end
+
+    return ends
+
+
+class DateDocument:
+    """
+    A text and the dates in it, kept up to date through edits.
+
+    __init__(base_date, text = "", allow_past = False, escape = "\\",
+             named_days = None) -> None:
+        Parses text as parse_all would, with the same parameters.
+
+    text: str
+        The text, with every edit applied.
+
+    results: list[DateResult]
+        The results parse_all would get for text, in order.
+        Expressions that cannot be resolved, such as "february 30",
+        are left out rather than raising ValueError, since a text being
+        typed often passes through them.
+
+    edit(offset: int, deleted: int, inserted: str = "") -> DateChanges
+        Replaces the deleted chars of text from offset with inserted,
+        and returns the results that were removed and added.
+        Results wholly before or after the edited text that are otherwise
+        unchanged are not included; the offsets of those after it
+        move by len(inserted) - deleted.
+
+    Each edit rescans the text from the last line break before it
+    that no expression can span, up to the first such line break after it
+    where the scan has caught up with the one before the edit. The other
+    matches are kept, and the offsets of those after the edit are counted
+    from the end of the text, so they need no update. Only the expressions
+    the edit touched are resolved again, and an edit takes about as long
+    in a long text as in a short one.
+    """
+
+    def __init__(
+        self,
+        base_date: datetime.date,
+        text: str = "",
+        allow_past: bool = False,
+        escape: str = "\\",
+        named_days: Mapping[str, str] | NamedDayMatcher | None = None,
+    ):
+        self._base_date = base_date
+        self._allow_past = allow_past
+        self._escape = escape
+        # enough text before a scan to tell whether its first match is escaped
+        self._context = max(len(escape), 1)
+
+        self._engine = _get_engine(_as_named_day_matcher(named_days))
+        pattern_set = tuple(
+            it.chain(
+                self._engine.absolute_index.keys(), self._engine.relative_index.keys()
+            )
+        )
+        self._scanner = _get_scanner(pattern_set, self._engine.named_patterns)
+        self._pattern_indices = {
+            pattern: index for index, pattern in enumerate(self._scanner.patterns)
+        }
+        self._absolute_patterns = set(self._engine.absolute_index.keys())
+
+        self._text = text
+
+        # every match the scanner yields, escaped or not, ordered by start:
+        # those that run into a line break decide where the scan resumes after it.
+        # Offsets from matches[gap] on are stored counted back from the end.
+        # Escaped matches are kept by id, since their offsets change
+        self._escaped: set[int] = set()
+        self._matches = self._scan(
+            text, 0, len(text), [0] * len(self._scanner.patterns), self._escaped
+        )
+        self._gap = len(self._matches)
+        self._longest = max(
+            (match.end - match.start for match in self._matches), default=0
+        )
+
+        # the matches kept for grouping, and the groups, each with its date
+        # (or None, if it cannot be resolved)
+        self._tuples = list(
+            _iter_without_subgroups(
+                match for match in self._matches if id(match) not in self._escaped
+            )
+        )
+        self._groups = list(
+            _iter_expression_groups(self._tuples, self._absolute_patterns)
+        )
+        self._dates = [self._resolve(group) for group in self._groups]
+
+    @property
+    def base_date(self) -> datetime.date:
+        return self._base_date
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def results(self) -> list[DateResult]:
+        length = len(self._text)
+        return [
+            self._to_result(group, date, length)
+            for group, date in zip(self._groups, self._dates)
+            if date is not None
+        ]
+
+    def _resolve(self, group: ExpressionGrouping) -> datetime.date | None:
+        try:
+            return _resolve_date(self._base_date, group, self._allow_past, self._engine)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _to_result(
+        group: ExpressionGrouping, date: datetime.date, length: int
+    ) -> DateResult:
+        start, end = _expression_span(group, length)
+        return DateResult(date, start, end, _get_expression_content(group))
+
+    def _scan(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        next_start: list[int],
+        escaped: set[int],
+    ) -> list[DateTuple]:
+        # only the text scanned, and a few chars of context, is searched
+        trim = max(start - self._context, 0)
+        segment = text[trim:end]
+
+        segment_next_start = [max(position - trim, 0) for position in next_start]
+        found = []
+        for match in self._scanner.finditer(
+            segment, start - trim, end - trim, segment_next_start
+        ):
+            tup = DateTuple.from_match(match)
+            tup.start += trim
+            tup.end += trim
+            if _is_escaped(segment, match, self._escape):
+                escaped.add(id(tup))
+            found.append(tup)
+
+        next_start[:] = [position + trim for position in segment_next_start]
+        return _ordered_matches(found)
+
+    def _rescan(self, text: str, offset: int, deleted: int, inserted: int) -> _Rescan:
+        matches = self._matches
+        old_length = len(self._text)
+        shift = inserted - deleted
+
+        # a line break that no expression can span, and the text that decides
+        # that, are unchanged if they end before the edit; so are the matches
+        # before the line break, and where each pattern resumes after it
+        left_cut = _find_cut(text, 0, offset)
+        scan_from = 0 if left_cut is None else left_cut[0]
+
+        next_start = [scan_from] * len(self._scanner.patterns)
+        for pattern, end in _spanning_ends(
+            matches, scan_from, self._longest, old_length
+        ).items():
+            next_start[self._pattern_indices[pattern]] = end
+
+        # after the edit, the old matches hold again from the first such
+        # line break where every pattern resumes where it did before
+        escaped: set[int] = set()
+        new_matches: list[DateTuple] = []
+        resume_from = scan_from
+        search_from = offset + inserted + self._context
+        while True:
+            cut = _find_next_cut(text, search_from)
+            scan_to = len(text) if cut is None else cut[1]
+            scanned = self._scan(text, resume_from, scan_to, next_start, escaped)
+            new_matches += scanned
+            self._longest = max(
+                self._longest,
+                max((match.end - match.start for match in scanned), default=0),
+            )
+
+            if cut is None:
+                stop = None
+                break
+
+            run_start, run_end = cut
+            stop = run_start - shift
+            # (new matches are stored as they are, whatever the length)
+            new_ends = _spanning_ends(new_matches, run_start, self._longest, 0)
+            old_ends = _spanning_ends(matches, stop, self._longest, old_length)
+            if new_ends == {pattern: end + shift for pattern, end in old_ends.items()}:
+                break
+
+            resume_from, search_from = run_start, run_end
+
+        def old_start(match: DateTuple) -> int:
+            return _offset(match.start, old_length)
+
+        first = bisect.bisect_left(matches, scan_from, key=old_start)
+        last = (
+            len(matches)
+            if stop is None
+            else bisect.bisect_left(matches, stop, key=old_start)
+        )
+
+        return _Rescan(first, last, scan_from, stop, new_matches, escaped)
+
+    def edit(self, offset: int, deleted: int, inserted: str = "") -> DateChanges:
+        """
+        Replace text[offset : offset + deleted] with inserted,
+        and return the results removed and added.
+        """
+        old_text = self._text
+        if offset < 0 or deleted < 0 or offset + deleted > len(old_text):
+            raise ValueError(
+                f"Cannot delete {deleted} chars at {offset}"
+                f" from a text of length {len(old_text)}"
+            )
+
+        text = old_text[:offset] + inserted + old_text[offset + deleted :]
+        old_length = len(old_text)
+        rescan = self._rescan(text, offset, deleted, len(inserted))
+
+        def old_start(tup: DateTuple) -> int:
+            return _offset(tup.start, old_length)
+
+        # the expressions to regroup run from the anchor before the changed
+        # matches to the first anchor after them
+        tuples = self._tuples
+        tuples_first = bisect.bisect_left(tuples, rescan.scan_from, key=old_start)
+        tuples_last = (
+            len(tuples)
+            if rescan.stop is None
+            else bisect.bisect_left(tuples, rescan.stop, key=old_start)
+        )
+
+        region_first = tuples_first
+        while (
+            region_first > 0
+            and tuples[region_first - 1].pattern not in self._absolute_patterns
+        ):
+            region_first -= 1
+
+        region_last = tuples_last
+        while (
+            region_last < len(tuples)
+            and tuples[region_last].pattern not in self._absolute_patterns
+        ):
+            region_last += 1
+        region_last = min(region_last + 1, len(tuples))
+
+        new_tuples = list(
+            _iter_without_subgroups(
+                match
+                for match in rescan.new_matches
+                if id(match) not in rescan.escaped
+            )
+        )
+        new_groups = list(
+            _iter_expression_groups(
+                it.chain(
+                    tuples[region_first:tuples_first],
+                    new_tuples,
+                    tuples[tuples_last:region_last],
+                ),
+                self._absolute_patterns,
+            )
+        )
+
+        groups_first = bisect.bisect_left(
+            self._groups, rescan.scan_from, key=lambda group: old_start(group.anchor)
+        )
+        groups_last = groups_first + sum(
+            tup.pattern in self._absolute_patterns
+            for tup in tuples[tuples_first:region_last]
+        )
+        old_groups = self._groups[groups_first:groups_last]
+        old_group_dates = self._dates[groups_first:groups_last]
+        old_dates = dict(zip(map(_group_key, old_groups), old_group_dates))
+
+        old_results = [
+            self._to_result(group, date, old_length)
+            for group, date in zip(old_groups, old_group_dates)
+            if date is not None
+        ]
+
+        self._replace_matches(rescan, old_length)
+        tuples[tuples_first:tuples_last] = new_tuples
+
+        new_dates = []
+        for group in new_groups:
+            key = _group_key(group)
+            date = old_dates[key] if key in old_dates else self._resolve(group)
+            new_dates.append(date)
+        self._groups[groups_first:groups_last] = new_groups
+        self._dates[groups_first:groups_last] = new_dates
+        self._text = text
+
+        new_results = [
+            self._to_result(group, date, len(text))
+            for group, date in zip(new_groups, new_dates)
+            if date is not None
+        ]
+
+        # a result is unchanged if the edit only moved it along with the text
+        # after it; one spanning the edited text has changed, even if its
+        # expression is the same
+        shift = len(inserted) - deleted
+        moved = {}
+        for result in old_results:
+            if result.end <= offset:
+                moved[result] = result
+            elif result.start >= offset + deleted:
+                moved[result] = result._replace(
+                    start=result.start + shift, end=result.end + shift
+                )
+
+        unchanged = set(moved.values()).intersection(new_results)
+        removed = [
+            result for result in old_results if moved.get(result) not in unchanged
+        ]
+        added = [result for result in new_results if result not in unchanged]
+
+        return DateChanges(removed, added)
+
+    def _replace_matches(self, rescan: _Rescan, old_length: int) -> None:
+        matches = self._matches
+
+        # the gap moves to the end of the new matches: offsets before it are
+        # stored as they are, and after it counted back from the end,
+        # so only the matches between the last edit and this one change
+        for match in it.islice(matches, self._gap, rescan.first):
+            match.start = _offset(match.start, old_length)
+            match.end = _offset(match.end, old_length)
+
+        for match in it.islice(matches, rescan.last, self._gap):
+            match.start = ~(old_length - match.start)
+            match.end = ~(old_length - match.end)
+
+        self._escaped.difference_update(map(id, matches[rescan.first : rescan.last]))
+        self._escaped |= rescan.escaped
+        matches[rescan.first : rescan.last] = rescan.new_matches
+        self._gap = rescan.first + len(rescan.new_matches)
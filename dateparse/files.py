@@ -0,0 +1,413 @@
+"""
+Defines parse_file, which finds the dates in a UTF-8 file by memory-mapping it
+and decoding only the parts of it that may hold a date expression.
+"""
+import collections
+import datetime
+import functools
+import itertools as it
+import mmap
+import os
+import re
+from typing import Final, Iterator, Mapping, NamedTuple
+
+from .named_days import NamedDayMatcher
+from .parsefunctions import DateTuple
+from .parseutil import (
+    _as_named_day_matcher,
+    _get_engine,
+    _get_scanner,
+    _iter_expression_groups,
+    _iter_without_subgroups,
+    _reduce_expression,
+)
+from .prefilter import Prefilter
+from .regex_utils import TIME_INTERVAL_REGEX
+from .scanner import PatternScanner, _without_ignorecase
+from .streaming import DEFAULT_CHUNK_SIZE, _iter_stream_tuples
+
+# the ASCII bytes that str patterns match with \s (bytes patterns skip \x1c-\x1f)
+_WHITESPACE: Final = b"\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f "
+_WHITESPACE_RUN_PATTERN: Final = re.compile(rb"[\t\n\x0b-\r\x1c-\x1f ]*")
+_NON_WHITESPACE_PATTERN: Final = re.compile(rb"[^\t\n\x0b-\r\x1c-\x1f ]")
+
+# text after a line break that an expression on the line before may continue into:
+# an interval name ("a\n week before"), or non-ASCII text, which may be whitespace
+_CONTINUATION_PATTERN: Final = re.compile(
+    b"(?:" + TIME_INTERVAL_REGEX.encode() + rb")|[\x80-\xff]", re.IGNORECASE
+)
+
+# hit-free text shorter than this between two triggers is scanned rather than
+# skipped, since looking for a place to split there costs more than it saves
+_MIN_GAP: Final = 4096
+
+# files are searched for triggers this many bytes at a time
+_SEARCH_WINDOW: Final = 1024 * 1024
+# and the pages searched are released this many bytes at a time
+_RELEASE_SIZE: Final = 4 * 1024 * 1024
+
+# the most characters converted to byte offsets in one step
+_OFFSET_STEP: Final = 4096
+
+
+class FileDateResult(NamedTuple):
+    """
+    A DateResult for a date in a file, with the offsets of its expression
+    both in characters (start and end) and in bytes (byte_start and byte_end).
+    """
+
+    date: datetime.date
+    start: int
+    end: int
+    content: str
+    byte_start: int
+    byte_end: int
+
+
+@functools.lru_cache(maxsize=32)
+def _trigger_pattern(prefilter: Prefilter | None) -> tuple[re.Pattern, bool]:
+    """
+    Get a bytes pattern that matches on every line of UTF-8 text which may hold
+    part of a date expression: at the triggers of the prefilter, and at any
+    non-ASCII byte, as str patterns match some non-ASCII text where bytes
+    patterns would not (e.g. digits in other scripts, or "K" for "k").
+    Without a prefilter, or with one for names that aren't ASCII,
+    that is every line with more than whitespace on it.
+
+    Also returns whether the pattern is to search lowercased text,
+    which is much faster than searching without case.
+    """
+    if prefilter is None or not prefilter.pattern.pattern.isascii():
+        return _NON_WHITESPACE_PATTERN, False
+
+    pattern = _without_ignorecase(prefilter.pattern) or prefilter.pattern
+    bytes_pattern = re.compile(
+        b"(?:" + pattern.pattern.encode() + rb")|[\x80-\xff]",
+        pattern.flags & ~re.UNICODE,
+    )
+    return bytes_pattern, pattern is not prefilter.pattern
+
+
+class _TriggerSearch:
+    """
+    Searches a mapped file for a trigger pattern, in windows copied out of it
+    (lowercased, if the pattern is for lowercase text).
+    The pages of the file searched are released as it goes, where the OS allows it,
+    so that they don't pile up in memory.
+    """
+
+    def __init__(self, mapped: mmap.mmap, pattern: re.Pattern, lowercase: bool):
+        self.mapped = mapped
+        self.pattern = pattern
+        self.lowercase = lowercase
+        self._window = b""
+        self._window_start = self._window_end = 0
+        self._released = 0
+
+    def search(self, position: int) -> tuple[int, int] | None:
+        """The start and end of the first trigger at or after position, if any."""
+        while position < len(self.mapped):
+            # windows hold the byte before where they are searched from
+            if not self._window_start < position < self._window_end:
+                self._load_window(position)
+
+            match = self.pattern.search(self._window, position - self._window_start)
+            if match is not None:
+                return (
+                    match.start() + self._window_start,
+                    match.end() + self._window_start,
+                )
+
+            position = self._window_end
+
+        return None
+
+    def _load_window(self, position: int) -> None:
+        mapped = self.mapped
+        self._release(position)
+
+        # windows end at line breaks, which no trigger spans
+        window_end = mapped.find(b"\n", min(position + _SEARCH_WINDOW, len(mapped)))
+        if window_end == -1:
+            window_end = len(mapped)
+
+        self._window_start = max(position - 1, 0)
+        self._window_end = window_end
+        self._window = mapped[self._window_start : window_end]
+        if self.lowercase:
+            self._window = self._window.lower()
+
+    def _release(self, position: int) -> None:
+        # the pages are read from the file again if they are needed
+        release_end = position - position % mmap.PAGESIZE
+        if release_end - self._released < _RELEASE_SIZE:
+            return
+
+        if hasattr(mmap, "MADV_DONTNEED"):
+            self.mapped.madvise(
+                mmap.MADV_DONTNEED, self._released, release_end - self._released
+            )
+        self._released = release_end
+
+
+def _cut_before(mapped: mmap.mmap, floor: int, position: int) -> int:
+    """
+    Find where to begin scanning for the expressions at position: the start
+    of the last run of whitespace before it that holds a line break,
+    has text after floor before it, and that no expression extends across.
+    Returns floor if there is none.
+    """
+    search_end = position
+
+    while (newline := mapped.rfind(b"\n", floor, search_end)) != -1:
+        run_start = newline
+        while run_start > floor and mapped[run_start - 1] in _WHITESPACE:
+            run_start -= 1
+
+        run_end = _WHITESPACE_RUN_PATTERN.match(mapped, newline).end()
+        if run_start > floor and not _CONTINUATION_PATTERN.match(mapped, run_end):
+            return run_start
+
+        search_end = run_start
+
+    return floor
+
+
+def _cut_after(mapped: mmap.mmap, position: int) -> int:
+    """
+    Find where to stop scanning for the expressions before position: the end
+    of the first run of whitespace after it that holds a line break,
+    and that no expression extends across. Returns the file size if there is none.
+    """
+    while (newline := mapped.find(b"\n", position)) != -1:
+        run_end = _WHITESPACE_RUN_PATTERN.match(mapped, newline).end()
+        if not _CONTINUATION_PATTERN.match(mapped, run_end):
+            return run_end
+
+        position = run_end
+
+    return len(mapped)
+
+
+def _iter_regions(
+    mapped: mmap.mmap, prefilter: Prefilter | None
+) -> Iterator[tuple[int, int]]:
+    """
+    Yield the start and end byte offsets of the parts of the file
+    that may hold expressions, in order.
+
+    Every match of a rule holds its trigger, and no expression extends across
+    the whitespace the parts begin and end in (see streaming._find_cut),
+    so the text between parts, which has no triggers, has no expressions either.
+    That text is all ASCII, as non-ASCII bytes count as triggers.
+    """
+    search = _TriggerSearch(mapped, *_trigger_pattern(prefilter))
+    start = end = 0
+
+    while (hit := search.search(end)) is not None:
+        hit_start, hit_end = hit
+        if hit_start - end < _MIN_GAP:
+            # closely packed triggers make one part, which grows
+            # a gap's length at a time rather than a trigger at a time
+            end = _cut_after(mapped, min(hit_end + _MIN_GAP, len(mapped)))
+            continue
+
+        cut = _cut_before(mapped, end, hit_start)
+        if cut > end:
+            if end > start:
+                yield start, end
+            start = cut
+
+        end = _cut_after(mapped, hit_end)
+
+    if end > start:
+        yield start, end
+
+
+def _previous_char_start(mapped: mmap.mmap, position: int) -> int:
+    # the start of the UTF-8 character before position
+    position -= 1
+    lowest = max(position - 3, 0)
+    while position > lowest and mapped[position] & 0xC0 == 0x80:
+        position -= 1
+    return position
+
+
+def _decode(data: bytes) -> str:
+    # undecodable bytes become lone surrogates, which encode back to the same bytes,
+    # so that offsets stay exact in files that aren't entirely valid UTF-8
+    return data.decode("utf-8", "surrogateescape")
+
+
+def _iter_decoded(
+    mapped: mmap.mmap, start: int, end: int, chunk_size: int, lengths: list[int]
+) -> Iterator[str]:
+    # the text from start to end, chunk_size bytes at a time,
+    # with the length of each chunk added to lengths
+    while start < end:
+        chunk_end = min(start + chunk_size, end)
+        # chunks end at the start of a character
+        while chunk_end < end and mapped[chunk_end] & 0xC0 == 0x80:
+            chunk_end += 1
+
+        chunk = _decode(mapped[start:chunk_end])
+        lengths.append(len(chunk))
+        yield chunk
+        start = chunk_end
+
+
+class _ByteOffsets:
+    """
+    Converts the char offsets of expressions in a mapped UTF-8 file to byte offsets,
+    from the known offsets of the start of each part decoded.
+    Expressions are converted in order of their start. Each start is counted on
+    from the one before, and each end from its start, as expressions may overlap.
+    """
+
+    def __init__(self, mapped: mmap.mmap):
+        self.mapped = mapped
+        # (char offset, byte offset) pairs, the first for the part of the last start
+        self._starts: collections.deque[tuple[int, int]] = collections.deque([(0, 0)])
+        self._last_start = (0, 0)
+
+    def add(self, char_offset: int, byte_offset: int) -> None:
+        self._starts.append((char_offset, byte_offset))
+
+    def byte_span(self, start: int, end: int) -> tuple[int, int]:
+        starts = self._starts
+        while len(starts) > 1 and starts[1][0] <= start:
+            starts.popleft()
+
+        counted_from = max(starts[0], self._last_start)
+        byte_start = self._count_on(*counted_from, start)
+        self._last_start = (start, byte_start)
+
+        return byte_start, self._count_on(start, byte_start, end)
+
+    def _count_on(self, char: int, byte: int, char_offset: int) -> int:
+        # the byte offset of char_offset, from that of a char offset before it
+        remaining = char_offset - char
+        while remaining:
+            step = min(remaining, _OFFSET_STEP)
+            if self.mapped[byte : byte + step].isascii():
+                byte += step
+            else:
+                # no character is longer than four bytes
+                text = _decode(self.mapped[byte : byte + 4 * step])[:step]
+                byte += len(text.encode("utf-8", "surrogateescape"))
+            remaining -= step
+
+        return byte
+
+
+def _iter_file_tuples(
+    mapped: mmap.mmap,
+    prefilter: Prefilter | None,
+    scanner: PatternScanner,
+    escape: str,
+    chunk_size: int,
+    offsets: _ByteOffsets,
+) -> Iterator[DateTuple]:
+    """
+    Yield DateTuples for every match in the file, with char offsets into it,
+    as _iter_stream_tuples would for the whole decoded file.
+    Each part that may hold expressions is decoded chunk_size bytes at a time,
+    from a few characters before its start (for escapes and word boundaries).
+    """
+    # the char and byte offsets of the end of the last part decoded
+    char_end = byte_end = 0
+
+    for start, end in _iter_regions(mapped, prefilter):
+        decode_start = start
+        for _ in range(max(len(escape), 1)):
+            if decode_start > 0:
+                decode_start = _previous_char_start(mapped, decode_start)
+
+        if decode_start >= byte_end:
+            # text between parts is ASCII
+            char_start = char_end + decode_start - byte_end
+        else:
+            char_start = char_end - len(_decode(mapped[decode_start:byte_end]))
+
+        offsets.add(char_start, decode_start)
+
+        chunk_lengths: list[int] = []
+        chunks = _iter_decoded(mapped, decode_start, end, chunk_size, chunk_lengths)
+        for tup in _iter_stream_tuples(chunks, scanner, escape):
+            tup.start += char_start
+            tup.end += char_start
+            yield tup
+
+        char_end = char_start + sum(chunk_lengths)
+        byte_end = end
+
+
+def parse_file(
+    base_date: datetime.date,
+    path: str | os.PathLike,
+    allow_past: bool = False,
+    escape: str = "\\",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    named_days: Mapping[str, str] | NamedDayMatcher | None = None,
+) -> Iterator[FileDateResult]:
+    """
+    Lazily get all matched expressions in a UTF-8 file as FileDateResult tuples.
+
+    Parameters:
+
+        base_date: datetime.date
+            The reference point date for interpreting a date expression,
+            as for parse_all.
+
+        path: str | os.PathLike
+            The file to read.
+
+        allow_past, escape, named_days:
+            As for parse_all.
+
+        chunk_size: int
+            The number of bytes of the file to decode at a time.
+
+    Yields the same dates, char offsets and content as iter_dates would
+    for the text of the file, along with the byte offsets of each expression.
+
+    The file is memory-mapped rather than read, and searched as bytes for
+    the words and digits that every expression contains. Only the lines
+    around those are decoded and scanned, so files that are mostly
+    other text are parsed at the speed of the bytes search, and the memory
+    used is the same whatever the size of the file.
+    Bytes that are not valid UTF-8 are decoded as by errors="surrogateescape".
+    """
+    engine = _get_engine(_as_named_day_matcher(named_days))
+
+    pattern_set = tuple(
+        it.chain(engine.absolute_index.keys(), engine.relative_index.keys())
+    )
+    scanner = _get_scanner(pattern_set, engine.named_patterns)
+
+    with open(path, "rb") as file:
+        # an empty file cannot be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+            offsets = _ByteOffsets(mapped)
+            match_tuples = _iter_file_tuples(
+                mapped, engine.prefilter, scanner, escape, chunk_size, offsets
+            )
+
+            expressions = _iter_expression_groups(
+                _iter_without_subgroups(match_tuples),
+                set(engine.absolute_index.keys()),
+            )
+
+            for expr in expressions:
+                result = _reduce_expression(
+                    base_date, expr, allow_past=allow_past, engine=engine
+                )
+                yield FileDateResult(
+                    *result, *offsets.byte_span(result.start, result.end)
+                )
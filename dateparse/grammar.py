@@ -0,0 +1,321 @@
+"""
+Defines the grammar of date expressions as a table of rules.
+
+Each rule names a family of expressions, gives the pattern for it
+as a template over the shared vocabulary in regex_utils,
+and the function that parses its matches. A Grammar compiles its rules
+once, into the patterns the scanner searches for
+and the tables that dispatch each match to its parse function.
+Adding a rule adds one alternative to the scanner's single pass over
+the text, not a pass of its own.
+"""
+import datetime
+import functools
+import re
+import string
+import threading
+from typing import Any, Callable, Final, Iterable, NamedTuple
+
+from .parsefunctions import (
+    DateTuple,
+    _mdy_ordinals,
+    _mdy_parse,
+    _n_intervals_ordinals,
+    _n_intervals_parse,
+    _nth_weekday_parse,
+    _period_boundary_parse,
+    _quick_day_ordinals,
+    _quick_day_parse,
+    _relative_interval_days,
+    _relative_interval_parse,
+    _relative_weekday_ordinals,
+    _relative_weekday_parse,
+)
+from .prefilter import Prefilter
+from .regex_utils import VOCABULARY, WHITESPACE_BUF, compile_pattern
+
+ANCHOR: Final = "anchor"
+DELTA: Final = "delta"
+
+
+class Rule(NamedTuple):
+    """
+    One family of date expressions.
+
+    name: identifies the rule, and must be unique within a grammar.
+
+    kind: ANCHOR for expressions that stand for a date ("march 11"),
+    or DELTA for offsets applied to the anchor after them ("a week after").
+
+    template: the regex for the expression, where ${name} stands for
+    the vocabulary entry of that name (a literal $ is written $$).
+    Whitespace around the expression is matched without being written out.
+    Apart from that whitespace, a match must not span a line break,
+    so that streamed text can be split at line breaks.
+
+    parse: a function taking the DateTuple of a match and the base date,
+    returning a datetime.date for an anchor or a datetime.timedelta for a delta.
+
+    claims: if True, no other rule matches across the text of a match,
+    as for named days.
+
+    trigger: a template for something every match of the rule contains,
+    such as a weekday name, or None. When every rule of a grammar has one,
+    texts containing none of them are skipped without a scan.
+
+    bulk_parse: optionally, parse on day ordinals instead of dates, for resolving
+    an expression against many base dates at once. It takes the DateTuple
+    and an int ordinal, or a NumPy integer array of them, and returns
+    the ordinal of the date for an anchor, or the number of days for a delta,
+    using only operations that work elementwise on arrays
+    (see the ordinal functions in datemath). Rules without one are parsed
+    one base date at a time.
+    """
+
+    name: str
+    kind: str
+    template: str
+    parse: Callable[[DateTuple, datetime.date], Any]
+    claims: bool = False
+    trigger: str | None = None
+    bulk_parse: Callable[[DateTuple, Any], Any] | None = None
+
+
+def expand_template(template: str) -> str:
+    """Get the regex source for a rule template"""
+    return string.Template(template).substitute(VOCABULARY)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(template: str) -> re.Pattern:
+    # every grammar containing a rule shares its compiled pattern,
+    # since matches are dispatched on their pattern
+    return compile_pattern(WHITESPACE_BUF + expand_template(template) + WHITESPACE_BUF)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_triggers(triggers: tuple[str, ...]) -> re.Pattern:
+    return compile_pattern(
+        "|".join(f"(?:{expand_template(trigger)})" for trigger in triggers)
+    )
+
+
+class _CompiledGrammar(NamedTuple):
+    patterns: dict[str, re.Pattern]
+    absolute_index: dict[re.Pattern, Callable]
+    relative_index: dict[re.Pattern, Callable]
+    bulk_index: dict[re.Pattern, Callable]
+    claiming_patterns: frozenset[re.Pattern]
+    prefilter: Prefilter | None
+
+
+# held while a grammar compiles, so that threads using a grammar for the first time
+# at once get the same compiled patterns, which matches are dispatched on
+_compile_lock = threading.Lock()
+
+
+def _compile_rules(rules: list[Rule]) -> _CompiledGrammar:
+    patterns = {rule.name: _compile_template(rule.template) for rule in rules}
+
+    prefilter = None
+    if all(rule.trigger is not None for rule in rules):
+        # rules often share a trigger, e.g. a weekday name
+        triggers = tuple(dict.fromkeys(rule.trigger for rule in rules))
+        prefilter = Prefilter(_compile_triggers(triggers))
+
+    return _CompiledGrammar(
+        patterns,
+        {patterns[rule.name]: rule.parse for rule in rules if rule.kind == ANCHOR},
+        {patterns[rule.name]: rule.parse for rule in rules if rule.kind == DELTA},
+        {
+            patterns[rule.name]: rule.bulk_parse
+            for rule in rules
+            if rule.bulk_parse is not None
+        },
+        frozenset(patterns[rule.name] for rule in rules if rule.claims),
+        prefilter,
+    )
+
+
+class Grammar:
+    """
+    A set of rules, compiled when first used.
+
+    __init__(rules: Iterable[Rule]) -> None:
+        Check the rules. Anchors are searched for before deltas,
+        and otherwise rules keep their order, which decides between
+        matches with the same span.
+
+    Compiling the patterns is most of the cost of importing the package,
+    so it is put off until one of these is first used:
+
+    patterns: dict[str, re.Pattern]
+        The compiled pattern of each rule, by rule name.
+
+    absolute_index, relative_index: dict[re.Pattern, Callable]
+        The parse function for each anchor and delta pattern.
+
+    bulk_index: dict[re.Pattern, Callable]
+        The bulk parse function of each rule that has one.
+
+    claiming_patterns: frozenset[re.Pattern]
+        The patterns of rules that claim their text.
+
+    prefilter: Prefilter | None
+        Rules out texts with none of the rules' triggers,
+        or None if any rule has no trigger.
+
+    extend(rules: Iterable[Rule]) -> Grammar
+        A new grammar with the given rules after this one's.
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        rules = list(rules)
+
+        names = [rule.name for rule in rules]
+        if len(set(names)) != len(names):
+            raise ValueError("Rule names in a grammar must be unique")
+
+        for rule in rules:
+            if rule.kind not in (ANCHOR, DELTA):
+                raise ValueError(f"Rule '{rule.name}' has unknown kind '{rule.kind}'")
+
+        # anchors first, as the parser has always ordered its patterns
+        self.rules = [rule for rule in rules if rule.kind == ANCHOR] + [
+            rule for rule in rules if rule.kind == DELTA
+        ]
+
+        self._compiled: _CompiledGrammar | None = None
+
+    def _compile(self) -> _CompiledGrammar:
+        compiled = self._compiled
+        if compiled is None:
+            with _compile_lock:
+                if self._compiled is None:
+                    self._compiled = _compile_rules(self.rules)
+                compiled = self._compiled
+
+        return compiled
+
+    @property
+    def patterns(self) -> dict[str, re.Pattern]:
+        return self._compile().patterns
+
+    @property
+    def absolute_index(self) -> dict[re.Pattern, Callable]:
+        return self._compile().absolute_index
+
+    @property
+    def relative_index(self) -> dict[re.Pattern, Callable]:
+        return self._compile().relative_index
+
+    @property
+    def bulk_index(self) -> dict[re.Pattern, Callable]:
+        return self._compile().bulk_index
+
+    @property
+    def claiming_patterns(self) -> frozenset[re.Pattern]:
+        return self._compile().claiming_patterns
+
+    @property
+    def prefilter(self) -> Prefilter | None:
+        return self._compile().prefilter
+
+    def extend(self, rules: Iterable[Rule]) -> "Grammar":
+        return Grammar([*self.rules, *rules])
+
+
+DEFAULT_RULES: Final = (
+    # "oct 20", "october 20", "10-20-2023", "may 4, 2024"
+    Rule(
+        "month_day",
+        ANCHOR,
+        r"(?P<month>${month}|\d+)[^\d\n]+?(?P<day>\d{1,2})${year_suffix}",
+        _mdy_parse,
+        # the day is always a number, so month names need not be looked for
+        trigger=r"\d",
+        bulk_parse=_mdy_ordinals,
+    ),
+    # "in ten days", "in two weeks"
+    Rule(
+        "in_n_intervals",
+        ANCHOR,
+        r"in[^\n\d\w](?P<days_number>\w+|a)[^\n\d\w]"
+        r"(?P<time_interval_name>${interval})\w*?",
+        _n_intervals_parse,
+        trigger="${interval}",
+        bulk_parse=_n_intervals_ordinals,
+    ),
+    # "this sunday", "next wednesday"
+    Rule(
+        "relative_weekday",
+        ANCHOR,
+        r"(?P<specifier>this|next|last)?[^\n\d\w]*(?P<weekday_name>${weekday})",
+        _relative_weekday_parse,
+        trigger="${weekday}",
+        bulk_parse=_relative_weekday_ordinals,
+    ),
+    # "today", "tomorrow", "yesterday"
+    Rule(
+        "quick_day",
+        ANCHOR,
+        r"(?P<quick_dayname>${quick_day})",
+        _quick_day_parse,
+        trigger="${quick_day}",
+        bulk_parse=_quick_day_ordinals,
+    ),
+    # "the end of the month", "start of next year", "end of march"
+    Rule(
+        "period_boundary",
+        ANCHOR,
+        r"(?:the${gap})?(?P<boundary>${boundary})${gap}of${gap}(?:the${gap})?"
+        r"(?:(?P<specifier>${specifier})${gap})?(?P<period>${period}|${month})\w*",
+        _period_boundary_parse,
+        trigger="${boundary}",
+    ),
+    # "the third monday in august", "the last friday of the month", "2nd tuesday"
+    Rule(
+        "nth_weekday",
+        ANCHOR,
+        r"(?:the${gap})?(?P<ordinal>${ordinal}"
+        # "last" is only an ordinal with the month it is of,
+        # since "last friday" alone is a relative_weekday
+        r"|${last_ordinal}(?=${gap}${weekday}${gap}(?:of|in)${gap}(?:the${gap})?"
+        r"(?:(?:${specifier})${gap})?(?:month|${month})))"
+        r"${gap}(?P<weekday_name>${weekday})"
+        r"(?:${gap}(?:of|in)${gap}(?:the${gap})?(?:(?P<specifier>${specifier})${gap})?"
+        r"(?P<period>month|${month})\w*)?",
+        _nth_weekday_parse,
+        trigger="${weekday}",
+    ),
+    # "a week from", "four days after", "two months before"
+    Rule(
+        "relative_interval",
+        DELTA,
+        r"(?P<time_unit_count>a\s*|${number})?\s*(?P<time_interval_name>${interval})"
+        r"\w*[^\n\d\w]*(?P<preposition>${preposition})",
+        _relative_interval_parse,
+        trigger="${interval}",
+        bulk_parse=_relative_interval_days,
+    ),
+)
+
+default_grammar: Final = Grammar(DEFAULT_RULES)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    The dispatch tables of the default grammar, absolute_functions_index and
+    relative_functions_index, and their patterns as lists, absolute_patterns and
+    relative_patterns. They are looked up when first used, not compiled on import.
+    """
+    if name == "absolute_functions_index":
+        return default_grammar.absolute_index
+    if name == "relative_functions_index":
+        return default_grammar.relative_index
+    if name == "absolute_patterns":
+        return list(default_grammar.absolute_index)
+    if name == "relative_patterns":
+        return list(default_grammar.relative_index)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
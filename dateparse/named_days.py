@@ -0,0 +1,112 @@
+"""
+Defines NamedDayMatcher, which finds and substitutes
+any number of named days (e.g. holidays) in a single pass.
+"""
+import functools
+import re
+import types
+from typing import Mapping
+
+# marks the end of a complete key in a trie node
+_KEY_END = ""
+
+
+def _build_trie(keys: list[str]) -> dict:
+    trie: dict = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[_KEY_END] = {}
+    return trie
+
+
+def _trie_to_regex(node: dict) -> str:
+    """
+    Convert a trie to a regex pattern string matching any of its keys.
+    Longer keys are tried before their prefixes, so at any position
+    the pattern matches the longest key that starts there.
+    """
+    branches = [
+        re.escape(char) + _trie_to_regex(child)
+        for char, child in sorted(node.items())
+        if char != _KEY_END
+    ]
+
+    if not branches:
+        return ""
+
+    if len(branches) == 1 and _KEY_END not in node:
+        return branches[0]
+
+    alternation = "(?:" + "|".join(branches) + ")"
+    if _KEY_END in node:
+        return alternation + "?"
+    return alternation
+
+
+def named_days_regex(named_days: Mapping[str, str]) -> str:
+    """
+    Get a regex pattern string matching any key of named_days,
+    with prefixes shared between keys factored out so matching
+    only follows the keys that fit the text seen so far.
+    """
+    return _trie_to_regex(_build_trie([key for key in named_days if key]))
+
+
+class NamedDayMatcher:
+    """
+    Substitutes named days in text, compiled once for a fixed set of names.
+
+    __init__(named_days: Mapping[str, str]) -> None:
+        named_days: a mapping of names to the date expressions they stand for,
+        for example {"my birthday": "june 11"}. Names are matched without case.
+
+    sub(text: str) -> str
+        Lowercases text and replaces every name in it with its value.
+        The text is scanned once, left to right: where several names
+        start at the same position the longest one is used,
+        and substituted values are not themselves searched for names.
+
+    named_days: a read-only mapping of the lowercased names to their values.
+
+    Matchers with the same named days compare and hash as equal,
+    so they can be used as part of a cache key.
+    """
+
+    def __init__(self, named_days: Mapping[str, str]):
+        self.named_days = types.MappingProxyType(
+            {key.lower(): value for key, value in named_days.items()}
+        )
+        self._hash = hash(frozenset(self.named_days.items()))
+
+    @functools.cached_property
+    def pattern(self) -> re.Pattern | None:
+        """The compiled pattern matching any name, or None if there are none."""
+        if not any(self.named_days):
+            return None
+        return re.compile(named_days_regex(self.named_days))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NamedDayMatcher):
+            return NotImplemented
+        return self is other or self.named_days == other.named_days
+
+    def __reduce__(self):
+        # the pattern is compiled again where the matcher is unpickled
+        return (type(self), (dict(self.named_days),))
+
+    def _replace(self, match: re.Match) -> str:
+        return self.named_days[match.group()]
+
+    def sub(self, text: str) -> str:
+        """Return the lowercased text, with all named days substituted."""
+        text = text.lower()
+
+        if self.pattern is None:
+            return text
+
+        return self.pattern.sub(self._replace, text)
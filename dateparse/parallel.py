@@ -0,0 +1,214 @@
+"""
+Defines the ParallelDateParser class, which spreads parsing
+of many texts across a pool of worker processes.
+"""
+import collections
+import concurrent.futures as cf
+import datetime
+import itertools as it
+import multiprocessing.context
+import os
+from typing import Iterable, Iterator
+
+from .dateparser import DateParser
+from .parsefunctions import DateResult
+
+# each worker process builds its parser once, when it starts
+_worker_parser: DateParser | None = None
+
+
+def _init_worker(
+    base_date: datetime.date, named_days: dict[str, str] | None, escape: str
+) -> None:
+    global _worker_parser
+    _worker_parser = DateParser(
+        base_date=base_date, named_days=named_days, escape=escape
+    )
+
+
+def _parse_batch(
+    texts: list[str], from_right: bool, allow_past: bool, return_exceptions: bool
+) -> list[list[DateResult] | ValueError | OverflowError | None]:
+    if _worker_parser is None:
+        raise RuntimeError("Worker process was not initialized")
+
+    return _worker_parser.get_all_many(
+        texts,
+        from_right=from_right,
+        allow_past=allow_past,
+        return_exceptions=return_exceptions,
+    )
+
+
+def _iter_batches(texts: Iterable[str], chunksize: int) -> Iterator[list[str]]:
+    text_iter = iter(texts)
+    while batch := list(it.islice(text_iter, chunksize)):
+        yield batch
+
+
+class ParallelDateParser:
+    """
+    Parses many texts at once using a pool of worker processes.
+
+    __init__(
+        base_date = None,
+        named_days = None,
+        escape = "\\",
+        processes = None,
+        chunksize = 256,
+        mp_context = None,
+    ) -> None:
+        base_date, named_days, escape: as for DateParser.
+        The configuration is sent to each worker once, when it starts,
+        and each worker keeps its own DateParser.
+
+        processes: the number of worker processes.
+        If unspecified or None, defaults to the number of CPUs.
+
+        chunksize: the number of texts sent to a worker per task.
+
+        mp_context: a multiprocessing context to start workers with.
+
+    imap(
+        texts: Iterable[str],
+        from_right: bool = False,
+        allow_past: bool = False,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+            ) -> Iterator
+
+        Lazily parse every text, as DateParser.get_all would.
+        If ordered is True, yields each text's results in input order.
+        Otherwise, yields (index, results) pairs as soon as they are done.
+        If return_exceptions is True, a text that cannot be resolved
+        gets its ValueError or OverflowError in place of its results,
+        as for parse_many.
+        Only a few chunks per worker are in flight at any time,
+        so texts may be any iterable, including an unbounded one.
+
+    get_all_many(
+        texts: Iterable[str],
+        from_right: bool = False,
+        allow_past: bool = False,
+        return_exceptions: bool = False,
+            ) -> list[list[DateResult] | None]
+
+        Same as DateParser.get_all_many, using all workers.
+
+    close()
+        Shut down the worker processes.
+        A ParallelDateParser can also be used as a context manager.
+    """
+
+    def __init__(
+        self,
+        base_date: datetime.date | None = None,
+        named_days: dict[str, str] | None = None,
+        escape: str = "\\",
+        processes: int | None = None,
+        chunksize: int = 256,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ):
+        if base_date is None:
+            base_date = datetime.date.today()
+
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+
+        self.base_date = base_date
+        self.escape = escape
+        self.chunksize = chunksize
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        self._executor = cf.ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(base_date, named_days, escape),
+        )
+        self._max_in_flight = 2 * processes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes, cancelling any pending work."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def imap(
+        self,
+        texts: Iterable[str],
+        from_right: bool = False,
+        allow_past: bool = False,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> Iterator:
+        """Lazily parse every text, in input order or as completed."""
+        batches = _iter_batches(texts, self.chunksize)
+        options = (from_right, allow_past, return_exceptions)
+
+        if ordered:
+            return self._imap_ordered(batches, options)
+        return self._imap_unordered(batches, options)
+
+    def get_all_many(
+        self,
+        texts: Iterable[str],
+        from_right: bool = False,
+        allow_past: bool = False,
+        return_exceptions: bool = False,
+    ) -> list[list[DateResult] | ValueError | OverflowError | None]:
+        """Returns a list of get_all results for each input text, in input order"""
+        return list(
+            self.imap(
+                texts,
+                from_right=from_right,
+                allow_past=allow_past,
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    def _submit(self, batch: list[str], options: tuple[bool, bool, bool]):
+        return self._executor.submit(_parse_batch, batch, *options)
+
+    def _imap_ordered(
+        self, batches: Iterator[list[str]], options: tuple[bool, bool, bool]
+    ) -> Iterator[list[DateResult] | ValueError | OverflowError | None]:
+        in_flight: collections.deque[cf.Future] = collections.deque()
+
+        for batch in batches:
+            in_flight.append(self._submit(batch, options))
+
+            if len(in_flight) >= self._max_in_flight:
+                yield from in_flight.popleft().result()
+
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+    def _imap_unordered(
+        self, batches: Iterator[list[str]], options: tuple[bool, bool, bool]
+    ) -> Iterator[tuple[int, list[DateResult] | ValueError | OverflowError | None]]:
+        in_flight: dict[cf.Future, int] = {}
+        batch_start = 0
+
+        def drain(return_when: str):
+            done, _ = cf.wait(in_flight, return_when=return_when)
+            for future in done:
+                first_index = in_flight.pop(future)
+                yield from enumerate(future.result(), start=first_index)
+
+        for batch in batches:
+            in_flight[self._submit(batch, options)] = batch_start
+            batch_start += len(batch)
+
+            if len(in_flight) >= self._max_in_flight:
+                yield from drain(cf.FIRST_COMPLETED)
+
+        # results are yielded as each batch completes, not once they all have
+        while in_flight:
+            yield from drain(cf.FIRST_COMPLETED)
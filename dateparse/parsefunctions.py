@@ -1,34 +1,134 @@
 """Processing utilities for """
 import datetime
 import re
-from calendar import isleap, monthrange
-from itertools import repeat
-from typing import Any, Callable, NamedTuple
-
+from typing import Any, Callable, Final, Iterator, NamedTuple
+
+from .datemath import (
+    _select,
+    add_years,
+    add_years_to_ordinal,
+    days_in_month,
+    month_length,
+    month_span_days,
+    month_span_days_from_ordinal,
+    nth_weekday,
+    ordinal_isoweekday,
+    ordinal_to_ymd,
+    shift_month,
+    ymd_to_ordinal,
+)
 from .regex_utils import (
-    IN_N_INTERVALS_PATTERN,
-    MDY_DATE_PATTERN,
+    BOUNDARY_WORDS,
+    LAST_ORDINAL_WORD,
     MONTH_SHORTNAMES,
     NEGATIVE_INTERVAL_WORDS,
     NUMBER_WORDS,
-    QUICK_DAYS_PATTERN,
-    RELATIVE_INTERVAL_PATTERN,
-    RELATIVE_WEEKDAY_PATTERN,
+    ORDINAL_WORDS,
+    PERIOD_SPECIFIERS,
     TIME_INTERVAL_TYPES,
     WEEKDAY_SHORTNAMES,
 )
+from .scanner import ScanMatch
 
 
-class DateTuple(NamedTuple):
-    """Container for data about a matched date expression."""
+class DateTuple:
+    """
+    Container for data about a matched date expression.
 
-    pattern: re.Pattern
-    fields: dict
-    content: str
-    start: int
-    end: int
+    A DateTuple made from a match with from_match keeps the match,
+    which holds only the spans of its groups, and gets fields and content
+    from it when they are asked for, rather than copying out their strings
+    for every match, including those that are never parsed.
+
+    It unpacks, indexes, compares and is replaced like the NamedTuple
+    (pattern, fields, content, start, end, date) it used to be.
+    """
 
-    date: datetime.date | datetime.timedelta | None = None
+    __slots__ = (
+        "pattern",
+        "start",
+        "end",
+        "date",
+        "_match",
+        "_given_fields",
+        "_given_content",
+    )
+
+    _fields: Final = ("pattern", "fields", "content", "start", "end", "date")
+
+    def __init__(
+        self,
+        pattern: re.Pattern,
+        fields: dict,
+        content: str,
+        start: int,
+        end: int,
+        date: datetime.date | datetime.timedelta | None = None,
+    ):
+        self.pattern = pattern
+        self.start = start
+        self.end = end
+        self.date = date
+        self._match: re.Match | ScanMatch | None = None
+        self._given_fields = fields
+        self._given_content = content
+
+    @classmethod
+    def from_match(cls, match: re.Match | ScanMatch) -> "DateTuple":
+        date_tuple = cls.__new__(cls)
+        date_tuple.pattern = match.re
+        date_tuple.start, date_tuple.end = match.span()
+        date_tuple.date = None
+        date_tuple._match = match
+        date_tuple._given_fields = date_tuple._given_content = None
+        return date_tuple
+
+    @property
+    def fields(self) -> dict:
+        if self._match is not None:
+            return self._match.groupdict()
+        return self._given_fields
+
+    @property
+    def content(self) -> str:
+        if self._match is not None:
+            return self._match.group()
+        return self._given_content
+
+    def __iter__(self) -> Iterator:
+        return iter(
+            (self.pattern, self.fields, self.content, self.start, self.end, self.date)
+        )
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        return tuple(self)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (DateTuple, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    # unhashable, as the NamedTuple was for its fields dict
+    __hash__ = None
+
+    def _asdict(self) -> dict[str, Any]:
+        return dict(zip(self._fields, self))
+
+    def _replace(self, **changes: Any) -> "DateTuple":
+        unknown = changes.keys() - set(self._fields)
+        if unknown:
+            raise ValueError(f"Got unexpected field names: {sorted(unknown)!r}")
+        return DateTuple(**{**self._asdict(), **changes})
+
+    def __repr__(self) -> str:
+        return (
+            f"DateTuple(pattern={self.pattern!r}, fields={self.fields!r},"
+            f" content={self.content!r}, start={self.start}, end={self.end},"
+            f" date={self.date!r})"
+        )
 
 
 class DateResult(NamedTuple):
@@ -47,21 +147,6 @@ class ExpressionGrouping(NamedTuple):
     deltas: list[DateTuple]
 
 
-class _MonthInfo(NamedTuple):
-    days: int
-    month_num: int
-    year: int
-
-
-absolute_patterns = [
-    MDY_DATE_PATTERN,
-    IN_N_INTERVALS_PATTERN,
-    RELATIVE_WEEKDAY_PATTERN,
-    QUICK_DAYS_PATTERN,
-]
-relative_patterns = [RELATIVE_INTERVAL_PATTERN]
-
-
 def _normalize_number(number_term: str | None) -> int:
     """
     Converts a number word as a string to an int.
@@ -90,8 +175,13 @@ def _normalize_number(number_term: str | None) -> int:
 def _mdy_parse(date_tuple: DateTuple, base_date: datetime.date) -> datetime.date:
     """Parse function for expressions like "October 10." """
 
-    date_fields: dict[str, Any] = date_tuple.fields
+    month, day, year = _mdy_terms(date_tuple.fields)
+
+    return datetime.date(base_date.year if year is None else year, month, day)
 
+
+def _mdy_terms(date_fields: dict[str, Any]) -> tuple[int, int, int | None]:
+    # the month, day and year (None if not given) of a month and day expression
     month_str: str = date_fields["month"]
     day_str: str = date_fields["day"]
 
@@ -102,11 +192,12 @@ def _mdy_parse(date_tuple: DateTuple, base_date: datetime.date) -> datetime.date
 
     day = int(day_str)
 
-    year = base_date.year
+    year = None
     if "year" in date_fields and date_fields["year"] is not None:
-        year = int(date_fields["year"])
+        # the year field includes the separator before the year, e.g. ", 2024"
+        year = int(date_fields["year"][-4:])
 
-    return datetime.date(year, month, day)
+    return month, day, year
 
 
 def _n_intervals_parse(
@@ -114,16 +205,14 @@ def _n_intervals_parse(
 ) -> datetime.date:
     """Parse function for expressions like "In ten days." """
 
-    date_fields = date_tuple.fields
+    return base_date + datetime.timedelta(days=_n_intervals_days(date_tuple.fields))
 
-    days_num = _normalize_number(date_fields["days_number"])
-    interval_name_str = date_fields["time_interval_name"]
 
-    days_offset = datetime.timedelta(
-        days=TIME_INTERVAL_TYPES[interval_name_str] * days_num
-    )
+def _n_intervals_days(date_fields: dict[str, Any]) -> int:
+    days_num = _normalize_number(date_fields["days_number"])
+    interval_name_str = date_fields["time_interval_name"].lower()
 
-    return base_date + days_offset
+    return TIME_INTERVAL_TYPES[interval_name_str] * days_num
 
 
 def _relative_weekday_parse(
@@ -131,11 +220,7 @@ def _relative_weekday_parse(
 ) -> datetime.date:
     """Parse function for expressions like "this Wednesday" """
 
-    date_fields = date_tuple.fields
-    specifier = date_fields.get("specifier", "")
-    weekday_str = date_fields["weekday_name"]
-
-    weekday_num: int = WEEKDAY_SHORTNAMES.index(weekday_str[:3])
+    specifier, weekday_num = _relative_weekday_terms(date_tuple.fields)
 
     days_delta = weekday_num - base_date.isoweekday()
 
@@ -148,45 +233,24 @@ def _relative_weekday_parse(
     return base_date + datetime.timedelta(days=days_delta)
 
 
-def _quick_day_parse(date_tuple: DateTuple, base_date: datetime.date) -> datetime.date:
-    """Parse function for "today", "tomorrow", "yesterday" """
-    date_fields = date_tuple.fields
-
-    offset = datetime.timedelta(
-        days={"today": 0, "tomorrow": 1, "yesterday": -1}[date_fields["quick_dayname"]]
-    )
-
-    return base_date + offset
-
+def _relative_weekday_terms(date_fields: dict[str, Any]) -> tuple[str, int]:
+    # the specifier ("" if none) and isoweekday of a relative weekday expression
+    specifier = (date_fields.get("specifier") or "").lower()
+    weekday_str = date_fields["weekday_name"].lower()
 
-def _pack_month_info(year_value: int, month_value: int):
-    _, month_days = monthrange(year_value, month_value)
-    return _MonthInfo(month_days, month_value, year_value)
+    return specifier, WEEKDAY_SHORTNAMES.index(weekday_str[:3])
 
 
-def _months_iter(start_date: datetime.date, backward: bool = False):
-    """Iterate by month forward or backward from start_date"""
-    start_month = start_date.month
-    start_year = start_date.year
+_QUICK_DAY_OFFSETS: Final = {"today": 0, "tomorrow": 1, "yesterday": -1}
 
-    month_range_start = 1 if not backward else 12
-    month_range_end = 13 if not backward else 0
-    step = 1 if not backward else -1
-
-    for month, year in zip(
-        repeat(start_year), range(start_month, month_range_end, step)
-    ):
-        yield _pack_month_info(month, year)
 
-    month_year = start_year + step
+def _quick_day_parse(date_tuple: DateTuple, base_date: datetime.date) -> datetime.date:
+    """Parse function for "today", "tomorrow", "yesterday" """
+    quick_dayname = date_tuple.fields["quick_dayname"].lower()
 
-    while datetime.MINYEAR < month_year < datetime.MAXYEAR:
-        for month, year in zip(
-            repeat(month_year), range(month_range_start, month_range_end, step)
-        ):
-            yield _pack_month_info(month, year)
+    offset = datetime.timedelta(days=_QUICK_DAY_OFFSETS[quick_dayname])
 
-        month_year += step
+    return base_date + offset
 
 
 def _month_delta(input_date: datetime.date, months_count: int, backward: bool = False):
@@ -195,8 +259,7 @@ def _month_delta(input_date: datetime.date, months_count: int, backward: bool =
     or before if forward is False.
     """
 
-    delta_list = list(_months_iter(input_date, backward=backward))
-    total_days = sum(month.days for month in delta_list[:months_count])
+    total_days = month_span_days(input_date, months_count, backward=backward)
 
     if backward:
         total_days *= -1
@@ -213,23 +276,10 @@ def _year_delta(
     Accounts for leap years.
     """
 
-    start_year = input_date.year
-    start_month = input_date.month
-    start_day = input_date.day
-
     if backward:
         years_count *= -1
 
-    end_year = start_year + years_count
-
-    # look before you leap!
-    if start_month == 2 and start_day == 29:
-        if not isleap(end_year):
-            start_day -= 1
-
-    end_date = datetime.date(year=end_year, month=start_month, day=start_day)
-
-    return end_date - input_date
+    return add_years(input_date, years_count) - input_date
 
 
 def _relative_interval_parse(
@@ -237,12 +287,9 @@ def _relative_interval_parse(
 ) -> datetime.timedelta:
     """Parse function for expressions like "Four days after", "a week before" """
 
-    date_fields = date_tuple.fields
-    units_count = _normalize_number(date_fields.get("time_unit_count", "one"))
-    interval_name_str = date_fields["time_interval_name"]
-    preposition = date_fields["preposition"]
-
-    negative_interval = preposition in NEGATIVE_INTERVAL_WORDS
+    units_count, interval_name_str, negative_interval = _relative_interval_terms(
+        date_tuple.fields
+    )
 
     if interval_name_str == "month":
         return _month_delta(base_date, units_count, backward=negative_interval)
@@ -260,13 +307,220 @@ def _relative_interval_parse(
     return datetime.timedelta(days=units_count)
 
 
-absolute_functions_index: dict[
-    re.Pattern, Callable[[DateTuple, datetime.date], datetime.date]
-] = {
-    MDY_DATE_PATTERN: _mdy_parse,
-    IN_N_INTERVALS_PATTERN: _n_intervals_parse,
-    RELATIVE_WEEKDAY_PATTERN: _relative_weekday_parse,
-    QUICK_DAYS_PATTERN: _quick_day_parse,
-}
+def _relative_interval_terms(date_fields: dict[str, Any]) -> tuple[int, str, bool]:
+    # the count, interval name and direction of a relative interval expression
+    units_count = _normalize_number(date_fields.get("time_unit_count", "one"))
+    interval_name_str = date_fields["time_interval_name"].lower()
+    preposition = date_fields["preposition"].lower()
+
+    return units_count, interval_name_str, preposition in NEGATIVE_INTERVAL_WORDS
+
+
+_MAX_PERIOD_SEARCH: Final = 13
+
+
+def _normalize_ordinal(ordinal_term: str) -> int:
+    """
+    Converts an ordinal such as "third" or "3rd" to an int,
+    or to -1 for "last".
+    Raises ValueError if not an ordinal.
+    """
+
+    ordinal_term = ordinal_term.strip().lower()
+
+    if ordinal_term == LAST_ORDINAL_WORD:
+        return -1
+
+    if ordinal_term[:-2].isnumeric():
+        return int(ordinal_term[:-2])
+
+    if ordinal_term and ordinal_term in ORDINAL_WORDS:
+        return ORDINAL_WORDS.index(ordinal_term)
+
+    raise ValueError(f"'{ordinal_term}' could not be converted to an ordinal")
+
+
+def _period_bounds(
+    base_date: datetime.date, period: str, offset: int
+) -> tuple[datetime.date, datetime.date]:
+    """
+    Get the first and last day of the period (a week, month, year or month name)
+    offset periods from the one containing base_date.
+    Offsets of a named month move by years.
+    """
+
+    if period == "week":
+        week_start = base_date - datetime.timedelta(days=base_date.isoweekday() - 1)
+        week_start += datetime.timedelta(weeks=offset)
+        return week_start, week_start + datetime.timedelta(days=6)
+
+    if period == "year":
+        year = base_date.year + offset
+        return datetime.date(year, 1, 1), datetime.date(year, 12, 31)
+
+    if period == "month":
+        year, month = shift_month(base_date.year, base_date.month, offset)
+    else:
+        year, month = base_date.year + offset, MONTH_SHORTNAMES.index(period[:3])
+
+    return (
+        datetime.date(year, month, 1),
+        datetime.date(year, month, days_in_month(year, month)),
+    )
+
+
+def _resolve_period_date(
+    base_date: datetime.date,
+    specifier: str,
+    date_in_period: Callable[[int], datetime.date],
+) -> datetime.date:
+    """
+    Pick the period a date falls in from a specifier such as "next".
+    Without a specifier, the date is the next one on or after base_date:
+    the date in the period containing base_date if it is not yet past,
+    otherwise the date in the first following period that has one.
+    """
+
+    if specifier:
+        return date_in_period(PERIOD_SPECIFIERS[specifier])
+
+    # a fifth friday is at most a few months away, so a year of periods suffices
+    for offset in range(_MAX_PERIOD_SEARCH):
+        try:
+            upcoming = date_in_period(offset)
+        except ValueError:
+            continue
+
+        if upcoming >= base_date:
+            return upcoming
+
+    # no such date in any of the periods, e.g. a sixth monday
+    return date_in_period(0)
+
+
+def _period_boundary_parse(
+    date_tuple: DateTuple, base_date: datetime.date
+) -> datetime.date:
+    """Parse function for expressions like "end of the month", "start of next year" """
+
+    date_fields = date_tuple.fields
+    boundary = BOUNDARY_WORDS[date_fields["boundary"].lower()]
+    specifier = (date_fields.get("specifier") or "").lower()
+    period = date_fields["period"].lower()
+
+    def boundary_date(offset: int) -> datetime.date:
+        period_start, period_end = _period_bounds(base_date, period, offset)
+        return period_end if boundary == "end" else period_start
+
+    return _resolve_period_date(base_date, specifier, boundary_date)
+
+
+def _nth_weekday_parse(
+    date_tuple: DateTuple, base_date: datetime.date
+) -> datetime.date:
+    """Parse function for expressions like "the third monday in august" """
+
+    date_fields = date_tuple.fields
+    ordinal = _normalize_ordinal(date_fields["ordinal"])
+    weekday_num = WEEKDAY_SHORTNAMES.index(date_fields["weekday_name"].lower()[:3])
+    specifier = (date_fields.get("specifier") or "").lower()
+    period = (date_fields.get("period") or "month").lower()
+
+    def weekday_date(offset: int) -> datetime.date:
+        month_start, _ = _period_bounds(base_date, period, offset)
+        return nth_weekday(month_start.year, month_start.month, weekday_num, ordinal)
+
+    return _resolve_period_date(base_date, specifier, weekday_date)
+
+
+# Variants of the parse functions on day ordinals, to resolve one expression
+# against many base dates at once. base_ordinals is an int, or a NumPy integer
+# array of them; anchors return ordinals, and deltas a number of days.
+
+
+def _any(condition: Any) -> bool:
+    # whether a condition holds for any of the base dates
+    return bool(condition.any()) if hasattr(condition, "any") else bool(condition)
+
+
+def _mdy_ordinals(date_tuple: DateTuple, base_ordinals: Any) -> Any:
+    month, day, year = _mdy_terms(date_tuple.fields)
+
+    if year is not None:
+        return base_ordinals * 0 + datetime.date(year, month, day).toordinal()
+
+    # raises as datetime.date would, if the day is invalid in any base year
+    if not 1 <= month <= 12 or day < 1:
+        raise ValueError(f"No day {day} in month {month}")
+
+    base_year, _, _ = ordinal_to_ymd(base_ordinals)
+    if _any(day > month_length(base_year, month)):
+        raise ValueError(f"No day {day} in month {month} of every base year")
+
+    return ymd_to_ordinal(base_year, month, day)
+
+
+def _n_intervals_ordinals(date_tuple: DateTuple, base_ordinals: Any) -> Any:
+    return base_ordinals + _n_intervals_days(date_tuple.fields)
+
+
+def _relative_weekday_ordinals(date_tuple: DateTuple, base_ordinals: Any) -> Any:
+    specifier, weekday_num = _relative_weekday_terms(date_tuple.fields)
+
+    # as in _relative_weekday_parse: 1 to 7 days ahead, or 8 to 13 for "next"
+    days_delta = (weekday_num - ordinal_isoweekday(base_ordinals) - 1) % 7 + 1
+
+    if specifier == "next":
+        days_delta = _select(days_delta < 7, days_delta + 7, days_delta)
+
+    return base_ordinals + days_delta
+
+
+def _quick_day_ordinals(date_tuple: DateTuple, base_ordinals: Any) -> Any:
+    quick_dayname = date_tuple.fields["quick_dayname"].lower()
+
+    return base_ordinals + _QUICK_DAY_OFFSETS[quick_dayname]
+
+
+def _relative_interval_days(date_tuple: DateTuple, base_ordinals: Any) -> Any:
+    units_count, interval_name_str, negative_interval = _relative_interval_terms(
+        date_tuple.fields
+    )
+
+    if interval_name_str == "month":
+        total_days = month_span_days_from_ordinal(
+            base_ordinals, units_count, backward=negative_interval
+        )
+        return -total_days if negative_interval else total_days
+
+    if interval_name_str == "year":
+        if negative_interval:
+            units_count *= -1
+        return add_years_to_ordinal(base_ordinals, units_count) - base_ordinals
+
+    if interval_name_str == "week":
+        units_count *= 7
+
+    if negative_interval:
+        units_count *= -1
+
+    return base_ordinals * 0 + units_count
+
+
+def __getattr__(name: str) -> Any:
+    """
+    The dispatch tables of the default grammar and their patterns as lists,
+    as in dateparse.grammar, where they are now defined.
+    """
+    if name in (
+        "absolute_functions_index",
+        "relative_functions_index",
+        "absolute_patterns",
+        "relative_patterns",
+    ):
+        # imported here, since the grammar's rules parse with this module
+        from . import grammar
+
+        return getattr(grammar, name)
 
-relative_functions_index = {RELATIVE_INTERVAL_PATTERN: _relative_interval_parse}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
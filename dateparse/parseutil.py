@@ -3,108 +3,168 @@ import datetime
 import functools as fn
 import itertools as it
 import re
-from typing import Callable, Iterable
+import time
+from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple, Sequence
 
-from .parsefunctions import (
-    DateResult,
-    DateTuple,
-    ExpressionGrouping,
-    absolute_functions_index,
-    relative_functions_index,
-)
+from .cache import LRUCache
+from .columns import EPOCH_ORDINAL, DateColumns, _ColumnBuilder
+from .datemath import add_years
+from .grammar import ANCHOR, DELTA, Grammar, Rule, default_grammar
+from .named_days import NamedDayMatcher, named_days_regex
+from .parsefunctions import DateResult, DateTuple, ExpressionGrouping
+from .prefilter import Prefilter
+from .profiling import ParseStats, _active_stats
+from .scanner import PatternScanner, ScanMatch
 
+_MISSING: Any = object()
 
-def sub_named_days(named_days: dict[str, str], text: str):
+# module-wide caches, shared by all parse functions unless others are passed in:
+# result_cache holds finished results for a text and base date,
+# and expression_cache holds the base-date-independent expressions found in a text
+result_cache = LRUCache(maxsize=4096)
+expression_cache = LRUCache(maxsize=4096)
+
+
+def sub_named_days(named_days: Mapping[str, str] | NamedDayMatcher, text: str):
     """
     Pre-process a string for named days (e.g. holidays)
     Parameters:
-        named_days: dict[str,str]
+        named_days: Mapping[str,str] | NamedDayMatcher
         text: str
 
     Substitutes all substrings in text that match
     a key in named_days for their corresponding value.
     Returns the processed string.
+
+    The parse functions do not need this: passing named_days to them
+    resolves named days in place, keeping offsets into the original text.
+
+    A matcher is compiled for each distinct mapping and reused;
+    pass a NamedDayMatcher to manage that yourself.
     """
-    text = text.lower()
+    matcher = _as_named_day_matcher(named_days, checked=False)
+
+    if matcher is None:
+        return text.lower()
+
+    return matcher.sub(text)
+
 
-    for day_name, repl_str in named_days.items():
-        if day_name in text:
-            text = text.replace(day_name, repl_str)
-    return text
+@fn.lru_cache
+def _get_scanner(
+    pattern_set: tuple[re.Pattern, ...],
+    claiming: frozenset[re.Pattern] = frozenset(),
+) -> PatternScanner:
+    return PatternScanner(pattern_set, claiming=claiming)
 
 
 def _extract_regex_matches(
-    text: str, pattern_set: Iterable[re.Pattern], escape: str = "\\"
-) -> list[re.Match]:
-    match_chain = it.chain.from_iterable(
-        (re.finditer(pattern, text) for pattern in pattern_set)
-    )
+    text: str,
+    pattern_set: Iterable[re.Pattern],
+    escape: str = "\\",
+    claiming: frozenset[re.Pattern] = frozenset(),
+) -> list[ScanMatch]:
+    scanner = _get_scanner(tuple(pattern_set), claiming)
 
     match_list = []
 
-    escape_len = len(escape)
-    for match in match_chain:
-        if match.start() != 0:
-            prior = text[match.start() - escape_len : match.start()]
-        else:
-            prior = match.group()[:escape_len]
+    for match in scanner.finditer(text):
+        if not _is_escaped(text, match, escape):
+            match_list.append(match)
 
-        if prior == escape:
-            continue
+    return match_list
 
-        match_list.append(match)
 
-    return match_list
+def _is_escaped(text: str, match: ScanMatch, escape: str) -> bool:
+    escape_len = len(escape)
+    if match.start() != 0:
+        prior = text[match.start() - escape_len : match.start()]
+    else:
+        prior = match.group()[:escape_len]
 
+    return prior == escape
 
-def _match_to_tuple(match: re.Match) -> DateTuple:
-    return DateTuple(
-        pattern=match.re,
-        content=match.group(),
-        fields=match.groupdict(),
-        start=match.start(),
-        end=match.end(),
-    )
 
+def _match_to_tuple(match: ScanMatch) -> DateTuple:
+    return DateTuple.from_match(match)
 
-def _remove_subgroups(dates: list[DateTuple]) -> list[DateTuple]:
-    # remove any matches fully contained within another match
-    iter_by_three = zip(dates[:-1], dates[1:-1], dates[2:])
-    for first, second, third in iter_by_three:
-        within_prior = second.start >= first.start and second.end <= first.end
-        within_next = second.start >= third.start and second.end <= third.end
 
-        if within_prior or within_next:
-            dates.remove(second)
+def _iter_without_subgroups(dates: Iterable[DateTuple]) -> Iterator[DateTuple]:
+    """
+    Drop every match that lies within another match, in one pass.
+
+    Expects matches in the order given by _ordered_matches: by start,
+    with longer matches first for a shared start. The policy is:
+        - a match whose span is contained in another match's span is dropped,
+          however deeply nested
+        - of matches with identical spans, the first (in pattern order) is kept
+        - matches that only partly overlap are all kept
+
+    Since each kept match ends after every match before it, a match is
+    contained in some earlier match exactly when it ends no later than
+    the furthest end seen so far. The matches kept are in order of both
+    start and end.
+    """
+    furthest_end = -1
+
+    for date_tuple in dates:
+        if date_tuple.end > furthest_end:
+            furthest_end = date_tuple.end
+            yield date_tuple
+
 
-    return dates
+def _remove_subgroups(dates: list[DateTuple]) -> list[DateTuple]:
+    return list(_iter_without_subgroups(dates))
 
 
 def _ordered_matches(dates: list[DateTuple]) -> list[DateTuple]:
-    start_sort = sorted(dates, key=lambda d: d.start)
-    return sorted(start_sort, key=lambda d: d.end)
+    # by start, then enclosing matches before those they enclose;
+    # the sort is stable, so identical spans stay in pattern order
+    return sorted(dates, key=lambda d: (d.start, -d.end))
 
 
-def _make_expression_groups(
-    match_tuples: list[DateTuple], absolute_patterns: set[re.Pattern]
-) -> list[ExpressionGrouping]:
-    all_groups: list[ExpressionGrouping] = []
+def _iter_expression_groups(
+    match_tuples: Iterable[DateTuple], absolute_patterns: set[re.Pattern]
+) -> Iterator[ExpressionGrouping]:
+    # each group is complete, and yielded, as soon as its anchor is seen
     group_deltas: list[DateTuple] = []
 
     for tup in match_tuples:
         if tup.pattern in absolute_patterns:
-            new_expr = ExpressionGrouping(anchor=tup, deltas=group_deltas)
-            all_groups.append(new_expr)
+            yield ExpressionGrouping(anchor=tup, deltas=group_deltas)
             group_deltas = []
             continue
 
-        if not group_deltas:
-            pass
-        else:
-            abs(tup.start - group_deltas[-1].end) <= 1
-
         group_deltas.append(tup)
-    return all_groups
+
+
+def _make_expression_groups(
+    match_tuples: list[DateTuple], absolute_patterns: set[re.Pattern]
+) -> list[ExpressionGrouping]:
+    return list(_iter_expression_groups(match_tuples, absolute_patterns))
+
+
+def _find_match_tuples(
+    text: str,
+    pattern_set: Iterable[re.Pattern],
+    escape: str = "\\",
+    named_patterns: frozenset[re.Pattern] = frozenset(),
+) -> list[DateTuple]:
+    # find all regex matches, convert to DateTuple objects
+    # and sort by occurrence in the string
+
+    regex_matches = _extract_regex_matches(
+        text, pattern_set, escape=escape, claiming=named_patterns
+    )
+
+    return _to_ordered_tuples(regex_matches)
+
+
+def _to_ordered_tuples(regex_matches: list[ScanMatch]) -> list[DateTuple]:
+    match_tuples = [_match_to_tuple(match) for match in regex_matches]
+    match_tuples = _ordered_matches(match_tuples)
+
+    return _remove_subgroups(match_tuples)
 
 
 def _partial_preprocess_input(
@@ -112,31 +172,59 @@ def _partial_preprocess_input(
     absolute_patterns: Iterable[re.Pattern] | None = None,
     relative_patterns: Iterable[re.Pattern] | None = None,
     escape: str = "\\",
+    named_patterns: frozenset[re.Pattern] = frozenset(),
+    rule_patterns: Mapping[str, re.Pattern] = {},
 ) -> list[ExpressionGrouping]:
+    """
+    Find the expressions in text.
+    While a ParseStats is active, each stage is timed, and each match
+    counted under its name in rule_patterns (or else its pattern).
+    """
     if absolute_patterns is None or relative_patterns is None:
         raise ValueError
 
-    # find all regex matches, convert to DateTuple objects
-    # and sort by occurrence in the string
+    stats = _active_stats.get()
+    if stats is not None:
+        started = time.perf_counter()
 
     pattern_set = list(it.chain(absolute_patterns, relative_patterns))
-    regex_matches = _extract_regex_matches(text, pattern_set)
+    regex_matches = _extract_regex_matches(
+        text, pattern_set, escape=escape, claiming=named_patterns
+    )
 
-    # regex_matches = [m for m in regex_matches if text[m.start() - 1] != escape]
+    if stats is not None:
+        extracted = time.perf_counter()
 
-    match_tuples = [_match_to_tuple(match) for match in regex_matches]
-    match_tuples = _ordered_matches(match_tuples)
+    match_tuples = _to_ordered_tuples(regex_matches)
 
-    match_tuples = _remove_subgroups(match_tuples)
+    if stats is not None:
+        ordered = time.perf_counter()
 
-    return _make_expression_groups(match_tuples, set(absolute_patterns))
+    groups = _make_expression_groups(match_tuples, set(absolute_patterns))
 
+    if stats is not None:
+        grouped = time.perf_counter()
+        rule_names = {pattern: name for name, pattern in rule_patterns.items()}
+        stats.record_scan(
+            len(text),
+            [
+                ("extract", extracted - started),
+                ("order", ordered - extracted),
+                ("group", grouped - ordered),
+            ],
+            [rule_names.get(match.re, match.re.pattern) for match in regex_matches],
+        )
 
-preprocess_input: Callable[[str], list[ExpressionGrouping]] = fn.partial(
-    _partial_preprocess_input,
-    absolute_patterns=absolute_functions_index.keys(),
-    relative_patterns=relative_functions_index.keys(),
-)
+    return groups
+
+
+def preprocess_input(text: str, escape: str = "\\") -> list[ExpressionGrouping]:
+    return _partial_preprocess_input(
+        text,
+        absolute_patterns=default_grammar.absolute_index.keys(),
+        relative_patterns=default_grammar.relative_index.keys(),
+        escape=escape,
+    )
 
 
 def _partial_parse_expression_group(
@@ -162,14 +250,269 @@ def _partial_parse_expression_group(
     return anchor_date + delta_sum
 
 
-parse_expression_group: Callable[
-    [datetime.date, ExpressionGrouping],
-    datetime.date,
-] = fn.partial(
-    _partial_parse_expression_group,
-    abs_index=absolute_functions_index,
-    rel_index=relative_functions_index,
-)
+def parse_expression_group(
+    base_date: datetime.date, expr_group: ExpressionGrouping
+) -> datetime.date:
+    return _partial_parse_expression_group(
+        base_date,
+        expr_group,
+        abs_index=default_grammar.absolute_index,
+        rel_index=default_grammar.relative_index,
+    )
+
+
+class _ParseEngine(NamedTuple):
+    """The patterns to search text for, and the functions that parse their matches."""
+
+    absolute_index: dict[re.Pattern, Callable[[DateTuple, datetime.date], Any]]
+    relative_index: dict[re.Pattern, Callable[[DateTuple, datetime.date], Any]]
+    named_patterns: frozenset[re.Pattern] = frozenset()
+    prefilter: Prefilter | None = None
+    bulk_index: Mapping[re.Pattern, Callable[[DateTuple, Any], Any]] = {}
+    # the pattern of each rule, by rule name
+    patterns: Mapping[str, re.Pattern] = {}
+
+    def preprocess(self, text: str, escape: str = "\\") -> list[ExpressionGrouping]:
+        stats = _active_stats.get()
+        if stats is not None:
+            started = time.perf_counter()
+
+        if self.prefilter is not None and not self.prefilter.might_match(text):
+            if stats is not None:
+                prefilter_seconds = time.perf_counter() - started
+                stats.record_scan(len(text), [("prefilter", prefilter_seconds)], ())
+            return []
+
+        if stats is not None:
+            stats.record_stage("prefilter", time.perf_counter() - started)
+
+        return _partial_preprocess_input(
+            text,
+            absolute_patterns=self.absolute_index.keys(),
+            relative_patterns=self.relative_index.keys(),
+            escape=escape,
+            named_patterns=self.named_patterns,
+            rule_patterns=self.patterns,
+        )
+
+    def parse_group(
+        self, base_date: datetime.date, expr_group: ExpressionGrouping
+    ) -> datetime.date:
+        return _partial_parse_expression_group(
+            base_date,
+            expr_group,
+            abs_index=self.absolute_index,
+            rel_index=self.relative_index,
+        )
+
+    @classmethod
+    def from_grammar(cls, grammar: Grammar) -> "_ParseEngine":
+        return cls(
+            grammar.absolute_index,
+            grammar.relative_index,
+            grammar.claiming_patterns,
+            grammar.prefilter,
+            grammar.bulk_index,
+            grammar.patterns,
+        )
+
+
+@fn.cache
+def _get_default_engine() -> _ParseEngine:
+    # made on first use, as compiling the default grammar is
+    # most of the cost of importing the package
+    return _ParseEngine.from_grammar(default_grammar)
+
+
+def _classify_named_day(value: str) -> tuple[str, Any] | None:
+    """
+    Parse the value of a named day, and tell what it stands for:
+    ("anchor", group) for a date, ("month_day", group) for a plain month and day
+    (which may be followed by a year in the text), or ("delta", tuples)
+    for only a relative interval (such as "a week after").
+    None if the value is not a single date expression.
+    """
+    absolute_index = default_grammar.absolute_index
+    default_patterns = [*absolute_index, *default_grammar.relative_index]
+
+    value_tuples = _find_match_tuples(value, default_patterns)
+    value_groups = _make_expression_groups(value_tuples, set(absolute_index))
+    grouped_count = sum(len(group.deltas) + 1 for group in value_groups)
+
+    if len(value_groups) == 1 and grouped_count == len(value_tuples):
+        value_group = value_groups[0]
+        is_month_day = (
+            not value_group.deltas
+            and value_group.anchor.pattern is default_grammar.patterns["month_day"]
+            and value_group.anchor.fields["year"] is None
+            and value_group.anchor.end == len(value)
+        )
+        return ("month_day" if is_month_day else "anchor"), value_group
+
+    if value_tuples and not value_groups:
+        return "delta", value_tuples
+
+    return None
+
+
+def _check_named_days(named_days: Mapping[str, str]) -> None:
+    """
+    Raise ValueError if the value of a named day is not a single date expression.
+    """
+    for name, value in named_days.items():
+        if name and _classify_named_day(value) is None:
+            raise ValueError(
+                f"Named day '{name}' must stand for a single date expression,"
+                f" but '{value}' could not be parsed as one"
+            )
+
+
+def _classify_named_days(
+    named_days: NamedDayMatcher,
+) -> tuple[
+    dict[str, ExpressionGrouping],
+    dict[str, ExpressionGrouping],
+    dict[str, list[DateTuple]],
+]:
+    """
+    Sort the names into those standing for a date, a month and day,
+    or only a relative interval, with the parsed value of each.
+    Names whose values are not date expressions are left out,
+    so that they are only substituted (see _check_named_days).
+    """
+    classified: dict[str, dict] = {"anchor": {}, "month_day": {}, "delta": {}}
+
+    for name, value in named_days.named_days.items():
+        if not name:
+            continue
+
+        classification = _classify_named_day(value)
+        if classification is not None:
+            kind, parsed_value = classification
+            classified[kind][name] = parsed_value
+
+    return classified["anchor"], classified["month_day"], classified["delta"]
+
+
+@fn.lru_cache(maxsize=32)
+def _get_engine(named_days: NamedDayMatcher | None) -> _ParseEngine:
+    """
+    Get the engine that also finds the given named days in text.
+    Each named day is matched as a pattern of its own and resolved in place,
+    by parsing the expression it stands for, so offsets into the text are kept.
+    """
+    if named_days is None or not any(named_days.named_days):
+        return _get_default_engine()
+
+    anchors, month_day_anchors, deltas = _classify_named_days(named_days)
+    if not (anchors or month_day_anchors or deltas):
+        return _get_default_engine()
+    all_anchors = {**anchors, **month_day_anchors}
+
+    def parse_named_anchor(
+        date_tuple: DateTuple, base_date: datetime.date
+    ) -> datetime.date:
+        value_group = all_anchors[date_tuple.fields["named_day"].lower()]
+
+        # a year after the name applies to the month and day it stands for
+        year = date_tuple.fields.get("year")
+        if year is not None:
+            value_anchor = value_group.anchor
+            value_group = ExpressionGrouping(
+                anchor=DateTuple(
+                    value_anchor.pattern,
+                    {**value_anchor.fields, "year": year},
+                    value_anchor.content,
+                    value_anchor.start,
+                    value_anchor.end,
+                ),
+                deltas=value_group.deltas,
+            )
+
+        return parse_expression_group(base_date, value_group)
+
+    def parse_named_delta(
+        date_tuple: DateTuple, base_date: datetime.date
+    ) -> datetime.timedelta:
+        delta_sum = datetime.timedelta(days=0)
+        for delta in deltas[date_tuple.fields["named_day"].lower()]:
+            delta_sum += default_grammar.relative_index[delta.pattern](
+                delta, base_date
+            )
+        return delta_sum
+
+    named_rules = []
+    if anchors:
+        named_rules.append(
+            _named_day_rule("named_day", ANCHOR, anchors, parse_named_anchor)
+        )
+    if month_day_anchors:
+        named_rules.append(
+            _named_day_rule(
+                "named_month_day",
+                ANCHOR,
+                month_day_anchors,
+                parse_named_anchor,
+                with_year=True,
+            )
+        )
+    if deltas:
+        named_rules.append(
+            _named_day_rule("named_interval", DELTA, deltas, parse_named_delta)
+        )
+
+    return _ParseEngine.from_grammar(default_grammar.extend(named_rules))
+
+
+def _named_day_rule(
+    name: str,
+    kind: str,
+    named_days: Mapping[str, Any],
+    parse: Callable[[DateTuple, datetime.date], Any],
+    with_year: bool = False,
+) -> Rule:
+    # phrases of the form "christmas", "my birthday", matching any of the names.
+    # with_year allows a year right after the name, as for named days
+    # standing for a month and day
+    names_template = named_days_regex(named_days).replace("$", "$$")
+    year_template = "${named_day_year}" if with_year else ""
+
+    return Rule(
+        name,
+        kind,
+        "(?P<named_day>" + names_template + ")" + year_template,
+        parse,
+        claims=True,
+        trigger=names_template,
+    )
+
+
+@fn.lru_cache(maxsize=16)
+def _get_named_day_matcher(
+    named_day_items: tuple[tuple[str, str], ...], checked: bool = True
+):
+    named_days = dict(named_day_items)
+    if checked:
+        # each distinct mapping is checked once, when first used
+        _check_named_days(named_days)
+    return NamedDayMatcher(named_days)
+
+
+def _as_named_day_matcher(
+    named_days: Mapping[str, str] | NamedDayMatcher | None, checked: bool = True
+) -> NamedDayMatcher | None:
+    """
+    Get the matcher for named days given as a mapping.
+    If checked, raises ValueError if a value is not a date expression,
+    as parsing needs them to be; substituting does not.
+    """
+    if named_days is None or isinstance(named_days, NamedDayMatcher):
+        return named_days
+
+    if not named_days:
+        return None
+
+    return _get_named_day_matcher(tuple(named_days.items()), checked)
 
 
 def _get_expression_span(expr: ExpressionGrouping):
@@ -181,37 +524,148 @@ def _get_expression_span(expr: ExpressionGrouping):
     return (expr_start, expr.anchor.end)
 
 
-def _reduce_expression(
-    base_date: datetime.date, expr: ExpressionGrouping, allow_past: bool = False
-):
-    deltas = expr.deltas
-    anchor = expr.anchor
+def _get_expression_content(expr: ExpressionGrouping) -> str:
+    delta_content = " ".join([delta_tup.content.strip() for delta_tup in expr.deltas])
+    return delta_content + " " + expr.anchor.content.strip()
+
 
-    resulting_date = parse_expression_group(base_date, expr)
+def _resolve_date(
+    base_date: datetime.date,
+    expr: ExpressionGrouping,
+    allow_past: bool,
+    engine: _ParseEngine,
+) -> datetime.date:
+    stats = _active_stats.get()
+    if stats is not None:
+        started = time.perf_counter()
+
+    resulting_date = engine.parse_group(base_date, expr)
 
     if resulting_date.toordinal() < base_date.toordinal() and not allow_past:
-        bumped_year = resulting_date.year + 1
-        resulting_date = resulting_date.replace(year=bumped_year)
+        # February 29th is bumped to February 28th
+        resulting_date = add_years(resulting_date, 1)
 
-    start, end = _get_expression_span(expr)
+    if stats is not None:
+        stats.record_stage("resolve", time.perf_counter() - started)
 
-    delta_content = " ".join([delta_tup.content.strip() for delta_tup in deltas])
-    anchor_content = anchor.content.strip()
+    return resulting_date
 
-    expr_content = delta_content + " " + anchor_content
+
+def _reduce_expression(
+    base_date: datetime.date,
+    expr: ExpressionGrouping,
+    allow_past: bool = False,
+    engine: _ParseEngine | None = None,
+    shared: dict | None = None,
+):
+    """
+    Resolve an expression to a DateResult.
+    If shared is given, equal dates and contents of results made with it
+    are the same objects, as for repeated expressions in one document.
+    """
+    if engine is None:
+        engine = _get_default_engine()
+
+    resulting_date = _resolve_date(base_date, expr, allow_past, engine)
+
+    start, end = _get_expression_span(expr)
+    expr_content = _get_expression_content(expr)
+
+    if shared is not None:
+        resulting_date = shared.setdefault(resulting_date, resulting_date)
+        expr_content = shared.setdefault(expr_content, expr_content)
 
     new_date_result = DateResult(resulting_date, start, end, expr_content)
 
     return new_date_result
 
 
-@fn.cache
+def _cached_call(
+    cache: LRUCache,
+    cache_key: tuple,
+    func: Callable[..., Any],
+    *args: Any,
+    cache_name: str = "result",
+) -> Any:
+    """
+    Get the value for cache_key, or compute it as func(*args) and store it.
+    The lookup is counted as a hit or miss of cache_name in the active ParseStats.
+    """
+    result = cache.get(cache_key, _MISSING)
+
+    stats = _active_stats.get()
+    if stats is not None:
+        stats.record_cache(cache_name, result is not _MISSING)
+
+    if result is _MISSING:
+        result = func(*args)
+        cache.put(cache_key, result)
+
+    return result
+
+
+def _result_key(
+    kind: str,
+    base_date: datetime.date,
+    text: str,
+    from_right: bool,
+    allow_past: bool,
+    escape: str,
+    named_days: NamedDayMatcher | None,
+) -> tuple:
+    # the key of a basic_parse ("basic_parse") or parse_all ("parse_all") result
+    return (kind, base_date, text, from_right, allow_past, escape, named_days)
+
+
+def _get_expressions(
+    text: str,
+    escape: str,
+    named_days: NamedDayMatcher | None,
+    group_cache: LRUCache | None,
+) -> tuple[ExpressionGrouping, ...]:
+    # expression groups depend only on the text,
+    # so they are shared between calls with any base date
+    if group_cache is None:
+        group_cache = expression_cache
+
+    return _cached_call(
+        group_cache,
+        (text, escape, named_days),
+        lambda: tuple(_get_engine(named_days).preprocess(text, escape=escape)),
+        cache_name="expression",
+    )
+
+
+def _basic_parse(
+    base_date: datetime.date,
+    text: str,
+    from_right: bool,
+    allow_past: bool,
+    escape: str,
+    named_days: NamedDayMatcher | None,
+    group_cache: LRUCache | None,
+) -> DateResult | None:
+    expressions = _get_expressions(text, escape, named_days, group_cache)
+
+    if not expressions:
+        return None
+
+    target_expr = expressions[-1] if from_right else expressions[0]
+
+    return _reduce_expression(
+        base_date, target_expr, allow_past=allow_past, engine=_get_engine(named_days)
+    )
+
+
 def basic_parse(
     base_date: datetime.date,
     text: str,
     from_right: bool = False,
     allow_past: bool = False,
     escape: str = "\\",
+    named_days: Mapping[str, str] | NamedDayMatcher | None = None,
+    cache: LRUCache | None = None,
+    group_cache: LRUCache | None = None,
 ):
     """
     Get a single date expression from a string, and return it as a DateResult tuple.
@@ -242,19 +696,47 @@ def basic_parse(
             One or more chars that signify the
             parser should ignore the following sequence
 
+        named_days: Mapping[str, str] | NamedDayMatcher | None
+            Names to recognize as dates, e.g. {"my birthday": "june 11"}.
+            Each name must stand for a single date expression,
+            and is matched without case wherever it appears in the text.
+            Results refer to the text as given: a DateResult for
+            "a week after my birthday" spans and contains the name itself.
+
+        cache: LRUCache | None
+            The cache results are stored in and looked up from.
+            Defaults to the module-wide result_cache.
+
+        group_cache: LRUCache | None
+            The cache for the expressions found in a text, before they are
+            resolved against base_date. This lets a text that was already seen
+            be parsed against a new base date without being scanned again.
+            Defaults to the module-wide expression_cache.
+
     Returns a DateResult tuple, a typed NamedTuple with fields
     for the date value, start and end indices, and matched substring.
     If no valid expression  was found, returns None
 
     """
-    expressions = preprocess_input(text, escape=escape)
-
-    if not expressions:
-        return None
-
-    target_expr = expressions[-1] if from_right else expressions[0]
-
-    return _reduce_expression(base_date, target_expr, allow_past=allow_past)
+    if cache is None:
+        cache = result_cache
+
+    named_days = _as_named_day_matcher(named_days)
+
+    return _cached_call(
+        cache,
+        _result_key(
+            "basic_parse", base_date, text, from_right, allow_past, escape, named_days
+        ),
+        _basic_parse,
+        base_date,
+        text,
+        from_right,
+        allow_past,
+        escape,
+        named_days,
+        group_cache,
+    )
 
 
 def basic_date_parse(
@@ -263,10 +745,20 @@ def basic_date_parse(
     from_right: bool = False,
     allow_past: bool = False,
     escape: str = "\\",
+    named_days: Mapping[str, str] | NamedDayMatcher | None = None,
+    cache: LRUCache | None = None,
+    group_cache: LRUCache | None = None,
 ):
     """Same as basic_parse, but returns the date directly."""
     parsed_tuple = basic_parse(
-        base_date, text, from_right=from_right, allow_past=allow_past, escape=escape
+        base_date,
+        text,
+        from_right=from_right,
+        allow_past=allow_past,
+        escape=escape,
+        named_days=named_days,
+        cache=cache,
+        group_cache=group_cache,
     )
 
     if parsed_tuple is None:
@@ -275,32 +767,79 @@ def basic_date_parse(
     return parsed_tuple.date
 
 
-@fn.cache
-def parse_all(
+def _parse_all(
     base_date: datetime.date,
     text: str,
-    from_right: bool = False,
-    allow_past: bool = False,
-    escape: str = "\\",
-):
-    """Get _all_ matched expressions as a list of DateResult tuples."""
+    from_right: bool,
+    allow_past: bool,
+    escape: str,
+    named_days: NamedDayMatcher | None,
+    group_cache: LRUCache | None,
+) -> list[DateResult] | None:
+    expressions = _get_expressions(text, escape, named_days, group_cache)
+    return _reduce_all_expressions(
+        base_date, expressions, from_right, allow_past, _get_engine(named_days)
+    )
 
-    expressions = preprocess_input(text, escape=escape)
 
+def _reduce_all_expressions(
+    base_date: datetime.date,
+    expressions: Sequence[ExpressionGrouping],
+    from_right: bool,
+    allow_past: bool,
+    engine: _ParseEngine,
+    shared: dict | None = None,
+) -> list[DateResult] | None:
     if not expressions:
         return None
 
     if from_right:
-        expressions.reverse()
+        expressions = expressions[::-1]
+
+    if shared is None:
+        shared = {}
 
     date_tuple_results = [
-        _reduce_expression(base_date, expr, allow_past=allow_past)
+        _reduce_expression(
+            base_date, expr, allow_past=allow_past, engine=engine, shared=shared
+        )
         for expr in expressions
     ]
 
     return date_tuple_results
 
 
+def parse_all(
+    base_date: datetime.date,
+    text: str,
+    from_right: bool = False,
+    allow_past: bool = False,
+    escape: str = "\\",
+    named_days: Mapping[str, str] | NamedDayMatcher | None = None,
+    cache: LRUCache | None = None,
+    group_cache: LRUCache | None = None,
+):
+    """Get _all_ matched expressions as a list of DateResult tuples."""
+    if cache is None:
+        cache = result_cache
+
+    named_days = _as_named_day_matcher(named_days)
+
+    return _cached_call(
+        cache,
+        _result_key(
+            "parse_all", base_date, text, from_right, allow_past, escape, named_days
+        ),
+        _parse_all,
+        base_date,
+        text,
+        from_right,
+        allow_past,
+        escape,
+        named_days,
+        group_cache,
+    )
+
 
 def parse_all_dates(
     base_date: datetime.date,
@@ -308,6 +847,9 @@ def parse_all_dates(
     from_right: bool = False,
     allow_past: bool = False,
     escape: str = "\\",
+    named_days: Mapping[str, str] | NamedDayMatcher | None = None,
+    cache: LRUCache | None = None,
+    group_cache: LRUCache | None = None,
 ):
     """
     Variant of parse_all that returns a list of datetime.date objects
@@ -315,10 +857,174 @@ def parse_all_dates(
     """
 
     parsed_tuples = parse_all(
-        base_date, text, from_right=from_right, allow_past=allow_past, escape=escape
+        base_date,
+        text,
+        from_right=from_right,
+        allow_past=allow_past,
+        escape=escape,
+        named_days=named_days,
+        cache=cache,
+        group_cache=group_cache,
     )
 
     if parsed_tuples is None:
         return None
 
     return [tup.date for tup in parsed_tuples]
+
+
+def parse_many(
+    base_date: datetime.date | Sequence[datetime.date],
+    texts: Iterable[str],
+    from_right: bool = False,
+    allow_past: bool = False,
+    escape: str = "\\",
+    named_days: Mapping[str, str] | NamedDayMatcher | None = None,
+    output: str = "results",
+    return_exceptions: bool = False,
+) -> list[list[DateResult] | ValueError | OverflowError | None] | DateColumns:
+    """
+    Batch variant of parse_all: get all matched expressions in each of many texts.
+
+    Parameters:
+
+        base_date: datetime.date | Sequence[datetime.date]
+            Either one base date to use for every text,
+            or a sequence with one base date per text.
+
+        texts: Iterable[str]
+            The input texts to be processed.
+
+        from_right, allow_past, escape, named_days:
+            As for parse_all, applied to every text.
+
+        output: str
+            "results" (the default) for DateResult tuples, or "columns"
+            for the same dates as DateColumns: parallel arrays of text index,
+            start, end and date, without a Python object per date.
+            The columns are NumPy arrays if NumPy is installed.
+
+        return_exceptions: bool
+            If true, a text with a date that cannot be resolved,
+            such as "february 29" against a base date in 2023, gets the
+            ValueError (or OverflowError, for a date far out of range)
+            in place of its results, rather than it being raised.
+            Only for "results" output.
+
+    Returns, for "results", a list with one entry per input text, in input order:
+    the list of DateResult tuples parse_all would return for that text,
+    or None if no expression was found in it.
+
+    Each distinct text is only scanned once per call, and each distinct
+    (text, base date) pair is only resolved once, and equal dates and contents
+    are shared between the results. The module-wide caches
+    are bypassed, so large batches do not evict other cached results;
+    pass very large inputs in chunks to bound the memory used for deduplication.
+    """
+    if output not in ("results", "columns"):
+        raise ValueError(f"Unknown output '{output}', expected 'results' or 'columns'")
+    if return_exceptions and output != "results":
+        raise ValueError("return_exceptions is only supported for 'results' output")
+
+    texts = list(texts)
+    engine = _get_engine(_as_named_day_matcher(named_days))
+
+    if isinstance(base_date, datetime.date):
+        base_dates: Iterable[datetime.date] = it.repeat(base_date)
+    else:
+        base_dates = list(base_date)
+        if len(base_dates) != len(texts):
+            raise ValueError(
+                f"Got {len(base_dates)} base dates for {len(texts)} texts"
+            )
+
+    if output == "columns":
+        builder = _ColumnBuilder()
+        all_rows = _resolve_batch(
+            texts,
+            base_dates,
+            escape,
+            engine,
+            lambda text_base_date, expressions: _expression_rows(
+                text_base_date, expressions, from_right, allow_past, engine
+            ),
+        )
+        for text_index, rows in enumerate(all_rows):
+            builder.add_rows(text_index, rows)
+
+        return builder.build()
+
+    # equal dates and contents are shared by the results for every text
+    shared: dict = {}
+
+    return _resolve_batch(
+        texts,
+        base_dates,
+        escape,
+        engine,
+        lambda text_base_date, expressions: _reduce_all_expressions(
+            text_base_date, expressions, from_right, allow_past, engine, shared
+        ),
+        return_exceptions,
+    )
+
+
+def _resolve_batch(
+    texts: list[str],
+    base_dates: Iterable[datetime.date],
+    escape: str,
+    engine: _ParseEngine,
+    resolve: Callable[[datetime.date, tuple[ExpressionGrouping, ...]], Any],
+    return_exceptions: bool = False,
+) -> list:
+    """
+    Get resolve(base date, expressions) for each text and its base date,
+    scanning each distinct text and resolving each distinct pair only once.
+    If return_exceptions is true, a ValueError or OverflowError from resolve
+    is returned in place of the text's result.
+    """
+    expressions_by_text: dict[str, tuple[ExpressionGrouping, ...]] = {}
+    resolved_by_key: dict[tuple[str, datetime.date], Any] = {}
+
+    all_resolved = []
+    for text, text_base_date in zip(texts, base_dates):
+        resolved_key = (text, text_base_date)
+
+        resolved = resolved_by_key.get(resolved_key, _MISSING)
+        if resolved is _MISSING:
+            expressions = expressions_by_text.get(text)
+            if expressions is None:
+                expressions = tuple(engine.preprocess(text, escape=escape))
+                expressions_by_text[text] = expressions
+
+            try:
+                resolved = resolve(text_base_date, expressions)
+            except (ValueError, OverflowError) as error:
+                if not return_exceptions:
+                    raise
+                resolved = error
+            resolved_by_key[resolved_key] = resolved
+
+        all_resolved.append(resolved)
+
+    return all_resolved
+
+
+def _expression_rows(
+    base_date: datetime.date,
+    expressions: Sequence[ExpressionGrouping],
+    from_right: bool,
+    allow_past: bool,
+    engine: _ParseEngine,
+) -> list[tuple[int, int, int]]:
+    # (start, end, days since 1970-01-01) for each expression, for DateColumns
+    if from_right:
+        expressions = expressions[::-1]
+
+    rows = []
+    for expr in expressions:
+        start, end = _get_expression_span(expr)
+        resulting_date = _resolve_date(base_date, expr, allow_past, engine)
+        rows.append((start, end, resulting_date.toordinal() - EPOCH_ORDINAL))
+
+    return rows
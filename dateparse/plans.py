@@ -0,0 +1,208 @@
+"""
+Defines ParsePlan, the date expressions found in a text,
+kept so that they can be resolved against any base date without the text
+being scanned again, and saved with pickle or as JSON.
+"""
+import datetime
+from typing import Any, Mapping, NamedTuple
+
+from .named_days import NamedDayMatcher
+from .parsefunctions import DateResult, DateTuple, ExpressionGrouping
+from .parseutil import (
+    _as_named_day_matcher,
+    _get_engine,
+    _get_expression_content,
+    _get_expression_span,
+    _ParseEngine,
+    _resolve_date,
+)
+
+# the version of the format of ParsePlan.to_dict
+PLAN_FORMAT = 1
+
+
+class PlanStep(NamedTuple):
+    """One matched expression in a plan, as the rule that matched and its fields."""
+
+    rule: str
+    start: int
+    end: int
+    content: str
+    fields: dict[str, str | None]
+
+
+class ParsePlan:
+    """
+    The date expressions in a text, ready to be resolved against a base date.
+
+    A plan holds what parsing a text finds before a base date is needed:
+    each expression's anchor and deltas, as the rule that matched them
+    and their fields. Resolving a plan only runs the parse functions,
+    so a template text can be compiled once and resolved many times.
+
+    from_text(text: str, escape: str = "\\", named_days=None) -> ParsePlan
+        Compile the plan for a text, as DateParser.compile does.
+
+    get_first(base_date, allow_past=False) -> DateResult | None
+    get_last(base_date, allow_past=False) -> DateResult | None
+    get_all(base_date, from_right=False, allow_past=False) -> list[DateResult] | None
+        The results basic_parse and parse_all would return for the text.
+
+    to_dict() -> dict
+    from_dict(data: dict) -> ParsePlan
+        Convert to and from a dict of plain values, which json can save.
+        Plans can also be pickled.
+
+    The named days a plan uses are saved with it, and no others.
+    Loading a plan saved with an incompatible version of dateparse
+    raises ValueError.
+    """
+
+    __slots__ = ("steps", "named_days", "_engine", "_expressions", "_spans")
+
+    def __init__(
+        self,
+        steps: tuple[tuple[PlanStep, ...], ...],
+        named_days: Mapping[str, str] | None = None,
+    ):
+        # each expression's steps are its deltas, in order, followed by its anchor
+        self.steps = tuple(tuple(PlanStep(*step) for step in expr) for expr in steps)
+        self.named_days = dict(named_days or {})
+
+        self._engine = _get_engine(_as_named_day_matcher(self.named_days))
+        self._expressions = tuple(
+            _expression_from_steps(self._engine, expr) for expr in self.steps
+        )
+        self._spans = tuple(
+            (*_get_expression_span(expr), _get_expression_content(expr))
+            for expr in self._expressions
+        )
+
+    @classmethod
+    def from_text(
+        cls,
+        text: str,
+        escape: str = "\\",
+        named_days: Mapping[str, str] | NamedDayMatcher | None = None,
+    ) -> "ParsePlan":
+        matcher = _as_named_day_matcher(named_days)
+        engine = _get_engine(matcher)
+        rule_names = {pattern: name for name, pattern in engine.patterns.items()}
+
+        steps = []
+        used_names = {}
+        for expr in engine.preprocess(text, escape=escape):
+            expr_steps = []
+            for date_tuple in (*expr.deltas, expr.anchor):
+                fields = date_tuple.fields
+                if "named_day" in fields:
+                    name = fields["named_day"].lower()
+                    used_names[name] = matcher.named_days[name]
+
+                expr_steps.append(
+                    PlanStep(
+                        rule_names[date_tuple.pattern],
+                        date_tuple.start,
+                        date_tuple.end,
+                        date_tuple.content,
+                        fields,
+                    )
+                )
+            steps.append(tuple(expr_steps))
+
+        return cls(tuple(steps), used_names)
+
+    def _resolve(
+        self, index: int, base_date: datetime.date, allow_past: bool
+    ) -> DateResult:
+        resulting_date = _resolve_date(
+            base_date, self._expressions[index], allow_past, self._engine
+        )
+        return DateResult(resulting_date, *self._spans[index])
+
+    def get_first(
+        self, base_date: datetime.date, allow_past: bool = False
+    ) -> DateResult | None:
+        if not self._expressions:
+            return None
+        return self._resolve(0, base_date, allow_past)
+
+    def get_last(
+        self, base_date: datetime.date, allow_past: bool = False
+    ) -> DateResult | None:
+        if not self._expressions:
+            return None
+        return self._resolve(-1, base_date, allow_past)
+
+    def get_all(
+        self,
+        base_date: datetime.date,
+        from_right: bool = False,
+        allow_past: bool = False,
+    ) -> list[DateResult] | None:
+        if not self._expressions:
+            return None
+
+        indexes = range(len(self._expressions))
+        if from_right:
+            indexes = indexes[::-1]
+
+        return [self._resolve(index, base_date, allow_past) for index in indexes]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": PLAN_FORMAT,
+            "named_days": dict(self.named_days),
+            "expressions": [
+                [step._asdict() for step in expr_steps] for expr_steps in self.steps
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ParsePlan":
+        if data.get("format") != PLAN_FORMAT:
+            raise ValueError(
+                f"Plan has format {data.get('format')!r}, expected {PLAN_FORMAT}"
+            )
+
+        steps = tuple(
+            tuple(PlanStep(**step) for step in expr_steps)
+            for expr_steps in data["expressions"]
+        )
+        return cls(steps, data["named_days"])
+
+    def __reduce__(self):
+        return (type(self), (self.steps, self.named_days))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParsePlan):
+            return NotImplemented
+        return self.steps == other.steps and self.named_days == other.named_days
+
+    def __repr__(self) -> str:
+        return f"ParsePlan(steps={self.steps!r}, named_days={self.named_days!r})"
+
+
+def _expression_from_steps(
+    engine: _ParseEngine, steps: tuple[PlanStep, ...]
+) -> ExpressionGrouping:
+    if not steps:
+        raise ValueError("A planned expression must have an anchor")
+
+    date_tuples = []
+    for step in steps:
+        pattern = engine.patterns.get(step.rule)
+        if pattern is None:
+            raise ValueError(f"Plan uses unknown rule '{step.rule}'")
+
+        date_tuples.append(
+            DateTuple(pattern, dict(step.fields), step.content, step.start, step.end)
+        )
+
+    *deltas, anchor = date_tuples
+    if anchor.pattern not in engine.absolute_index or any(
+        delta.pattern not in engine.relative_index for delta in deltas
+    ):
+        raise ValueError("A planned expression must be deltas followed by an anchor")
+
+    return ExpressionGrouping(anchor=anchor, deltas=deltas)
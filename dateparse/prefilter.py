@@ -0,0 +1,87 @@
+"""
+Defines Prefilter, a cheap check that rules out texts
+with no date expressions before they are scanned,
+and the module-wide counters of how often it does.
+"""
+import re
+import threading
+from typing import NamedTuple
+
+from .scanner import _without_ignorecase
+
+
+class PrefilterStats(NamedTuple):
+    """Snapshot of the prefilter counters."""
+
+    checked: int
+    rejected: int
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.rejected / self.checked if self.checked else 0.0
+
+
+class PrefilterCounters:
+    """
+    Thread-safe counts of the texts checked by prefilters,
+    and of those rejected without a scan.
+
+    stats() -> PrefilterStats
+        Get the current counts.
+
+    reset()
+        Set both counts to zero.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.rejected = 0
+
+    def record(self, rejected: bool) -> None:
+        with self._lock:
+            self.checked += 1
+            self.rejected += rejected
+
+    def stats(self) -> PrefilterStats:
+        with self._lock:
+            return PrefilterStats(self.checked, self.rejected)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checked = 0
+            self.rejected = 0
+
+
+# shared by every prefilter, including those of parsers with named days
+prefilter_counters = PrefilterCounters()
+
+
+class Prefilter:
+    """
+    Rules out texts that cannot contain a match of a grammar.
+
+    __init__(pattern: re.Pattern, counters: PrefilterCounters = prefilter_counters):
+        pattern: matches somewhere in every text containing a date expression,
+        e.g. at a weekday name or a digit, though not only in those.
+
+    might_match(text: str) -> bool
+        False if the text has no date expression, so need not be scanned.
+        Counts the check in counters.
+    """
+
+    def __init__(
+        self, pattern: re.Pattern, counters: PrefilterCounters = prefilter_counters
+    ):
+        self.pattern = pattern
+        self.counters = counters
+        self._lowercase_pattern = _without_ignorecase(pattern)
+
+    def might_match(self, text: str) -> bool:
+        if self._lowercase_pattern is not None and text.isascii():
+            found = self._lowercase_pattern.search(text.lower()) is not None
+        else:
+            found = self.pattern.search(text) is not None
+
+        self.counters.record(rejected=not found)
+        return found
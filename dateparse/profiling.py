@@ -0,0 +1,135 @@
+"""
+Defines ParseStats, opt-in timings of each stage of parsing
+and counts of the matches, cache lookups and text scanned along the way.
+"""
+import collections
+import contextvars
+import threading
+from typing import Any, Iterable
+
+# the stages a scan or resolution is timed in, in the order they run
+STAGES = ("prefilter", "extract", "order", "group", "resolve")
+
+# the stats recording parses in the current thread or task, if any;
+# when None, as it is unless a ParseStats is entered, nothing is timed
+_active_stats: contextvars.ContextVar["ParseStats | None"] = contextvars.ContextVar(
+    "dateparse_active_stats", default=None
+)
+# the tokens restoring _active_stats when each with block in the current
+# thread or task exits, innermost last; with blocks nest within a context,
+# so one stack serves every ParseStats
+_entered_tokens: contextvars.ContextVar[tuple[contextvars.Token, ...]] = (
+    contextvars.ContextVar("dateparse_entered_tokens", default=())
+)
+
+
+class ParseStats:
+    """
+    Thread-safe timings and counts of the parsing done while it is active.
+
+    Parsing is only recorded inside a with block, and only in the thread
+    or asyncio task that entered it (and, for an AsyncDateParser,
+    the executor threads its texts are sent to):
+
+        with ParseStats() as stats:
+            parse_all(date.today(), text)
+        stats.as_dict()
+
+    Outside any block, the parse functions skip all of this.
+    A ParseStats may be entered many times, from many threads,
+    and accumulates until reset.
+
+    The stages are, for each text scanned:
+        prefilter: ruling out texts with no date vocabulary
+        extract: finding the matches of every pattern, named days included
+        order: sorting the matches, and dropping those within others
+        group: grouping matches into expressions
+    and for each expression resolved against a base date:
+        resolve: computing its date
+
+    as_dict() -> dict
+        All counts and timings as a dict of plain values:
+            texts: the number of texts scanned
+            characters: their total length
+            longest_text: the length of the longest
+            stages: {stage: {"calls": int, "seconds": float}}
+            matches: {rule name: number of matches}, counting matches
+                that were later dropped for lying within others
+            caches: {"result" or "expression": {"hits": int, "misses": int}}
+
+    reset()
+        Set every count and timing to zero.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __enter__(self) -> "ParseStats":
+        _entered_tokens.set(_entered_tokens.get() + (_active_stats.set(self),))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        *outer_tokens, token = _entered_tokens.get()
+        _entered_tokens.set(tuple(outer_tokens))
+        _active_stats.reset(token)
+
+    def record_scan(
+        self,
+        text_length: int,
+        stage_seconds: Iterable[tuple[str, float]],
+        rule_names: Iterable[str],
+    ) -> None:
+        with self._lock:
+            self._texts += 1
+            self._characters += text_length
+            self._longest_text = max(self._longest_text, text_length)
+            for stage, seconds in stage_seconds:
+                self._stage_calls[stage] += 1
+                self._stage_seconds[stage] += seconds
+            self._matches.update(rule_names)
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._stage_calls[stage] += 1
+            self._stage_seconds[stage] += seconds
+
+    def record_cache(self, cache_name: str, hit: bool) -> None:
+        with self._lock:
+            self._cache_lookups[cache_name, hit] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            cache_names = sorted({name for name, _ in self._cache_lookups})
+            return {
+                "texts": self._texts,
+                "characters": self._characters,
+                "longest_text": self._longest_text,
+                "stages": {
+                    stage: {
+                        "calls": self._stage_calls[stage],
+                        "seconds": float(self._stage_seconds[stage]),
+                    }
+                    for stage in STAGES
+                },
+                "matches": dict(self._matches),
+                "caches": {
+                    name: {
+                        "hits": self._cache_lookups[name, True],
+                        "misses": self._cache_lookups[name, False],
+                    }
+                    for name in cache_names
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._texts = 0
+            self._characters = 0
+            self._longest_text = 0
+            self._stage_calls: collections.Counter[str] = collections.Counter()
+            self._stage_seconds: collections.Counter[str] = collections.Counter()
+            self._matches: collections.Counter[str] = collections.Counter()
+            self._cache_lookups: collections.Counter[tuple[str, bool]] = (
+                collections.Counter()
+            )
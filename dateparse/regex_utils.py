@@ -65,6 +65,11 @@ def _iter_to_regex(input_list: Iterable) -> str:
 QUICK_DAY_NAMES: Final = ["today", "tomorrow", "yesterday"]
 
 WHITESPACE_BUF: Final = r"(?:\s*)"
+
+# an optional year following a month and day, e.g. the ", 2024" of "may 4, 2024"
+YEAR_SUFFIX_REGEX: Final = r"(?P<year>[^\d\n]+\d{4})?"
+# an optional year right after a named day, e.g. the ", 2024" of "christmas, 2024"
+NAMED_DAY_YEAR_REGEX: Final = r"(?P<year>,?[^\S\n]*\d{4}\b)?"
 # make regex pattern strings
 MONTHS_MATCH_REGEX: Final = _iter_to_regex(MONTH_SHORTNAMES)
 
@@ -83,47 +88,64 @@ INTERVAL_PREPOSITION_REGEX: Final = (
 )
 
 
-# compile_pattern patterns
-# of the form "oct 20" "october 20" "10-20-2023
-MDY_DATE_PATTERN: Final = compile_pattern(
-    WHITESPACE_BUF
-    + r"(?P<month>"
-    + MONTHS_MATCH_REGEX
-    + r"|\d+)[^\d\n]+?(?P<day>\d{1,2})(?P<year>[^\d\n]+\d{4})?"
-    + WHITESPACE_BUF
-)
-
-# phrases of the form "a week from"
-RELATIVE_INTERVAL_PATTERN: Final = compile_pattern(
-    WHITESPACE_BUF
-    + r"(?P<time_unit_count>a\s*|"
-    + NUMBER_WORDS_REGEX
-    + r")?\s*(?P<time_interval_name>"
-    + TIME_INTERVAL_REGEX
-    + r")\w*[^\n\d\w]*(?P<preposition>"
-    + INTERVAL_PREPOSITION_REGEX
-    + ")"
-    + WHITESPACE_BUF
-)
-
-# phrases of the form "in ten days", "in two weeks"
-IN_N_INTERVALS_PATTERN: Final = compile_pattern(
-    WHITESPACE_BUF
-    + r"in[^\n\d\w](?P<days_number>\w+|a)[^\n\d\w](?P<time_interval_name>"
-    + TIME_INTERVAL_REGEX
-    + r")\w*?"
-    + WHITESPACE_BUF
-)
-
-# phrases of the form "this sunday", "next wednesday"
-RELATIVE_WEEKDAY_PATTERN: Final = compile_pattern(
-    WHITESPACE_BUF
-    + r"(?P<specifier>this|next|last)?[^\n\d\w]*(?P<weekday_name>"
-    + WEEKDAY_MATCH_REGEX
-    + ")"
-    + WHITESPACE_BUF
-)
-
-QUICK_DAYS_PATTERN: Final = compile_pattern(
-    WHITESPACE_BUF + r"(?P<quick_dayname>" + QUICK_DAYS_REGEX + ")" + WHITESPACE_BUF
-)
+# words that pick a period relative to the one containing the base date,
+# e.g. "next month", mapped to the number of periods to move by
+PERIOD_SPECIFIERS: Final = {"this": 0, "next": 1, "last": -1}
+
+PERIOD_NAMES: Final = ["week", "month", "year"]
+
+BOUNDARY_WORDS: Final = {"start": "start", "beginning": "start", "end": "end"}
+
+# one-indexed, so that the index is the ordinal's value
+ORDINAL_WORDS: Final = ["", "first", "second", "third", "fourth", "fifth"]
+LAST_ORDINAL_WORD: Final = "last"
+
+PERIOD_SPECIFIERS_REGEX: Final = _iter_to_regex(PERIOD_SPECIFIERS)
+PERIOD_NAMES_REGEX: Final = _iter_to_regex(PERIOD_NAMES)
+BOUNDARY_WORDS_REGEX: Final = _iter_to_regex(BOUNDARY_WORDS)
+ORDINALS_REGEX: Final = r"\d{1,2}(?:st|nd|rd|th)|" + _iter_to_regex(ORDINAL_WORDS)
+
+# whitespace between the words of an expression, which never includes a line break
+WORD_GAP: Final = r"[^\S\n]+"
+
+# the vocabulary that grammar rule templates refer to by name, e.g. ${month}
+VOCABULARY: Final = {
+    "month": MONTHS_MATCH_REGEX,
+    "weekday": WEEKDAY_MATCH_REGEX,
+    "interval": TIME_INTERVAL_REGEX,
+    "number": NUMBER_WORDS_REGEX,
+    "preposition": INTERVAL_PREPOSITION_REGEX,
+    "quick_day": QUICK_DAYS_REGEX,
+    "year_suffix": YEAR_SUFFIX_REGEX,
+    "named_day_year": NAMED_DAY_YEAR_REGEX,
+    "specifier": PERIOD_SPECIFIERS_REGEX,
+    "period": PERIOD_NAMES_REGEX,
+    "boundary": BOUNDARY_WORDS_REGEX,
+    "ordinal": ORDINALS_REGEX,
+    "last_ordinal": LAST_ORDINAL_WORD,
+    "gap": WORD_GAP,
+}
+
+# the rules of the default grammar whose patterns were once defined here
+_RULE_PATTERN_NAMES: Final = {
+    "MDY_DATE_PATTERN": "month_day",
+    "RELATIVE_INTERVAL_PATTERN": "relative_interval",
+    "IN_N_INTERVALS_PATTERN": "in_n_intervals",
+    "RELATIVE_WEEKDAY_PATTERN": "relative_weekday",
+    "QUICK_DAYS_PATTERN": "quick_day",
+}
+
+
+def __getattr__(name: str) -> re.Pattern:
+    """
+    The patterns of the default grammar's rules, under their former names,
+    e.g. MDY_DATE_PATTERN for the month_day rule's pattern.
+    They are looked up when first used, not compiled on import.
+    """
+    if name in _RULE_PATTERN_NAMES:
+        # imported here, since the grammar's rules are written over this module
+        from .grammar import default_grammar
+
+        return default_grammar.patterns[_RULE_PATTERN_NAMES[name]]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,290 @@
+"""
+Defines PatternScanner, which finds the matches of several
+regex patterns in a single pass over the input text.
+"""
+import re
+from typing import Iterable, Iterator
+
+# named groups are stripped from the source patterns when they are combined,
+# since several patterns share group names (e.g. "time_interval_name")
+_NAMED_GROUP_REGEX = re.compile(r"\(\?P<\w+>")
+
+# syntax that may contain uppercase letters without matching them
+_CASELESS_SYNTAX_REGEX = re.compile(r"\\.|\(\?P<\w+>|\(\?P=\w+\)")
+# escapes for characters by code (e.g. \x41), and inline flags (e.g. (?-i:...)),
+# which a pattern has to keep its case-insensitive flag for
+_CASE_SENSITIVE_SYNTAX_REGEX = re.compile(r"\\[xuUN0-9]|\(\?[aiLmsux-]+[:)]")
+
+
+def _hit_group_name(index: int) -> str:
+    return f"_hit{index}"
+
+
+def _combine_lookaheads(patterns: list[re.Pattern]) -> re.Pattern:
+    """
+    Build a pattern which matches (with zero width) at any position,
+    reporting every input pattern that matches there.
+
+    Each input pattern is wrapped in an optional lookahead with its own
+    capturing group, whose span is the span of the pattern's match.
+    Named groups become plain groups, so that the groups of each pattern
+    directly follow its own group, in the pattern's order.
+    """
+    lookaheads = []
+    for index, pattern in enumerate(patterns):
+        source = _NAMED_GROUP_REGEX.sub("(", pattern.pattern)
+        lookaheads.append(f"(?:(?=(?P<{_hit_group_name(index)}>{source}))|)")
+
+    return re.compile("".join(lookaheads), patterns[0].flags)
+
+
+def _without_ignorecase(pattern: re.Pattern) -> re.Pattern | None:
+    """
+    Get a case-sensitive version of a case-insensitive pattern,
+    which matches the same lowercase ASCII text, only faster.
+    None if the pattern would not, e.g. because it has uppercase letters
+    outside of escapes like \\S.
+    """
+    if not pattern.flags & re.IGNORECASE:
+        return None
+
+    if _CASE_SENSITIVE_SYNTAX_REGEX.search(pattern.pattern):
+        return None
+
+    if any(char.isupper() for char in _CASELESS_SYNTAX_REGEX.sub("", pattern.pattern)):
+        return None
+
+    return re.compile(pattern.pattern, pattern.flags & ~re.IGNORECASE)
+
+
+def _combine_alternatives(patterns: list[re.Pattern]) -> re.Pattern:
+    # a pattern matching wherever any of the patterns does
+    sources = [_NAMED_GROUP_REGEX.sub("(?:", pattern.pattern) for pattern in patterns]
+    combined_source = "|".join(f"(?:{source})" for source in sources)
+    return re.compile(combined_source, patterns[0].flags)
+
+
+def _core_span(match: "re.Match | ScanMatch") -> tuple[int, int]:
+    # the span of a match, without any whitespace at either end
+    matched = match.group()
+    start = match.start() + len(matched) - len(matched.lstrip())
+    end = match.end() - (len(matched) - len(matched.rstrip()))
+    return start, max(start, end)
+
+
+class ScanMatch:
+    """
+    A match of one of the patterns of a PatternScanner.
+
+    It has the parts of the re.Match interface that matches are used for:
+    re (the source pattern), string, span(), start(), end(),
+    group() and groupdict(), taken from the text as given.
+    """
+
+    __slots__ = ("re", "string", "_spans")
+
+    def __init__(self, pattern: re.Pattern, string: str, spans: tuple):
+        self.re = pattern
+        self.string = string
+        # the span of the match, then of each group of the pattern
+        self._spans = spans
+
+    def span(self, group: int | str = 0) -> tuple[int, int]:
+        if isinstance(group, str):
+            group = self.re.groupindex[group]
+        return self._spans[group]
+
+    def start(self, group: int | str = 0) -> int:
+        return self.span(group)[0]
+
+    def end(self, group: int | str = 0) -> int:
+        return self.span(group)[1]
+
+    def group(self, group: int | str = 0) -> str | None:
+        start, end = self.span(group)
+        return None if start == -1 else self.string[start:end]
+
+    def groupdict(self) -> dict[str, str | None]:
+        return {name: self.group(index) for name, index in self.re.groupindex.items()}
+
+    def __repr__(self) -> str:
+        return f"<ScanMatch span={self.span()}, match={self.group()!r}>"
+
+
+class PatternScanner:
+    """
+    Finds all matches of a set of patterns in one pass over a string.
+
+    A pattern matching wherever any of the patterns that may match next
+    does finds the next position to look at, and a pattern of lookaheads
+    then reports every pattern matching there, with the spans of its groups.
+
+    __init__(patterns: Iterable[re.Pattern], claiming=()) -> None:
+        patterns: the compiled patterns to search for.
+        All patterns must use the same flags.
+
+        claiming: patterns among the above whose matches claim their text.
+        The other patterns never match across claimed text, as if it
+        were not there. Claims exclude whitespace at either end of a match.
+
+    finditer(text: str, pos=0, endpos=None, next_start=None) -> Iterator[ScanMatch]
+        Yields the same matches as chaining re.finditer over every pattern,
+        ordered by start position (and by pattern order for a shared start).
+        Each match is a ScanMatch of its source pattern,
+        so match.re identifies which pattern it came from.
+    """
+
+    def __init__(
+        self, patterns: Iterable[re.Pattern], claiming: Iterable[re.Pattern] = ()
+    ):
+        self.patterns = list(patterns)
+
+        if len({pattern.flags for pattern in self.patterns}) > 1:
+            raise ValueError("All patterns in a PatternScanner must share flags")
+
+        self._every_pattern = _combine_lookaheads(self.patterns)
+        # case-insensitive matching is much slower, so ASCII text
+        # is searched for in lowercase where the patterns allow it
+        self._lowercase_every_pattern = _without_ignorecase(self._every_pattern)
+        # patterns matching wherever any of a set of the patterns does,
+        # by the set's pattern indices and whether they are for lowercase text
+        self._any_patterns: dict[tuple[tuple[int, ...], bool], re.Pattern] = {}
+
+        # the numbers of the groups of each pattern in _every_pattern,
+        # starting with the group of its whole match
+        self._group_ranges = []
+        for index, pattern in enumerate(self.patterns):
+            first = self._every_pattern.groupindex[_hit_group_name(index)]
+            self._group_ranges.append((first, first + pattern.groups + 1))
+
+        claiming = set(claiming)
+        self._claiming = [pattern in claiming for pattern in self.patterns]
+        self._claim_pattern = (
+            _combine_alternatives([p for p in self.patterns if p in claiming])
+            if claiming
+            else None
+        )
+
+    def finditer(
+        self,
+        text: str,
+        pos: int = 0,
+        endpos: int | None = None,
+        next_start: list[int] | None = None,
+    ) -> Iterator[ScanMatch]:
+        """
+        Yield every match of every pattern, in order of start position.
+
+        pos and endpos limit the search to text[pos:endpos],
+        as for re.Pattern.finditer.
+
+        next_start, if given, holds the position each pattern may next
+        match from, and is updated in place as matches are found.
+        Passing the same list to consecutive calls over adjacent ranges
+        continues each pattern's search where the previous call left off.
+        """
+        if endpos is None:
+            endpos = len(text)
+
+        # re.finditer resumes searching at the end of the previous match,
+        # so each pattern tracks the position its next match may start from
+        if next_start is None:
+            next_start = [pos] * len(self.patterns)
+
+        claimed_end = pos
+
+        # lowercasing ASCII text keeps every position where it is
+        search_text = text
+        every_pattern = self._every_pattern
+        lowercase = (
+            self._lowercase_every_pattern is not None and text[:endpos].isascii()
+        )
+        if lowercase:
+            search_text = text[:endpos].lower()
+            every_pattern = self._lowercase_every_pattern
+
+        # the position each pattern may next match from, as far as is known;
+        # a pattern a search went past without matching waits until after it
+        may_match_from = [max(start, pos) for start in next_start]
+
+        position = pos
+        while True:
+            # only the patterns that may match from here on are searched for,
+            # until the next position another one may match from
+            active = []
+            resume_at = endpos + 1
+            for index, start in enumerate(may_match_from):
+                if start <= position:
+                    active.append(index)
+                elif start < resume_at:
+                    resume_at = start
+
+            next_hit = endpos + 1
+            if active:
+                found = self._any_pattern(tuple(active), lowercase).search(
+                    search_text, position, endpos
+                )
+                if found is not None:
+                    next_hit = found.start()
+                for index in active:
+                    may_match_from[index] = next_hit
+
+            if next_hit >= resume_at:
+                if resume_at > endpos:
+                    return
+                position = resume_at
+                continue
+
+            position = next_hit
+            hits = every_pattern.match(search_text, position, endpos)
+
+            for index, (first, last) in enumerate(self._group_ranges):
+                hit_end = hits.end(first)
+                if hit_end == -1 or position < next_start[index]:
+                    continue
+
+                spans = tuple(map(hits.span, range(first, last)))
+                match = ScanMatch(self.patterns[index], text, spans)
+
+                if self._claiming[index]:
+                    claimed_end = max(claimed_end, _core_span(match)[1])
+
+                elif self._claim_pattern is not None and self._overlaps_claim(
+                    match, claimed_end
+                ):
+                    # try again from the next position the pattern matches at
+                    continue
+
+                yield match
+
+                next_start[index] = hit_end if hit_end > position else position + 1
+                may_match_from[index] = next_start[index]
+
+            position += 1
+
+    def _any_pattern(self, active: tuple[int, ...], lowercase: bool) -> re.Pattern:
+        # compiled when a set of patterns is first searched for;
+        # a scan only meets a few of the possible sets
+        any_pattern = self._any_patterns.get((active, lowercase))
+        if any_pattern is None:
+            any_pattern = _combine_alternatives(
+                [self.patterns[index] for index in active]
+            )
+            if lowercase:
+                any_pattern = _without_ignorecase(any_pattern)
+            self._any_patterns[active, lowercase] = any_pattern
+
+        return any_pattern
+
+    def _overlaps_claim(self, match: ScanMatch, claimed_end: int) -> bool:
+        # a match overlaps a claim made before it, or one starting within it
+        core_start, core_end = _core_span(match)
+        if core_start < claimed_end:
+            return True
+
+        for claim_start in range(core_start, core_end):
+            claim = self._claim_pattern.match(match.string, claim_start)
+            if claim is not None and _core_span(claim)[0] < core_end:
+                return True
+
+        return False
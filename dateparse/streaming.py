@@ -0,0 +1,193 @@
+"""
+Defines iter_dates, which lazily finds the dates in text that arrives
+in chunks, such as a file or a stream of log lines.
+"""
+import datetime
+import itertools as it
+import re
+from typing import IO, Final, Iterable, Iterator, Mapping
+
+from .named_days import NamedDayMatcher
+from .parsefunctions import DateResult, DateTuple
+from .parseutil import (
+    _as_named_day_matcher,
+    _get_engine,
+    _get_scanner,
+    _is_escaped,
+    _iter_expression_groups,
+    _iter_without_subgroups,
+    _match_to_tuple,
+    _ordered_matches,
+    _reduce_expression,
+)
+from .regex_utils import TIME_INTERVAL_REGEX, TIME_INTERVAL_TYPES, compile_pattern
+from .scanner import PatternScanner
+
+DEFAULT_CHUNK_SIZE: Final = 64 * 1024
+
+# Expressions never continue past a line break, except through whitespace.
+# Of those, only a relative interval ("a\n week before") has text on both sides,
+# and then the text after the line break starts with the interval name
+_INTERVAL_START_PATTERN: Final = compile_pattern(TIME_INTERVAL_REGEX)
+_INTERVAL_NAME_LENGTH: Final = max(len(name) for name in TIME_INTERVAL_TYPES)
+_WHITESPACE_RUN_PATTERN: Final = re.compile(r"\s*")
+
+
+def _iter_chunks(source: str | IO[str] | Iterable[str], chunk_size: int):
+    if isinstance(source, str):
+        for chunk_start in range(0, len(source), chunk_size):
+            yield source[chunk_start : chunk_start + chunk_size]
+
+    elif hasattr(source, "read"):
+        while chunk := source.read(chunk_size):
+            yield chunk
+
+    else:
+        yield from source
+
+
+def _find_cut(
+    text: str, start: int, end: int | None = None
+) -> tuple[int, int] | None:
+    """
+    Find the last run of whitespace in text[start:end] that contains a line break,
+    and that no expression can extend across.
+    Returns the start and end of the run, or None if there is none.
+    """
+    if end is None:
+        end = len(text)
+    search_end = end
+
+    while (newline := text.rfind("\n", start, search_end)) != -1:
+        run_start = newline
+        while run_start > start and text[run_start - 1].isspace():
+            run_start -= 1
+
+        run_end = _WHITESPACE_RUN_PATTERN.match(text, newline).end()
+
+        search_end = run_start
+
+        # enough text must follow the run to tell that it ends there,
+        # and that it isn't followed by an interval name
+        if run_end + _INTERVAL_NAME_LENGTH > end:
+            continue
+
+        if _INTERVAL_START_PATTERN.match(text, run_end):
+            continue
+
+        return run_start, run_end
+
+    return None
+
+
+def _iter_stream_tuples(
+    chunks: Iterable[str], scanner: PatternScanner, escape: str
+) -> Iterator[DateTuple]:
+    """
+    Yield DateTuples for every match in the chunked text, with absolute offsets,
+    in the order _ordered_matches would sort the matches of the whole text.
+
+    Text is buffered until it contains a line break that no expression
+    can span. Everything up to the break is then scanned, and discarded
+    apart from the whitespace around the break and a few characters of context
+    (for escapes and word boundaries). The whitespace is scanned again
+    with the text that follows, since it may begin the next match.
+    """
+    context = max(len(escape), 1)
+
+    buffer = ""
+    buffer_offset = 0
+    scan_from = 0
+    cut_search_from = 0
+    next_start = [0] * len(scanner.patterns)
+
+    def scan_buffer(endpos: int) -> list[DateTuple]:
+        segment_tuples = []
+        for match in scanner.finditer(buffer, scan_from, endpos, next_start):
+            if _is_escaped(buffer, match, escape):
+                continue
+
+            tup = _match_to_tuple(match)
+            tup.start += buffer_offset
+            tup.end += buffer_offset
+            segment_tuples.append(tup)
+
+        return _ordered_matches(segment_tuples)
+
+    for chunk in chunks:
+        buffer += chunk
+
+        cut = _find_cut(buffer, cut_search_from)
+        if cut is None:
+            # only line breaks near the end of the buffer can become
+            # usable once more text arrives, so later searches skip the rest
+            search_from = len(buffer) - _INTERVAL_NAME_LENGTH - 1
+            while search_from > cut_search_from and buffer[search_from - 1].isspace():
+                search_from -= 1
+            cut_search_from = max(search_from, cut_search_from)
+            continue
+
+        run_start, run_end = cut
+        yield from scan_buffer(run_end)
+
+        trim = max(run_start - context, 0)
+        buffer = buffer[trim:]
+        buffer_offset += trim
+        scan_from = run_start - trim
+        cut_search_from = run_end - trim
+        next_start = [max(position - trim, 0) for position in next_start]
+
+    yield from scan_buffer(len(buffer))
+
+
+def iter_dates(
+    base_date: datetime.date,
+    source: str | IO[str] | Iterable[str],
+    allow_past: bool = False,
+    escape: str = "\\",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    named_days: Mapping[str, str] | NamedDayMatcher | None = None,
+) -> Iterator[DateResult]:
+    """
+    Lazily get all matched expressions as DateResult tuples.
+
+    Parameters:
+
+        base_date: datetime.date
+            The reference point date for interpreting a date expression,
+            as for parse_all.
+
+        source: str | IO[str] | Iterable[str]
+            The input text: a string, a text file object (read chunk_size
+            characters at a time), or any iterable of string chunks.
+            An expression may be split across chunks.
+
+        allow_past, escape, named_days:
+            As for parse_all.
+
+        chunk_size: int
+            The number of characters to read from a string or file at a time.
+
+    Yields the same DateResults as parse_all would return for the
+    concatenated text, in order, with start and end offsets into the
+    concatenated text. Each result is yielded once the text after it
+    shows its expression is complete, so only the text since the last
+    line break needs to be held in memory.
+    """
+    engine = _get_engine(_as_named_day_matcher(named_days))
+
+    pattern_set = tuple(
+        it.chain(engine.absolute_index.keys(), engine.relative_index.keys())
+    )
+    scanner = _get_scanner(pattern_set, engine.named_patterns)
+
+    match_tuples = _iter_stream_tuples(
+        _iter_chunks(source, chunk_size), scanner, escape
+    )
+
+    expressions = _iter_expression_groups(
+        _iter_without_subgroups(match_tuples), set(engine.absolute_index.keys())
+    )
+
+    for expr in expressions:
+        yield _reduce_expression(base_date, expr, allow_past=allow_past, engine=engine)
@@ -0,0 +1,162 @@
+import asyncio
+import datetime
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from dateparse import AsyncDateParser, DateParser, LRUCache
+from dateparse import async_parser as async_parser_module
+
+BASE_DATE = datetime.date(2023, 1, 17)
+
+SHORT_TEXT = "a week from thursday and two days after payday"
+LONG_TEXT = "filler text " * 100 + SHORT_TEXT
+NAMED_DAYS = {"payday": "march 31"}
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=4)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def _async_parser(**kwargs) -> AsyncDateParser:
+    return AsyncDateParser(
+        base_date=BASE_DATE,
+        named_days=NAMED_DAYS,
+        cache=LRUCache(maxsize=64),
+        group_cache=LRUCache(maxsize=64),
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("text", [SHORT_TEXT, LONG_TEXT], ids=["short", "long"])
+def test_same_as_date_parser(text):
+    parser = DateParser(base_date=BASE_DATE, named_days=NAMED_DAYS)
+
+    async def parse_all_ways():
+        async_parser = _async_parser()
+        return [
+            await async_parser.get_first(text),
+            await async_parser.get_last(text),
+            await async_parser.get_first_date(text),
+            await async_parser.get_last_date(text),
+            await async_parser.get_all(text, from_right=True),
+            await async_parser.get_all_dates(text),
+        ]
+
+    assert asyncio.run(parse_all_ways()) == [
+        parser.get_first(text),
+        parser.get_last(text),
+        parser.get_first_date(text),
+        parser.get_last_date(text),
+        parser.get_all(text, from_right=True),
+        parser.get_all_dates(text),
+    ]
+
+
+def test_long_texts_are_offloaded_and_cached():
+    with CountingExecutor() as executor:
+        async_parser = _async_parser(executor=executor)
+
+        async def parse():
+            await async_parser.get_all(SHORT_TEXT)
+            first = await async_parser.get_all(LONG_TEXT)
+            second = await async_parser.get_all(LONG_TEXT)
+            return first, second
+
+        first, second = asyncio.run(parse())
+
+    # only the long text went to the executor, and only once
+    assert executor.submitted == 1
+    assert first is second
+    assert len(async_parser.parser.cache) == 2
+
+
+def _tracking_parse(counts: dict, lock: threading.Lock):
+    parse_uncached = async_parser_module._parse_uncached
+
+    def parse(*args):
+        with lock:
+            counts["running"] += 1
+            counts["most"] = max(counts["most"], counts["running"])
+        time.sleep(0.02)
+        with lock:
+            counts["running"] -= 1
+        return parse_uncached(*args)
+
+    return parse
+
+
+def test_max_concurrency(monkeypatch):
+    counts = {"running": 0, "most": 0}
+    monkeypatch.setattr(
+        async_parser_module,
+        "_parse_uncached",
+        _tracking_parse(counts, threading.Lock()),
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        async_parser = _async_parser(executor=executor, max_concurrency=2)
+
+        async def parse_many():
+            texts = [LONG_TEXT + f" and {n} days after friday" for n in range(8)]
+            return await asyncio.gather(*map(async_parser.get_all, texts))
+
+        results = asyncio.run(parse_many())
+
+    assert all(results)
+    assert counts["most"] == 2
+
+
+def test_cancelled_calls_release_their_slot(monkeypatch):
+    counts = {"running": 0, "most": 0}
+    monkeypatch.setattr(
+        async_parser_module,
+        "_parse_uncached",
+        _tracking_parse(counts, threading.Lock()),
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        async_parser = _async_parser(executor=executor, max_concurrency=1)
+
+        async def cancel_then_parse():
+            task = asyncio.create_task(async_parser.get_all(LONG_TEXT))
+            await asyncio.sleep(0.005)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            # the cancelled result is not cached
+            assert len(async_parser.parser.cache) == 0
+            return await async_parser.get_first(LONG_TEXT)
+
+        result = asyncio.run(asyncio.wait_for(cancel_then_parse(), timeout=5))
+
+    assert result.date == datetime.date(2023, 1, 26)
+
+
+def test_process_pool():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        async_parser = _async_parser(executor=executor)
+
+        async def parse():
+            await async_parser.warm_up()
+            return await async_parser.get_all(LONG_TEXT)
+
+        results = asyncio.run(parse())
+
+    assert results == DateParser(base_date=BASE_DATE, named_days=NAMED_DAYS).get_all(
+        LONG_TEXT
+    )
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        AsyncDateParser(max_concurrency=0)
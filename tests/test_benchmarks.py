@@ -0,0 +1,44 @@
+from benchmarks.corpus import make_text, make_texts
+from benchmarks.harness import MEMORY, Benchmark, compare, run_memory_benchmark
+
+
+def test_corpus_is_deterministic():
+    assert make_text(5000, 0.2, seed=3) == make_text(5000, 0.2, seed=3)
+    assert make_text(5000, 0.2, seed=3) != make_text(5000, 0.2, seed=4)
+    assert len(make_text(5000)) == 5000
+    assert make_texts(10, seed=1) == make_texts(10, seed=1)
+
+
+def test_compare_flags_regressions():
+    def results(**timings):
+        return {"benchmarks": {name: {"median": t} for name, t in timings.items()}}
+
+    baseline = results(fast=1.0, slow=1.0, same=1.0, gone=1.0)
+    current = results(fast=0.5, slow=1.5, same=1.05, added=1.0)
+
+    statuses = {comp.name: comp.status for comp in compare(baseline, current)}
+    assert statuses == {
+        "fast": "improvement",
+        "slow": "regression",
+        "same": "unchanged",
+        "gone": "removed",
+        "added": "new",
+    }
+
+
+def test_memory_benchmark():
+    def setup():
+        return lambda: [bytearray(1000) for _ in range(10)]
+
+    result = run_memory_benchmark(Benchmark("bytes", setup, "", MEMORY))
+
+    assert result.items == 10
+    assert 1000 <= result.bytes_per_item < 1200
+
+
+def test_compare_memory_results():
+    baseline = {"benchmarks": {"records": {"items": 10, "bytes_per_item": 500.0}}}
+    current = {"benchmarks": {"records": {"items": 10, "bytes_per_item": 300.0}}}
+
+    (comparison,) = compare(baseline, current)
+    assert (comparison.status, comparison.unit) == ("improvement", "B")
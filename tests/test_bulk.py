@@ -0,0 +1,117 @@
+import datetime
+
+import pytest
+
+from dateparse import DateParser, basic_parse, epoch_days_to_date, resolve_many
+from dateparse import columns as columns_module
+
+# month ends, leap days and the days around them, and every weekday
+BASE_DATES = [
+    datetime.date(2023, 1, 17) + datetime.timedelta(days=n) for n in range(0, 800, 3)
+] + [
+    datetime.date(2024, 2, 29),
+    datetime.date(2024, 2, 28),
+    datetime.date(2023, 3, 1),
+    datetime.date(2024, 12, 31),
+    datetime.date(2025, 1, 31),
+]
+
+TEXTS = [
+    "next friday",
+    "this sunday",
+    "a month after today",
+    "two months before tomorrow",
+    "a year after yesterday",
+    "three weeks before wednesday",
+    "in ten days",
+    "four days before march 11",
+    "two days before march 2",
+    "a week after february 28",
+    "may 4, 2024",
+    "the third monday in may",
+    "a week before the end of the month",
+]
+
+
+@pytest.fixture(params=["numpy", "array"])
+def to_dates(request, monkeypatch):
+    # converts a dates column of either kind to datetime.date objects
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        return lambda dates: list(dates.astype(datetime.date))
+
+    monkeypatch.setattr(columns_module, "numpy", None)
+    return lambda dates: [epoch_days_to_date(day) for day in dates]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("allow_past", [False, True])
+def test_same_as_basic_parse(to_dates, text, allow_past):
+    result = resolve_many(BASE_DATES, text, allow_past=allow_past)
+    expected = [basic_parse(base, text, allow_past=allow_past) for base in BASE_DATES]
+
+    assert to_dates(result.dates) == [
+        expected_result.date for expected_result in expected
+    ]
+    assert {(result.start, result.end, result.content)} == {
+        (expected_result.start, expected_result.end, expected_result.content)
+        for expected_result in expected
+    }
+
+
+def test_from_right_and_named_days(to_dates):
+    text = "a week from thursday and two days after payday"
+    parser = DateParser(named_days={"payday": "march 31"})
+
+    result = parser.resolve_many(BASE_DATES, text, from_right=True)
+
+    assert to_dates(result.dates) == [
+        basic_parse(base, text, from_right=True, named_days=parser.named_days).date
+        for base in BASE_DATES
+    ]
+
+
+def test_invalid_in_some_base_year(to_dates):
+    with pytest.raises(ValueError):
+        resolve_many(BASE_DATES, "february 29")
+
+    leap_years = [datetime.date(2024, 1, 1), datetime.date(2028, 1, 1)]
+    assert to_dates(resolve_many(leap_years, "february 29").dates) == [
+        datetime.date(2024, 2, 29),
+        datetime.date(2028, 2, 29),
+    ]
+
+
+def test_no_expression(to_dates):
+    assert resolve_many(BASE_DATES, "nothing here") is None
+    assert to_dates(resolve_many([], "next friday").dates) == []
+
+
+def test_datetime64_base_dates():
+    numpy = pytest.importorskip("numpy")
+    base_dates = numpy.array(BASE_DATES, dtype="datetime64[D]")
+
+    result = resolve_many(base_dates, "a month after next friday")
+
+    assert result.dates.dtype == numpy.dtype("datetime64[D]")
+    assert list(result.dates.astype(datetime.date)) == [
+        basic_parse(base, "a month after next friday").date for base in BASE_DATES
+    ]
+
+
+def test_past_february_29_is_bumped_to_february_28_of_next_year(to_dates):
+    # without allow_past, a date before the base date moves a year on,
+    # and February 29th has no date a year on but the 28th
+    base_date = datetime.date(2024, 3, 10)
+    text = "two days before march 2"
+
+    assert basic_parse(base_date, text).date == datetime.date(2025, 2, 28)
+    assert DateParser(base_date=base_date).get_first(text).date == (
+        datetime.date(2025, 2, 28)
+    )
+    assert basic_parse(base_date, text, allow_past=True).date == (
+        datetime.date(2024, 2, 29)
+    )
+    assert to_dates(resolve_many([base_date], text).dates) == [
+        datetime.date(2025, 2, 28)
+    ]
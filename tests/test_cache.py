@@ -0,0 +1,124 @@
+import datetime
+
+from dateparse import DateParser, LRUCache, basic_parse, parse_all
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_and_counters():
+    cache = LRUCache(maxsize=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("c") == 3
+
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.entries == 2
+    assert stats.hits == 2
+    assert stats.misses == 1
+
+
+def test_byte_bound_and_resize():
+    cache = LRUCache(maxsize=None, maxbytes=1000, sizeof=lambda obj: 100)
+
+    for key in range(20):
+        cache.put(key, key)
+
+    # every entry costs 200 bytes: 100 for the key and 100 for the value
+    assert len(cache) == 5
+    assert cache.stats().approximate_bytes == 1000
+
+    cache.resize(maxsize=2)
+    assert len(cache) == 2
+    assert cache.maxbytes == 1000
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats().approximate_bytes == 0
+
+
+def test_oversized_value_replaces_older_value():
+    cache = LRUCache(maxsize=None, maxbytes=1000, sizeof=len)
+
+    cache.put("key", "small")
+    cache.put("key", "x" * 2000)
+
+    assert cache.get("key") is None
+    assert cache.stats().approximate_bytes == 0
+
+
+def test_ttl_expiry():
+    timer = FakeTimer()
+    cache = LRUCache(ttl=10, timer=timer)
+
+    cache.put("key", None)
+    timer.now = 5
+    assert cache.get("key", "missing") is None
+
+    timer.now = 11
+    assert cache.get("key", "missing") == "missing"
+    assert cache.stats().expirations == 1
+
+
+def test_parse_functions_use_given_cache():
+    cache = LRUCache(maxsize=8)
+    base_date = datetime.date(2022, 12, 17)
+
+    first = basic_parse(base_date, "a week from tues", cache=cache)
+    second = basic_parse(base_date, "a week from tues", cache=cache)
+
+    assert first == second
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+    no_cache = LRUCache(maxsize=0)
+    assert basic_parse(base_date, "today", cache=no_cache).date == base_date
+    assert len(no_cache) == 0
+
+
+def test_parser_instance_cache():
+    cache = LRUCache(maxsize=8)
+    parser = DateParser(base_date=datetime.date(2022, 12, 17), cache=cache)
+
+    parser.get_first("christmas")
+    parser.get_first_date("christmas")
+
+    assert parser.cache is cache
+    assert cache.stats().hits == 1
+
+
+def test_expressions_shared_across_base_dates():
+    result_cache = LRUCache(maxsize=64)
+    group_cache = LRUCache(maxsize=64)
+    text = "a week after next friday"
+
+    for day in range(1, 11):
+        parse_all(
+            datetime.date(2023, 3, day),
+            text,
+            cache=result_cache,
+            group_cache=group_cache,
+        )
+
+    assert result_cache.stats().misses == 10
+    assert group_cache.stats().misses == 1
+    assert group_cache.stats().hits == 9
+
+    # reversing the cached expressions must not reorder them for later calls
+    base_date = datetime.date(2023, 3, 1)
+    forward = parse_all(base_date, "today and tomorrow", group_cache=group_cache)
+    backward = parse_all(
+        base_date, "today and tomorrow", from_right=True, group_cache=group_cache
+    )
+    assert backward == forward[::-1]
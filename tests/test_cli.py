@@ -0,0 +1,131 @@
+import csv
+import datetime
+import gzip
+import io
+import json
+import sys
+
+import pytest
+
+from dateparse import DateParser
+from dateparse.cli import main
+
+BASE_DATE = datetime.date(2023, 1, 17)
+
+LINES = [
+    "meeting a week from thursday",
+    "nothing here",
+    "lunch on friday and dinner two days after payday",
+    "february 29",
+    "",
+    "four days before march 11",
+]
+NAMED_DAYS = {"payday": "march 31"}
+
+
+def _expected_rows(file_name: str) -> list[dict]:
+    parser = DateParser(base_date=BASE_DATE, named_days=NAMED_DAYS)
+    rows = []
+    for line_number, line in enumerate(LINES, 1):
+        if line == "february 29":
+            continue
+        for result in parser.get_all(line) or []:
+            rows.append(
+                {
+                    "file": file_name,
+                    "line": line_number,
+                    "date": result.date.isoformat(),
+                    "start": result.start,
+                    "end": result.end,
+                    "content": result.content,
+                }
+            )
+    return rows
+
+
+@pytest.fixture
+def named_days_file(tmp_path):
+    path = tmp_path / "named_days.json"
+    path.write_text(json.dumps(NAMED_DAYS))
+    return str(path)
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_jsonl(tmp_path, named_days_file, capsys, compressed, jobs):
+    text = "\n".join(LINES) + "\n"
+    if compressed:
+        path = tmp_path / "in.log.gz"
+        path.write_bytes(gzip.compress(text.encode()))
+    else:
+        path = tmp_path / "in.log"
+        path.write_text(text)
+    output = tmp_path / "out.jsonl"
+
+    exit_code = main(
+        [
+            str(path),
+            "--base-date",
+            BASE_DATE.isoformat(),
+            "--named-days",
+            named_days_file,
+            "--jobs",
+            jobs,
+            "--batch-size",
+            "2",
+            "-o",
+            str(output),
+        ]
+    )
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert exit_code == 0
+    assert rows == _expected_rows(str(path))
+    # february 29 has no date in 2023, which is reported and skipped
+    assert f"{path}:4:" in capsys.readouterr().err
+
+
+def test_csv_from_stdin(monkeypatch, capsys, named_days_file):
+    stdin_bytes = io.BufferedReader(io.BytesIO("\r\n".join(LINES).encode()))
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(stdin_bytes))
+
+    exit_code = main(
+        [
+            "--format",
+            "csv",
+            "--base-date",
+            BASE_DATE.isoformat(),
+            "--named-days",
+            named_days_file,
+        ]
+    )
+
+    rows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    assert exit_code == 0
+    assert rows == [
+        {key: str(value) for key, value in row.items()} for row in _expected_rows("-")
+    ]
+
+
+def test_invalid_arguments(tmp_path, capsys):
+    bad_named_days = tmp_path / "named_days.json"
+    bad_named_days.write_text("[1, 2]")
+
+    with pytest.raises(SystemExit):
+        main(["--named-days", str(bad_named_days)])
+    with pytest.raises(SystemExit):
+        main(["--base-date", "someday"])
+
+    assert main([str(tmp_path / "missing.log")]) == 1
+    assert "missing.log" in capsys.readouterr().err
+
+
+def test_unparseable_named_days(tmp_path, capsys):
+    named_days = tmp_path / "named_days.json"
+    named_days.write_text(json.dumps({"payday": "the 15th"}))
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--named-days", str(named_days), str(tmp_path / "missing.log")])
+
+    assert exit_info.value.code == 2
+    assert "Named day 'payday'" in capsys.readouterr().err
@@ -0,0 +1,87 @@
+import datetime
+
+import pytest
+
+from dateparse import DateParser, epoch_days_to_date
+from dateparse import columns as columns_module
+from dateparse.parseutil import parse_many
+
+BASE_DATE = datetime.date(2023, 1, 17)
+
+TEXTS = [
+    "lunch on friday, then a week from thursday",
+    "nothing here",
+    "four days before march 11",
+    "lunch on friday, then a week from thursday",
+]
+
+
+def _rows_from_results(all_results):
+    return [
+        (text_index, result.start, result.end, result.date)
+        for text_index, results in enumerate(all_results)
+        for result in results or ()
+    ]
+
+
+def _rows_from_columns(columns):
+    return [
+        (int(text_index), int(start), int(end), _to_date(day))
+        for text_index, start, end, day in zip(*columns)
+    ]
+
+
+def _to_date(day):
+    if hasattr(day, "astype"):
+        return day.astype(datetime.date)
+    return epoch_days_to_date(day)
+
+
+@pytest.mark.parametrize("from_right", [False, True])
+def test_columns_match_results(monkeypatch, from_right):
+    monkeypatch.setattr(columns_module, "numpy", None)
+
+    results = parse_many(BASE_DATE, TEXTS, from_right=from_right)
+    columns = parse_many(BASE_DATE, TEXTS, from_right=from_right, output="columns")
+
+    assert columns.text_index.typecode == "q"
+    assert _rows_from_columns(columns) == _rows_from_results(results)
+
+
+def test_columns_with_base_date_per_text():
+    base_dates = [BASE_DATE + datetime.timedelta(days=n) for n in range(len(TEXTS))]
+    parser = DateParser(base_date=BASE_DATE)
+
+    columns = parser.get_all_many(TEXTS, base_dates=base_dates, output="columns")
+    results = parser.get_all_many(TEXTS, base_dates=base_dates)
+
+    assert _rows_from_columns(columns) == _rows_from_results(results)
+
+
+def test_no_dates():
+    columns = parse_many(BASE_DATE, ["nothing", "here"], output="columns")
+    assert all(len(column) == 0 for column in columns)
+
+
+def test_numpy_columns():
+    numpy = pytest.importorskip("numpy")
+
+    columns = parse_many(BASE_DATE, TEXTS, output="columns")
+
+    assert isinstance(columns.start, numpy.ndarray)
+    assert columns.date.dtype == numpy.dtype("datetime64[D]")
+    assert _rows_from_columns(columns) == _rows_from_results(
+        parse_many(BASE_DATE, TEXTS)
+    )
+
+
+def test_numpy_required_when_requested(monkeypatch):
+    monkeypatch.setattr(columns_module, "numpy", None)
+
+    with pytest.raises(ImportError):
+        columns_module._ColumnBuilder().build(use_numpy=True)
+
+
+def test_unknown_output():
+    with pytest.raises(ValueError):
+        parse_many(BASE_DATE, TEXTS, output="rows")
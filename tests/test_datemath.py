@@ -0,0 +1,144 @@
+import calendar
+import datetime
+
+import pytest
+
+from dateparse import datemath
+
+sample_dates = [
+    datetime.date(2022, 12, 17),
+    datetime.date(2023, 1, 31),
+    datetime.date(2024, 2, 29),
+    datetime.date(1900, 3, 1),
+    datetime.date(1, 1, 1),
+    datetime.date(9999, 12, 31),
+]
+
+
+@pytest.mark.parametrize("year", [1, 4, 100, 400, 1900, 2000, 2023, 2024, 9999])
+def test_month_start_ordinal(year):
+    for month in range(1, 13):
+        expected = datetime.date(year, month, 1).toordinal()
+        assert datemath.month_start_ordinal(year, month) == expected
+        assert datemath.days_in_month(year, month) == calendar.monthrange(
+            year, month
+        )[1]
+
+
+def test_add_months_clamps_to_month_end():
+    assert datemath.add_months(datetime.date(2023, 1, 31), 1) == datetime.date(
+        2023, 2, 28
+    )
+    assert datemath.add_months(datetime.date(2024, 3, 31), -1) == datetime.date(
+        2024, 2, 29
+    )
+    assert datemath.add_months(datetime.date(2022, 12, 17), 14) == datetime.date(
+        2024, 2, 17
+    )
+    assert datemath.add_years(datetime.date(2024, 2, 29), 1) == datetime.date(
+        2025, 2, 28
+    )
+
+
+@pytest.mark.parametrize("start_date", sample_dates[:4])
+def test_month_span_days(start_date):
+    for count in range(0, 30):
+        forward_days = sum(
+            calendar.monthrange(*datemath.shift_month(start_date.year, month, 0))[1]
+            for month in range(start_date.month, start_date.month + count)
+        )
+        assert datemath.month_span_days(start_date, count) == forward_days
+
+        backward_days = sum(
+            calendar.monthrange(*datemath.shift_month(start_date.year, month, 0))[1]
+            for month in range(start_date.month, start_date.month - count, -1)
+        )
+        assert (
+            datemath.month_span_days(start_date, count, backward=True)
+            == backward_days
+        )
+
+
+def test_month_span_days_large_count():
+    start_date = datetime.date(2023, 5, 10)
+    end_date = datetime.date(9999, 5, 1)
+    months_count = (9999 - 2023) * 12
+
+    assert datemath.month_span_days(start_date, months_count) == (
+        end_date - datetime.date(2023, 5, 1)
+    ).days
+
+    # spans reaching past datetime.MAXYEAR are still computed
+    assert datemath.month_span_days(start_date, 10**6) > 0
+
+
+# every day of a common and a leap year, the turns of centuries, and sample_dates
+ordinal_dates = [
+    datetime.date(2023, 1, 1) + datetime.timedelta(days=n) for n in range(731)
+] + [
+    datetime.date(year, month, day)
+    for year in (1900, 2000, 2100)
+    for month, day in ((2, 28), (3, 1), (12, 31))
+] + sample_dates[:-1]
+
+
+@pytest.mark.parametrize("as_array", [False, True])
+def test_ordinal_functions(as_array):
+    ordinals = [day.toordinal() for day in ordinal_dates]
+
+    if as_array:
+        numpy = pytest.importorskip("numpy")
+        ordinal_array = numpy.array(ordinals)
+
+        def apply(func, *args):
+            result = func(ordinal_array, *args)
+            if isinstance(result, tuple):
+                return list(zip(*(column.tolist() for column in result)))
+            return result.tolist()
+
+    else:
+
+        def apply(func, *args):
+            return [func(ordinal, *args) for ordinal in ordinals]
+
+    assert apply(datemath.ordinal_isoweekday) == [
+        day.isoweekday() for day in ordinal_dates
+    ]
+    assert apply(datemath.ordinal_to_ymd) == [
+        (day.year, day.month, day.day) for day in ordinal_dates
+    ]
+    assert apply(
+        lambda ordinal: datemath.ymd_to_ordinal(*datemath.ordinal_to_ymd(ordinal))
+    ) == ordinals
+    assert apply(datemath.add_years_to_ordinal, 1) == [
+        datemath.add_years(day, 1).toordinal() for day in ordinal_dates
+    ]
+    assert apply(datemath.month_span_days_from_ordinal, 14, True) == [
+        datemath.month_span_days(day, 14, backward=True) for day in ordinal_dates
+    ]
+
+
+def test_calendar_tables_match_datetime():
+    # every month of every year datetime.date supports
+    months = [
+        (year, month)
+        for year in range(datetime.MINYEAR, datetime.MAXYEAR + 1)
+        for month in range(1, 13)
+    ]
+    firsts = [datetime.date(year, month, 1) for year, month in months]
+
+    assert [datemath.month_start_ordinal(*month) for month in months] == [
+        first.toordinal() for first in firsts
+    ]
+    assert [datemath.month_start_isoweekday(*month) for month in months] == [
+        first.isoweekday() for first in firsts
+    ]
+    assert [datemath.days_in_month(*month) for month in months] == [
+        calendar.monthrange(*month)[1] for month in months
+    ]
+    # months outside 1-12 carry into the year, and any year is supported
+    assert datemath.month_start_ordinal(10000, 1) == datetime.date.max.toordinal() + 1
+    assert datemath.month_start_ordinal(2023, 0) == (
+        datetime.date(2022, 12, 1).toordinal()
+    )
+    assert datemath.days_in_month(-400, 2) == 29
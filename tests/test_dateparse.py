@@ -90,3 +90,54 @@ def test_error_handling(make_parser_group):
 
         assert parser.get_last_date(text) is None
         assert parser.get_first_date(text) is None
+
+
+def test_parse_many(make_parser_group):
+    parser, vals = make_parser_group
+
+    texts = list(vals) + ["nothing here"] + list(vals)
+    batch_results = parser.get_all_many(texts)
+
+    assert len(batch_results) == len(texts)
+    assert batch_results[len(vals)] is None
+    for text, results in zip(texts, batch_results):
+        assert results == parser.get_all(text)
+
+    # one base date per text
+    base_dates = [
+        parser.base_date + datetime.timedelta(days=offset)
+        for offset in range(len(texts))
+    ]
+    for text, base_date, results in zip(
+        texts, base_dates, parser.parse_many(texts, base_dates=base_dates)
+    ):
+        day_parser = DateParser(base_date=base_date)
+        assert results == day_parser.get_all(text)
+
+
+def test_parse_many_return_exceptions():
+    parser = DateParser(base_date=datetime.date(2023, 1, 17))
+    texts = ["next friday", "february 29", "march 11"]
+
+    with pytest.raises(ValueError):
+        parser.get_all_many(texts)
+
+    results = parser.get_all_many(texts, return_exceptions=True)
+    assert isinstance(results[1], ValueError)
+    assert results[0] == parser.get_all("next friday")
+    assert results[2] == parser.get_all("march 11")
+
+    with pytest.raises(ValueError):
+        parser.get_all_many(texts, output="columns", return_exceptions=True)
+
+
+def test_parse_many_returns_overflow_errors():
+    parser = DateParser(base_date=datetime.date(2023, 1, 17))
+    texts = ["9999999999 months after march 11", "march 11"]
+
+    with pytest.raises(OverflowError):
+        parser.get_all_many(texts)
+
+    results = parser.get_all_many(texts, return_exceptions=True)
+    assert isinstance(results[0], OverflowError)
+    assert results[1] == parser.get_all("march 11")
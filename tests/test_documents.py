@@ -0,0 +1,104 @@
+import datetime
+import random
+
+import pytest
+
+from dateparse import DateDocument, DateParser, parse_all
+
+base_date = datetime.date(2022, 12, 17)
+
+document_text = (
+    "call me next friday\n"
+    "or two weeks after a month before February 1\n\n"
+    "  \\today is escaped, and été ends on the 3rd sunday in august\n"
+    "a\n week before march 11, then today"
+)
+
+# pieces of text that edits insert, to make, break and join expressions
+edit_pieces = [
+    "friday",
+    " next ",
+    "two weeks after",
+    "a\n week before ",
+    "march 11",
+    "\\",
+    "\n",
+    "  \n ",
+    "month",
+    "day",
+    "today",
+    "x",
+]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 4])
+def test_same_as_parse_all_after_edits(seed):
+    rng = random.Random(seed)
+    document = DateDocument(base_date, document_text)
+    text = document_text
+
+    for _ in range(40):
+        offset = rng.randint(0, len(text))
+        deleted = rng.randint(0, min(6, len(text) - offset))
+        inserted = rng.choice(edit_pieces) if rng.random() < 0.8 else ""
+
+        document.edit(offset, deleted, inserted)
+        text = text[:offset] + inserted + text[offset + deleted :]
+
+        assert document.text == text
+        assert document.results == (parse_all(base_date, text) or [])
+
+
+def test_changes():
+    document = DateDocument(base_date, "on friday\nsee you march 11\nthen today")
+    friday, march, today = document.results
+
+    changes = document.edit(18, 0, "two weeks after ")
+
+    # only the expression the edit joined is reported; today moves along
+    assert changes.removed == [march]
+    assert changes.added == document.results[1:2]
+    assert changes.added[0].content == "two weeks after march 11"
+    assert document.results == [
+        friday,
+        changes.added[0],
+        today._replace(start=today.start + 16, end=today.end + 16),
+    ]
+
+    changes = document.edit(0, 3, "")
+    assert changes.removed == [friday]
+    assert changes.added[0].start == 0
+
+
+def test_unresolvable_expressions_left_out():
+    document = DateDocument(base_date, "due february 2")
+
+    assert document.edit(14, 0, "9").removed[0].content == " february 2"
+    assert document.results == []
+
+    changes = document.edit(14, 1, "")
+    assert changes.removed == []
+    assert changes.added == document.results
+    assert document.results[0].date == datetime.date(2023, 2, 2)
+
+
+def test_parser_document():
+    parser = DateParser(base_date=base_date, named_days={"payday": "march 31"})
+    document = parser.document("nothing yet")
+
+    changes = document.edit(11, 0, "\ntwo days after payday")
+
+    assert changes.added == parser.get_all(document.text)
+    assert document.results == changes.added
+
+
+def test_edit_out_of_range():
+    document = DateDocument(base_date, "next friday")
+
+    with pytest.raises(ValueError):
+        document.edit(5, 10, "")
+
+    with pytest.raises(ValueError):
+        document.edit(-1, 0, "x")
+
+    assert document.text == "next friday"
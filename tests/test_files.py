@@ -0,0 +1,72 @@
+import datetime
+
+import pytest
+
+from dateparse import DateParser, iter_dates, parse_file
+from dateparse import files as files_module
+
+base_date = datetime.date(2022, 12, 17)
+
+filler = "nothing to see on this line\n" * 400
+
+file_text = (
+    "call me next friday\n"
+    + filler
+    + "or two weeks after a month before February 1\n\n"
+    + filler
+    + "  \\today is escaped, and été ends on the 3rd sunday in august\n"
+    + filler
+    + "a\n week before march 11, then today"
+)
+
+
+def _write(tmp_path, text: str):
+    path = tmp_path / "dates.txt"
+    path.write_bytes(text.encode("utf-8"))
+    return path
+
+
+@pytest.mark.parametrize("min_gap", [1, 4096])
+@pytest.mark.parametrize("chunk_size", [3, 1000])
+def test_same_as_iter_dates(tmp_path, monkeypatch, min_gap, chunk_size):
+    # small gaps split the file at every line without a date
+    monkeypatch.setattr(files_module, "_MIN_GAP", min_gap)
+    monkeypatch.setattr(files_module, "_SEARCH_WINDOW", 100)
+    path = _write(tmp_path, file_text)
+
+    results = list(parse_file(base_date, path, chunk_size=chunk_size))
+
+    assert [result[:4] for result in results] == list(iter_dates(base_date, file_text))
+
+    data = file_text.encode("utf-8")
+    for result in results:
+        assert data[result.byte_start : result.byte_end].decode("utf-8") == (
+            file_text[result.start : result.end]
+        )
+
+
+def test_named_days(tmp_path):
+    text = "nothing yet\n" * 500 + "two days after Fête\nthen payday 2024\n"
+    path = _write(tmp_path, text)
+    parser = DateParser(
+        base_date=base_date, named_days={"fête": "july 14", "payday": "may 4"}
+    )
+
+    results = list(parser.parse_file(path))
+
+    assert [result[:4] for result in results] == parser.get_all(text)
+    assert [(result.byte_start, result.byte_end) for result in results] == [
+        (len(text[: result.start].encode()), len(text[: result.end].encode()))
+        for result in results
+    ]
+
+
+def test_empty_and_dateless_files(tmp_path):
+    assert list(parse_file(base_date, _write(tmp_path, ""))) == []
+    assert list(parse_file(base_date, _write(tmp_path, filler * 10))) == []
+
+
+def test_closing_early(tmp_path):
+    results = parse_file(base_date, _write(tmp_path, file_text))
+    assert next(results).content == " next friday"
+    results.close()
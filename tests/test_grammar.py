@@ -0,0 +1,157 @@
+import datetime
+
+import pytest
+
+from dateparse import parse_all, parsefunctions, regex_utils
+from dateparse.grammar import (
+    ANCHOR,
+    DELTA,
+    Grammar,
+    Rule,
+    default_grammar,
+    expand_template,
+)
+from dateparse.parseutil import basic_parse
+from dateparse.scanner import PatternScanner
+from dateparse.streaming import iter_dates
+
+# a wednesday
+BASE_DATE = datetime.date(2023, 10, 18)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("end of the month", datetime.date(2023, 10, 31)),
+        ("the end of next month", datetime.date(2023, 11, 30)),
+        ("start of next year", datetime.date(2024, 1, 1)),
+        ("beginning of next week", datetime.date(2023, 10, 23)),
+        ("end of the week", datetime.date(2023, 10, 22)),
+        ("end of february", datetime.date(2024, 2, 29)),
+        ("start of october", datetime.date(2024, 10, 1)),
+        ("the third monday in august", datetime.date(2024, 8, 19)),
+        ("the last friday of the month", datetime.date(2023, 10, 27)),
+        ("first monday of next month", datetime.date(2023, 11, 6)),
+        ("the 2nd tuesday", datetime.date(2023, 11, 14)),
+        ("the fifth tuesday", datetime.date(2023, 10, 31)),
+        ("the fifth friday", datetime.date(2023, 12, 29)),
+        ("a week before the end of the month", datetime.date(2023, 10, 24)),
+    ],
+)
+def test_new_forms(text, expected):
+    assert basic_parse(BASE_DATE, text).date == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "last friday",
+        "tues, last friday",
+        "tues last friday",
+        "the last friday",
+        "meet friday  last friday",
+    ],
+)
+def test_last_weekday_is_relative_without_a_month(text):
+    # a tuesday
+    base_date = datetime.date(2023, 1, 17)
+    result = parse_all(base_date, text)[-1]
+
+    assert result.content.strip() == "last friday"
+    assert result.date == datetime.date(2023, 1, 20)
+
+
+def test_last_weekday_of_a_month():
+    base_date = datetime.date(2023, 1, 17)
+
+    assert basic_parse(base_date, "the last friday of next month").date == (
+        datetime.date(2023, 2, 24)
+    )
+    assert basic_parse(base_date, "last tues in feb").date == (
+        datetime.date(2023, 2, 28)
+    )
+
+
+def test_specified_periods_may_be_past():
+    assert basic_parse(BASE_DATE, "start of this week", allow_past=True).date == (
+        datetime.date(2023, 10, 16)
+    )
+    assert basic_parse(BASE_DATE, "end of last month", allow_past=True).date == (
+        datetime.date(2023, 9, 30)
+    )
+
+
+def test_new_forms_stream_like_parse_all():
+    text = "due the end of the month,\nthen the 3rd friday of next month and tomorrow"
+    expected = parse_all(BASE_DATE, text)
+
+    assert [result.date for result in expected] == [
+        datetime.date(2023, 10, 31),
+        datetime.date(2023, 11, 17),
+        datetime.date(2023, 10, 19),
+    ]
+    assert list(iter_dates(BASE_DATE, [text[:30], text[30:]])) == expected
+
+
+def test_default_rules_keep_their_order():
+    names = [rule.name for rule in default_grammar.rules]
+    kinds = [rule.kind for rule in default_grammar.rules]
+
+    assert names[0] == "month_day"
+    assert kinds == sorted(kinds, key=[ANCHOR, DELTA].index)
+    assert list(default_grammar.patterns.values()) == [
+        *default_grammar.absolute_index,
+        *default_grammar.relative_index,
+    ]
+
+
+def test_extend_adds_one_pattern():
+    def parse_payday(date_tuple, base_date):
+        return datetime.date(base_date.year, base_date.month, 25)
+
+    grammar = default_grammar.extend(
+        [Rule("payday", ANCHOR, r"(?P<payday>payday)", parse_payday)]
+    )
+    payday_pattern = grammar.patterns["payday"]
+
+    # the default grammar is unchanged, and shares its compiled patterns
+    assert "payday" not in default_grammar.patterns
+    assert grammar.patterns["month_day"] is default_grammar.patterns["month_day"]
+    assert grammar.absolute_index[payday_pattern] is parse_payday
+
+    scanner = PatternScanner(list(grammar.patterns.values()))
+    matches = scanner.finditer("on payday, march 11")
+    assert [match.re for match in matches] == [
+        payday_pattern,
+        default_grammar.patterns["month_day"],
+    ]
+
+
+def test_former_names_forward_to_the_default_grammar():
+    assert regex_utils.MDY_DATE_PATTERN is default_grammar.patterns["month_day"]
+    assert regex_utils.QUICK_DAYS_PATTERN is default_grammar.patterns["quick_day"]
+    assert (
+        parsefunctions.absolute_functions_index[regex_utils.MDY_DATE_PATTERN]
+        is default_grammar.absolute_index[regex_utils.MDY_DATE_PATTERN]
+    )
+    assert parsefunctions.relative_patterns == [
+        regex_utils.RELATIVE_INTERVAL_PATTERN
+    ]
+
+    with pytest.raises(AttributeError):
+        regex_utils.NO_SUCH_PATTERN
+    with pytest.raises(AttributeError):
+        parsefunctions.no_such_index
+
+
+def test_invalid_rules():
+    with pytest.raises(ValueError):
+        default_grammar.extend(
+            [Rule("quick_day", ANCHOR, "(?P<x>x)", lambda *args: None)]
+        )
+
+    with pytest.raises(ValueError):
+        Grammar([Rule("bad", "modifier", "(?P<x>x)", lambda *args: None)])
+
+    with pytest.raises(KeyError):
+        expand_template("${no_such_word}")
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import dateparse
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run_python(code: str) -> str:
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout.strip()
+
+
+def test_import_loads_no_submodules():
+    loaded = _run_python(
+        "import sys, dateparse;"
+        " print(sorted(name for name in sys.modules"
+        " if name.startswith('dateparse.') or name in ('numpy', 'typing')))"
+    )
+    assert loaded == "[]"
+
+
+def test_patterns_compile_on_first_use():
+    output = _run_python(
+        "import datetime;"
+        " from dateparse import parse_all;"
+        " from dateparse.grammar import default_grammar;"
+        " print(default_grammar._compiled is None);"
+        " parse_all(datetime.date(2023, 1, 17), 'next friday');"
+        " print(default_grammar._compiled is None)"
+    )
+    assert output.split() == ["True", "False"]
+
+
+def test_public_names():
+    for name in dateparse.__all__:
+        assert getattr(dateparse, name) is not None
+        assert name in dir(dateparse)
+
+    assert dateparse.parseutil.parse_all is dateparse.parse_all
+
+    with pytest.raises(AttributeError):
+        dateparse.no_such_name
@@ -0,0 +1,157 @@
+import datetime
+
+import pytest
+
+from dateparse import DateParser, NamedDayMatcher, ParserConfig
+from dateparse.parseutil import parse_all, sub_named_days
+
+
+def test_longest_match_wins():
+    matcher = NamedDayMatcher(
+        {"new year": "january 1", "new years eve": "december 31", "eve": "never"}
+    )
+
+    assert matcher.sub("New Years Eve or new year") == "december 31 or january 1"
+
+
+def test_substituted_values_are_not_rescanned():
+    matcher = NamedDayMatcher({"xmas": "christmas", "christmas": "december 25"})
+
+    assert matcher.sub("xmas and christmas") == "christmas and december 25"
+
+
+def test_many_named_days():
+    named_days = {f"launch {index}": f"march {index % 28 + 1}" for index in range(5000)}
+    matcher = NamedDayMatcher(named_days)
+
+    substituted = matcher.sub("after launch 42 and launch 4999")
+    assert substituted == "after march 15 and march 16"
+    assert sub_named_days(named_days, "launch 28") == "march 1"
+    assert NamedDayMatcher({}).sub("Nothing Here") == "nothing here"
+
+
+def test_parsers_do_not_share_named_days():
+    base_date = datetime.date(2022, 12, 17)
+    parser = DateParser(base_date=base_date, named_days={"my birthday": "june 11"})
+    other_parser = DateParser(base_date=base_date)
+
+    assert "my birthday" in parser.named_days
+    assert "my birthday" not in other_parser.named_days
+    assert other_parser.get_first("my birthday") is None
+
+    other_parser.named_days = {**other_parser.named_days, "payday": "march 31"}
+    assert other_parser.get_first_date("payday") == datetime.date(2023, 3, 31)
+    assert other_parser.get_first_date("christmas") == datetime.date(2022, 12, 25)
+
+
+def test_named_days_keep_original_offsets():
+    base_date = datetime.date(2023, 1, 1)
+    parser = DateParser(base_date=base_date, named_days={"my birthday": "june 11"})
+
+    text = "Dinner four days after Halloween 2024, then a month before My Birthday"
+    results = parser.get_all(text)
+
+    assert [result.date for result in results] == [
+        datetime.date(2024, 11, 4),
+        datetime.date(2023, 5, 11),
+    ]
+    for result in results:
+        assert text[result.start : result.end].strip() == result.content.strip()
+
+    assert results[0].content.strip() == "four days after Halloween 2024"
+    assert results[1].content == "a month before My Birthday"
+
+
+def test_named_days_standing_for_intervals():
+    base_date = datetime.date(2023, 1, 1)
+    named_days = {"a fortnight after": "two weeks after"}
+
+    results = DateParser(base_date, named_days).get_all("a fortnight after christmas")
+
+    assert [result.date for result in results] == [datetime.date(2024, 1, 8)]
+    assert results[0].start == 0
+
+
+def test_named_day_values_must_be_single_expressions():
+    with pytest.raises(ValueError):
+        parse_all(datetime.date(2023, 1, 1), "party", named_days={"party": "no date"})
+
+
+def test_named_day_values_are_checked_up_front():
+    named_days = {"payday": "the 15th"}
+
+    with pytest.raises(ValueError, match="payday"):
+        DateParser(named_days=named_days)
+    with pytest.raises(ValueError, match="payday"):
+        ParserConfig.from_settings(named_days=named_days)
+
+    parser = DateParser(base_date=datetime.date(2023, 1, 17))
+    with pytest.raises(ValueError, match="payday"):
+        parser.named_days = named_days
+
+    # a matcher made directly is not checked, and its bad names are not dates
+    assert parse_all(
+        datetime.date(2023, 1, 17),
+        "see you tomorrow, payday",
+        named_days=NamedDayMatcher(named_days),
+    ) == [parser.get_first("see you tomorrow")]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (
+            "halloween and christmas 2024",
+            [
+                (datetime.date(2023, 10, 31), "halloween"),
+                (datetime.date(2024, 12, 25), "christmas 2024"),
+            ],
+        ),
+        (
+            "party on my birthday and christmas 2024",
+            [
+                (datetime.date(2023, 6, 11), "my birthday"),
+                (datetime.date(2024, 12, 25), "christmas 2024"),
+            ],
+        ),
+        (
+            "christmas party for 2024 budget",
+            [(datetime.date(2023, 12, 25), "christmas")],
+        ),
+        ("christmas, 2024", [(datetime.date(2024, 12, 25), "christmas, 2024")]),
+    ],
+)
+def test_named_day_year_follows_the_name(text, expected):
+    parser = DateParser(
+        base_date=datetime.date(2023, 1, 17), named_days={"my birthday": "june 11"}
+    )
+
+    results = parser.get_all(text)
+
+    assert [(result.date, result.content.strip()) for result in results] == expected
+
+
+def test_no_year_for_named_days_with_intervals():
+    parser = DateParser(
+        base_date=datetime.date(2023, 1, 17),
+        named_days={"my birthday": "a month before june 11"},
+    )
+
+    results = parser.get_all("my birthday 2025")
+
+    assert [result.date for result in results] == [datetime.date(2023, 5, 11)]
+    assert results[0].content.strip() == "my birthday"
+
+
+def test_other_patterns_do_not_match_across_named_days():
+    base_date = datetime.date(2023, 1, 17)
+    parser = DateParser(base_date=base_date, named_days={"launch 42": "march 15"})
+
+    assert parser.get_all_dates("launch 42 10-20-2023") == [
+        datetime.date(2023, 3, 15),
+        datetime.date(2023, 10, 20),
+    ]
+    assert parser.get_all_dates("halloween 2024 january 1") == [
+        datetime.date(2024, 10, 31),
+        datetime.date(2024, 1, 1),
+    ]
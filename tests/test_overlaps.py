@@ -0,0 +1,58 @@
+import random
+
+from dateparse.parsefunctions import DateTuple
+from dateparse.parseutil import _ordered_matches, _remove_subgroups
+
+
+def make_tuple(start: int, end: int, label: str = "") -> DateTuple:
+    return DateTuple(None, {}, label or f"{start}-{end}", start, end)
+
+
+def spans(date_tuples):
+    return [(tup.start, tup.end) for tup in date_tuples]
+
+
+def test_nested_matches_are_removed():
+    matches = [
+        make_tuple(0, 30),
+        make_tuple(2, 20),
+        make_tuple(4, 10),
+        make_tuple(5, 8),
+        make_tuple(25, 40),
+        make_tuple(41, 45),
+    ]
+    random.Random(0).shuffle(matches)
+
+    resolved = _remove_subgroups(_ordered_matches(matches))
+    assert spans(resolved) == [(0, 30), (25, 40), (41, 45)]
+
+
+def test_identical_spans_keep_first_pattern():
+    first, second = make_tuple(3, 9, "first"), make_tuple(3, 9, "second")
+
+    resolved = _remove_subgroups(_ordered_matches([first, second]))
+    assert [tup.content for tup in resolved] == ["first"]
+
+
+def test_matches_against_brute_force():
+    rng = random.Random(1)
+
+    for _ in range(200):
+        matches = []
+        for _ in range(rng.randint(0, 30)):
+            start = rng.randint(0, 50)
+            matches.append(make_tuple(start, start + rng.randint(1, 15)))
+
+        expected = {
+            (tup.start, tup.end)
+            for tup in matches
+            if not any(
+                other.start <= tup.start
+                and tup.end <= other.end
+                and (other.start, other.end) != (tup.start, tup.end)
+                for other in matches
+            )
+        }
+
+        resolved = spans(_remove_subgroups(_ordered_matches(matches)))
+        assert resolved == sorted(expected)
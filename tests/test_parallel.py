@@ -0,0 +1,90 @@
+import datetime
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dateparse import DateParser, LRUCache, NamedDayMatcher, ParserConfig
+from dateparse.parallel import ParallelDateParser
+
+base_date = datetime.date(2022, 12, 17)
+
+texts = [
+    "a week from tues",
+    "nothing here",
+    "two days after my birthday",
+    "today and tomorrow",
+] * 25
+
+
+def test_parallel_matches_serial():
+    named_days = {"my birthday": "june 11"}
+    serial = DateParser(base_date=base_date, named_days=named_days)
+    expected = serial.get_all_many(texts)
+
+    with ParallelDateParser(
+        base_date=base_date, named_days=named_days, processes=2, chunksize=7
+    ) as parser:
+        assert parser.get_all_many(texts) == expected
+
+        unordered = dict(parser.imap(texts, ordered=False))
+        assert [unordered[index] for index in range(len(texts))] == expected
+
+
+def test_config_is_an_immutable_value():
+    named_days = {"my birthday": "june 11"}
+    config = ParserConfig.from_settings(base_date, named_days)
+    parser = DateParser(base_date=base_date, named_days=named_days)
+
+    assert parser.config == config
+    assert hash(parser.config) == hash(config)
+    assert pickle.loads(pickle.dumps(config)) == config
+    with pytest.raises(TypeError):
+        config.named_days.named_days["payday"] = "march 31"
+    with pytest.raises(TypeError):
+        DateParser.default_named_days["payday"] = "march 31"
+
+    # changing a parser's settings replaces its config, rather than changing it
+    parser.base_date = datetime.date(2023, 1, 1)
+    parser.named_days = {"payday": "march 31"}
+    assert config == ParserConfig.from_settings(base_date, named_days)
+    assert parser.config == ParserConfig(
+        datetime.date(2023, 1, 1), NamedDayMatcher({"payday": "march 31"})
+    )
+
+    with pytest.raises(ValueError):
+        DateParser(base_date=base_date, config=config)
+
+
+def test_threads_share_a_config():
+    march = ParserConfig.from_settings(base_date, {"payday": "march 31"})
+    april = march.with_named_days({"payday": "april 30"})
+    shared_parser = DateParser(config=march, cache=LRUCache(maxsize=8))
+
+    def parse(index: int) -> tuple[bool, datetime.date | None]:
+        if index % 10 == 0:
+            # change the shared parser's config while other threads use it
+            shared_parser.config = april if index % 20 else march
+            return True, None
+
+        parser = shared_parser if index % 2 else DateParser(config=march)
+        return parser is shared_parser, parser.get_first_date("two days after payday")
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(parse, range(2000)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert {date for shared, date in results if not shared} == {
+        datetime.date(2023, 4, 2)
+    }
+    assert {date for shared, date in results if shared} <= {
+        None,
+        datetime.date(2023, 4, 2),
+        datetime.date(2023, 5, 2),
+    }
+    assert march.named_days.named_days["payday"] == "march 31"
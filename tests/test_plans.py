@@ -0,0 +1,77 @@
+import datetime
+import json
+import pickle
+
+import pytest
+
+from dateparse import DateParser, ParsePlan, parse_all
+
+BASE_DATE = datetime.date(2023, 1, 17)
+
+TEXT = (
+    "four days after halloween 2024, then a week from thursday,"
+    " the third monday in may and two days after payday"
+)
+NAMED_DAYS = {"payday": "march 31", "my birthday": "june 11"}
+
+
+@pytest.fixture
+def plan():
+    return DateParser(named_days=NAMED_DAYS).compile(TEXT)
+
+
+@pytest.mark.parametrize(
+    "base_date",
+    [BASE_DATE, datetime.date(2024, 2, 29), datetime.date(2024, 12, 31)],
+)
+@pytest.mark.parametrize("from_right", [False, True])
+def test_same_as_parse_all(plan, base_date, from_right):
+    named_days = DateParser(named_days=NAMED_DAYS).named_days
+    expected = parse_all(base_date, TEXT, from_right=from_right, named_days=named_days)
+
+    assert plan.get_all(base_date, from_right=from_right) == expected
+    assert plan.get_first(base_date) == expected[-1 if from_right else 0]
+    assert plan.get_last(base_date) == expected[0 if from_right else -1]
+
+
+def test_only_used_named_days_are_kept(plan):
+    assert plan.named_days == {"halloween": "october 31", "payday": "march 31"}
+
+
+def test_pickle(plan):
+    loaded = pickle.loads(pickle.dumps(plan))
+
+    assert loaded == plan
+    assert loaded.get_all(BASE_DATE) == plan.get_all(BASE_DATE)
+
+
+def test_json(plan):
+    loaded = ParsePlan.from_dict(json.loads(json.dumps(plan.to_dict())))
+
+    assert loaded == plan
+    assert loaded.get_all(BASE_DATE) == plan.get_all(BASE_DATE)
+
+
+def test_no_expressions():
+    plan = ParsePlan.from_text("nothing here")
+
+    assert plan.get_first(BASE_DATE) is None
+    assert plan.get_all(BASE_DATE) is None
+    assert ParsePlan.from_dict(plan.to_dict()) == plan
+
+
+def test_invalid_plans(plan):
+    data = plan.to_dict()
+
+    with pytest.raises(ValueError):
+        ParsePlan.from_dict({**data, "format": 0})
+
+    data["expressions"][0][-1]["rule"] = "no_such_rule"
+    with pytest.raises(ValueError):
+        ParsePlan.from_dict(data)
+
+    # the anchor comes last
+    data = plan.to_dict()
+    data["expressions"][0].reverse()
+    with pytest.raises(ValueError):
+        ParsePlan.from_dict(data)
@@ -0,0 +1,79 @@
+import datetime
+
+import pytest
+
+from dateparse import DateParser, PrefilterCounters, parse_all, prefilter_counters
+from dateparse.grammar import ANCHOR, Rule, default_grammar
+from dateparse.parseutil import parse_many
+from dateparse.prefilter import Prefilter
+
+BASE_DATE = datetime.date(2023, 1, 17)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "the build is broken again",
+        "",
+        "ok, thanks!",
+    ],
+)
+def test_rejects_texts_without_date_vocabulary(text):
+    assert not default_grammar.prefilter.might_match(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "see you Friday",
+        "on the 3rd",
+        "REPORT DUE TOMORROW",
+        "by the end of next month",
+        "weekly sync",
+        "in two weeks",
+    ],
+)
+def test_keeps_texts_that_might_have_dates(text):
+    assert default_grammar.prefilter.might_match(text)
+
+
+def test_counters():
+    counters = PrefilterCounters()
+    prefilter = Prefilter(default_grammar.prefilter.pattern, counters)
+
+    prefilter.might_match("nothing here")
+    prefilter.might_match("nor here")
+    prefilter.might_match("but friday")
+
+    stats = counters.stats()
+    assert (stats.checked, stats.rejected) == (3, 2)
+    assert stats.rejection_rate == pytest.approx(2 / 3)
+
+    counters.reset()
+    assert counters.stats() == (0, 0)
+    assert counters.stats().rejection_rate == 0.0
+
+
+def test_parse_functions_count_rejections():
+    prefilter_counters.reset()
+
+    texts = ["hey, can you look at this", "the build is broken", "lunch on monday?"]
+    results = parse_many(BASE_DATE, texts)
+
+    assert results[:2] == [None, None]
+    assert results[2][0].date == datetime.date(2023, 1, 23)
+    assert prefilter_counters.stats() == (3, 2)
+
+
+def test_named_days_are_triggers():
+    parser = DateParser(base_date=BASE_DATE, named_days={"launch": "march 3"})
+
+    assert parser.get_first("after the launch").date == datetime.date(2023, 3, 3)
+    assert parse_all(BASE_DATE, "after the launch") is None
+
+
+def test_rules_without_triggers_disable_the_prefilter():
+    grammar = default_grammar.extend(
+        [Rule("noon", ANCHOR, "(?P<noon>noon)", lambda *args: BASE_DATE)]
+    )
+    assert grammar.prefilter is None
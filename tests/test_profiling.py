@@ -0,0 +1,112 @@
+import asyncio
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from dateparse import AsyncDateParser, LRUCache, ParseStats, parse_all
+from dateparse.profiling import STAGES, _active_stats
+
+BASE_DATE = datetime.date(2023, 1, 17)
+TEXT = "a week from thursday and four days before march 11"
+
+
+def _parse(text: str, cache: LRUCache, group_cache: LRUCache):
+    return parse_all(BASE_DATE, text, cache=cache, group_cache=group_cache)
+
+
+def test_stages_matches_and_caches():
+    cache, group_cache = LRUCache(maxsize=8), LRUCache(maxsize=8)
+
+    with ParseStats() as stats:
+        _parse(TEXT, cache, group_cache)
+        _parse(TEXT, cache, group_cache)
+        _parse("no dates at all", cache, group_cache)
+
+    recorded = stats.as_dict()
+
+    assert recorded["texts"] == 2
+    assert recorded["characters"] == len(TEXT) + len("no dates at all")
+    assert recorded["longest_text"] == len(TEXT)
+    assert set(recorded["stages"]) == set(STAGES)
+    # the text without dates is ruled out before it is scanned
+    assert recorded["stages"]["prefilter"]["calls"] == 2
+    assert recorded["stages"]["extract"]["calls"] == 1
+    assert recorded["stages"]["resolve"]["calls"] == 2
+    assert all(stage["seconds"] >= 0 for stage in recorded["stages"].values())
+    assert sum(recorded["matches"].values()) >= 3
+    assert recorded["caches"] == {
+        "expression": {"hits": 0, "misses": 2},
+        "result": {"hits": 1, "misses": 2},
+    }
+
+    stats.reset()
+    assert stats.as_dict()["texts"] == 0
+
+
+def test_only_active_in_with_block():
+    stats = ParseStats()
+    _parse(TEXT, LRUCache(maxsize=8), LRUCache(maxsize=8))
+
+    with stats:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # other threads have their own context
+            executor.submit(_parse, TEXT, LRUCache(maxsize=8), LRUCache(maxsize=8))
+
+    assert stats.as_dict()["texts"] == 0
+    assert _active_stats.get() is None
+
+
+def test_entered_from_many_threads_at_once():
+    stats = ParseStats()
+    entered = threading.Barrier(4)
+
+    def parse_in_block():
+        with stats:
+            # every thread is inside the block before any leaves it
+            entered.wait()
+            _parse(TEXT, LRUCache(maxsize=8), LRUCache(maxsize=8))
+            entered.wait()
+        return _active_stats.get()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        active_after = list(executor.map(lambda _: parse_in_block(), range(4)))
+
+    assert active_after == [None] * 4
+    assert stats.as_dict()["texts"] == 4
+
+
+def test_nested_blocks():
+    outer, inner = ParseStats(), ParseStats()
+
+    with outer:
+        with inner:
+            _parse(TEXT, LRUCache(maxsize=8), LRUCache(maxsize=8))
+            with inner:
+                assert _active_stats.get() is inner
+        assert _active_stats.get() is outer
+        _parse(TEXT, LRUCache(maxsize=8), LRUCache(maxsize=8))
+
+    assert _active_stats.get() is None
+    assert inner.as_dict()["texts"] == 1
+    assert outer.as_dict()["texts"] == 1
+
+
+def test_async_executor_threads_are_recorded():
+    long_text = "filler text " * 100 + TEXT
+
+    async def parse():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            async_parser = AsyncDateParser(
+                base_date=BASE_DATE,
+                cache=LRUCache(maxsize=8),
+                group_cache=LRUCache(maxsize=8),
+                executor=executor,
+            )
+            with ParseStats() as stats:
+                await async_parser.get_all(long_text)
+        return stats
+
+    recorded = asyncio.run(parse()).as_dict()
+
+    assert recorded["texts"] == 1
+    assert recorded["caches"]["result"] == {"hits": 0, "misses": 1}
@@ -0,0 +1,65 @@
+import datetime
+
+from dateparse.grammar import default_grammar
+from dateparse.parsefunctions import DateTuple
+from dateparse.parseutil import parse_all, parse_many, preprocess_input
+
+BASE_DATE = datetime.date(2023, 1, 17)
+
+
+def test_record_from_match():
+    match = default_grammar.patterns["month_day"].match(" march 11, 2024 ")
+    record = DateTuple.from_match(match)
+
+    assert (record.start, record.end) == (0, 16)
+    assert record.pattern is default_grammar.patterns["month_day"]
+    assert record.content == " march 11, 2024 "
+    assert record.fields == {"month": "mar", "day": "11", "year": ", 2024"}
+    assert not hasattr(record, "__dict__")
+
+
+def test_record_from_values():
+    record = DateTuple(None, {"day": "1"}, "the 1st", 3, 10)
+
+    assert (record.fields, record.content, record.start, record.end) == (
+        {"day": "1"},
+        "the 1st",
+        3,
+        10,
+    )
+    assert "content='the 1st'" in repr(record)
+
+
+def test_records_work_as_tuples():
+    pattern = default_grammar.patterns["month_day"]
+    record = DateTuple.from_match(pattern.match(" march 11 "))
+    fields = {"month": "mar", "day": "11", "year": None}
+    values = (pattern, fields, " march 11 ", 0, 10)
+
+    pattern_, fields_, content, start, end, date = record
+    assert (pattern_, fields_, content, start, end, date) == (*values, None)
+    assert record[2] == " march 11 " and record[-3:] == (0, 10, None)
+    assert len(record) == 6
+    assert record == DateTuple(*values) == (*values, None)
+    assert record != DateTuple(*values, date=BASE_DATE)
+
+    replaced = record._replace(date=BASE_DATE)
+    assert replaced == (*values, BASE_DATE)
+    assert record.date is None
+    assert replaced._asdict()["content"] == " march 11 "
+
+
+def test_expression_deltas_are_lists():
+    expression, without_deltas = preprocess_input("a week after march 11, and today")
+    assert isinstance(expression.deltas, list) and len(expression.deltas) == 1
+    assert without_deltas.deltas == []
+
+
+def test_results_share_equal_values():
+    results = parse_all(BASE_DATE, "tomorrow, or tomorrow")
+    assert results[0] == results[1]._replace(start=0, end=8)
+    assert results[0].date is results[1].date
+    assert results[0].content is results[1].content
+
+    batch = parse_many(BASE_DATE, ["see you tomorrow", "tomorrow then"])
+    assert batch[0][0].date is batch[1][0].date
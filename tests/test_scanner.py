@@ -0,0 +1,75 @@
+import itertools as it
+import re
+
+import pytest
+
+from dateparse.grammar import absolute_patterns, relative_patterns
+from dateparse.scanner import PatternScanner
+
+all_patterns = absolute_patterns + relative_patterns
+
+scanner_inputs = [
+    "a week from tues",
+    "two weeks after a month before February 1",
+    "in ten days or next wednesday, then 10-20-2023",
+    "the day after tomorrow and three days after a year from today",
+    "nothing to see here",
+    "Until the End of the MONTH, or the Third Monday in August",
+    "caf\u00e9 on Friday \u212a, next Wednesday",
+    "",
+]
+
+
+def _match_key(match):
+    return (match.start(), match.end(), match.re.pattern, match.groupdict())
+
+
+@pytest.mark.parametrize("text", scanner_inputs)
+def test_scanner_matches_finditer(text):
+    scanner = PatternScanner(all_patterns)
+
+    expected = it.chain.from_iterable(
+        pattern.finditer(text) for pattern in all_patterns
+    )
+
+    assert sorted(map(_match_key, scanner.finditer(text))) == sorted(
+        map(_match_key, expected)
+    )
+
+
+def test_pattern_case_is_kept():
+    case_sensitive = re.compile(r"(?P<tag>TODO|todo)")
+    scanner = PatternScanner([case_sensitive])
+
+    assert [match.group() for match in scanner.finditer("TODO todo ToDo")] == [
+        "TODO",
+        "todo",
+    ]
+
+    uppercase = re.compile(r"(?P<day>Friday)", re.IGNORECASE)
+    scanner = PatternScanner([uppercase])
+
+    assert len(list(scanner.finditer("friday FRIDAY"))) == 2
+
+
+def test_adjacent_ranges_continue_the_scan():
+    text = " ".join(scanner_inputs)
+    scanner = PatternScanner(all_patterns)
+    whole_scan = list(map(_match_key, scanner.finditer(text)))
+
+    # split the text wherever no match spans the split
+    cuts = [
+        position
+        for position in range(0, len(text), 5)
+        if not any(start < position < end for start, end, *_ in whole_scan)
+    ]
+    cuts.append(len(text))
+
+    next_start = [0] * len(all_patterns)
+    matches = it.chain.from_iterable(
+        scanner.finditer(text, pos, endpos, next_start)
+        for pos, endpos in zip(cuts, cuts[1:])
+    )
+
+    assert len(cuts) > 10
+    assert list(map(_match_key, matches)) == whole_scan
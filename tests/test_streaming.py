@@ -0,0 +1,53 @@
+import datetime
+import io
+
+import pytest
+
+from dateparse import iter_dates, parse_all
+
+base_date = datetime.date(2022, 12, 17)
+
+stream_text = (
+    "call me next friday\n"
+    "or two weeks after a month before February 1\n\n"
+    "  nothing on this line\n"
+    "a\n week before march 11, then today"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 16, 1000])
+def test_stream_matches_parse_all(chunk_size):
+    expected = parse_all(base_date, stream_text)
+
+    assert list(iter_dates(base_date, stream_text, chunk_size=chunk_size)) == expected
+    assert (
+        list(iter_dates(base_date, io.StringIO(stream_text), chunk_size=chunk_size))
+        == expected
+    )
+
+
+def test_expression_split_between_chunks():
+    chunks = [
+        "the meeting is a wee",
+        "k after tomor",
+        "row\nand the party is on sat",
+        "urday",
+    ]
+    results = list(iter_dates(base_date, chunks))
+
+    assert [result.date for result in results] == [
+        datetime.date(2022, 12, 25),
+        datetime.date(2022, 12, 24),
+    ]
+    assert results == parse_all(base_date, "".join(chunks))
+
+
+def test_stream_is_lazy():
+    def chunks():
+        yield "today\n"
+        yield "tomorrow\n"
+        yield "next friday\n"
+        raise AssertionError("read past the third expression")
+
+    results = iter_dates(base_date, chunks())
+    assert next(results).date == base_date